@@ -0,0 +1,73 @@
+# ==============================================================
+# Служебные эндпоинты: версии артефактов, перезагрузка и откат
+# Доступ — по заголовку X-Admin-Token (ADMIN_TOKEN в окружении)
+# ==============================================================
+
+import hmac
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from pydantic import BaseModel
+
+from app.config import ADMIN_TOKEN
+from app.recommend import registry
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+class ReloadRequest(BaseModel):
+    """Необязательные новые пути артефактов; по умолчанию — текущие."""
+    model: Optional[str] = None
+    preprocessor: Optional[str] = None
+    fixtures: Optional[str] = None
+    # Модель первого этапа (используется при SHORTLIST_K > 0)
+    shortlist: Optional[str] = None
+    wait: bool = False
+
+
+def _check_token(token: Optional[str]) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Админ-эндпоинты выключены (не задан ADMIN_TOKEN).")
+    if not token or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Неверный токен администратора.")
+
+
+@router.get("/admin/artifacts")
+def artifacts_status(x_admin_token: Optional[str] = Header(None)):
+    """Активная и предыдущая версии, состояние перезагрузки, последняя ошибка"""
+    _check_token(x_admin_token)
+    return registry.status()
+
+
+@router.post("/admin/reload", status_code=202)
+def reload_artifacts(request: ReloadRequest = ReloadRequest(), x_admin_token: Optional[str] = Header(None)):
+    """
+    Загружает новую версию в фоне, проверяет пробным подбором и атомарно
+    переключает. С wait=true отвечает после переключения (или ошибки).
+    """
+    _check_token(x_admin_token)
+    paths = {k: v for k, v in request.model_dump(exclude={"wait"}).items() if v}
+
+    if request.wait:
+        try:
+            bundle = registry.reload(paths)
+        except Exception as e:
+            raise HTTPException(status_code=409, detail=f"Новая версия не принята: {e}")
+        return {"status": "active", "version": bundle.version}
+
+    if not registry.reload_in_background(paths):
+        raise HTTPException(status_code=409, detail="Перезагрузка уже выполняется.")
+    return {"status": "loading", "version": registry.version}
+
+
+@router.post("/admin/rollback")
+def rollback_artifacts(x_admin_token: Optional[str] = Header(None)):
+    """Возврат к предыдущей версии артефактов"""
+    _check_token(x_admin_token)
+    try:
+        bundle = registry.rollback()
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"status": "active", "version": bundle.version}
@@ -5,9 +5,15 @@
 # ==============================================================
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
 from app.spacy_parser import parse_room_params_spacy
-from app.recommend import recommend_luminaires as recommend
+from app.recommend import recommend_luminaires as recommend, registry
 from app.advisor import generate_advice
+from app.cache import result_cache, canonical_room
+from app.executor import ExecutorError, parse_pool, score_pool
+from app.metrics import stage, count_error
+from app.responses import dumps
+from app import request_log
 from pydantic import BaseModel
 import logging
 
@@ -28,51 +34,85 @@ async def chat(request: ChatRequest):
     Принимает текстовое сообщение пользователя,
     извлекает параметры помещения через SpaCy,
     вызывает recommend() и формирует совет через generate_advice().
+    Разбор и подбор выполняются в пулах потоков (app.executor),
+    цикл событий не блокируется.
     """
-    try:
-        logger.info("────────────────────────────────────────────")
-        logger.info(f"📩 Получено сообщение от пользователя: {message}")
-
-        # 🔹 1. Извлечение параметров помещения (SpaCy)
-        parsed = parse_room_params_spacy(message)
-        logger.info(f"🧩 Извлечённые параметры: {parsed}")
-
-        # Проверка на корректность данных
-        if not parsed or not isinstance(parsed, dict):
-            raise ValueError("Парсер не вернул корректных данных.")
-
-        # 🔹 2. Получение рекомендаций от ML-модуля
-        rec_result = recommend(parsed)
-        if not rec_result:
-            logger.warning("⚠️ Рекомендации не найдены.")
-            return {
-                "user_query": message,
-                "parsed_params": parsed,
-                "summary": "Рекомендации не найдены. Попробуйте уточнить запрос.",
-                "advice": "Проверьте, указаны ли площадь, высота и бюджет."
-            }
-
-        recommendations = rec_result.get("recommendations", [])
-        summary = rec_result.get("summary", "")
-
-        logger.info(f"✅ Успешно получены {len(recommendations)} рекомендаций.")
-
-        # 🔹 3. Генерация текстового совета
-        advice_text = generate_advice(recommendations, parsed)
-        logger.info("💬 Советник успешно сгенерировал объяснение.")
-
-        # 🔹 4. Формирование ответа
-        result = {
+    with registry.lease() as bundle:
+        try:
+            request_log.annotate(message=message)
+
+            # 🔹 1. Извлечение параметров помещения (SpaCy) — в пуле разбора
+            parsed = await parse_pool.run(_parse, message)
+            request_log.annotate(parsed=parsed)
+
+            # Проверка на корректность данных
+            if not parsed or not isinstance(parsed, dict):
+                raise ValueError("Парсер не вернул корректных данных.")
+
+            # Кэш по каноническим параметрам: попадание пропускает модель и советник,
+            # кодируются только текст запроса и разбор
+            room = canonical_room(parsed)
+            cache_key = result_cache.make_key("chat", room, bundle.version)
+            cached = result_cache.get(cache_key)
+            request_log.annotate(cache="hit" if cached is not None else "miss")
+            if cached is not None:
+                return _chat_response(message, parsed, cached)
+
+            # 🔹 2–4. Рекомендации, совет и ответ — в пуле инференса
+            return await score_pool.run(bundle.call, _answer, message, parsed, room, cache_key, bundle)
+
+        except ExecutorError:
+            raise
+        except Exception as e:
+            count_error("chat")
+            request_log.exception(logger, "❌ Ошибка в обработке чата:")
+            raise HTTPException(status_code=500, detail=f"Ошибка советника: {e}")
+
+
+def _parse(message: str) -> dict:
+    with stage("parse"):
+        return parse_room_params_spacy(message)
+
+
+def _chat_response(message: str, parsed: dict, fragment: bytes) -> Response:
+    """
+    Ответ /chat из готового фрагмента: запрос и разбор свои у каждого сообщения,
+    закодированные summary, advice и artifact_version — общие для помещения (кэш).
+    """
+    with stage("serialize"):
+        head = dumps({"user_query": message, "parsed_params": parsed})
+    return Response(content=head[:-1] + b"," + fragment + b"}", media_type="application/json")
+
+
+def _answer(message: str, parsed: dict, room: dict, cache_key: tuple, bundle):
+    """Подбор, совет и запись в кэш для разобранного сообщения."""
+    # 🔹 2. Получение рекомендаций от ML-модуля
+    rec_result = recommend(room, bundle=bundle)
+    if not rec_result:
+        request_log.annotate(recommendations=0)
+        return {
             "user_query": message,
             "parsed_params": parsed,
-            "summary": summary,
-            "advice": advice_text
+            "summary": "Рекомендации не найдены. Попробуйте уточнить запрос.",
+            "advice": "Проверьте, указаны ли площадь, высота и бюджет.",
+            "artifact_version": bundle.version
         }
 
-        logger.info("🎯 Ответ успешно сформирован и возвращён пользователю.")
-        logger.info("────────────────────────────────────────────")
-        return result
+    recommendations = rec_result.get("recommendations", [])
+    summary = rec_result.get("summary", "")
+
+    request_log.annotate(recommendations=len(recommendations))
+
+    # 🔹 3. Генерация текстового совета
+    with stage("advice"):
+        advice_text = generate_advice(recommendations, room)
+
+    # 🔹 4. Формирование ответа: общая для помещения часть кодируется один раз —
+    # в ответ и в кэш (без фигурных скобок, см. _chat_response)
+    with stage("serialize"):
+        fragment = dumps({"summary": summary, "advice": advice_text, "artifact_version": bundle.version})[1:-1]
+
+    if "error" not in rec_result:
+        result_cache.put(cache_key, fragment)
 
-    except Exception as e:
-        logger.exception("❌ Ошибка в обработке чата:")
-        raise HTTPException(status_code=500, detail=f"Ошибка советника: {e}")
+    return _chat_response(message, parsed, fragment)
@@ -0,0 +1,207 @@
+"""
+Статика фронтенда: сборка с хэшами в именах и заранее сжатыми копиями.
+
+Сборка (python -m app.assets) пишет frontend/dist/:
+    - assets/<имя>.<хэш>.<расширение> — хэш содержимого в имени, ссылки
+      в index.html, script.js и style.css переписаны на новые имена;
+      такой файл не меняется никогда, кэшируется браузером навсегда;
+    - рядом .gz (и .br, если установлен brotli) — если сжатие даёт выигрыш
+      (текст — да, PNG — обычно нет);
+    - исходные имена — для старых ссылок, без долгого кэша;
+    - index.html со ссылками на хэшированные файлы и assets-manifest.json.
+
+PrecompressedStaticFiles отдаёт готовую сжатую копию по Accept-Encoding
+(сжатия на запрос нет) и Cache-Control: immutable для хэшированных имён.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+import stat
+import sys
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.staticfiles import StaticFiles
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "frontend")
+DIST_DIR = os.path.join(FRONTEND_DIR, "dist")
+MANIFEST = "assets-manifest.json"
+
+# Файлы, в которых переписываются ссылки на ./assets/...
+TEXT_EXTENSIONS = {".html", ".css", ".js", ".json", ".svg", ".txt"}
+# Сжатая копия сохраняется, только если она меньше исходника хотя бы на столько
+MIN_SAVING = 0.1
+# Порядок предпочтения кодировок при отдаче
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+# -------------------------
+# Сборка
+# -------------------------
+def _hashed_name(name: str, data: bytes) -> str:
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:10]}{ext}"
+
+
+def _rewrite(text: str, names: dict) -> str:
+    """Ссылки assets/<имя> -> assets/<хэшированное имя>."""
+    for name in sorted(names, key=len, reverse=True):
+        text = re.sub(rf"(?<=assets/){re.escape(name)}(?=[\"'\s)?#`]|$)", names[name], text)
+    return text
+
+
+def _compressors() -> list:
+    compressors = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    try:
+        import brotli
+        compressors.insert(0, (".br", lambda data: brotli.compress(data, quality=11)))
+    except ImportError:
+        print("⚠️ brotli не установлен — только gzip-копии.")
+    return compressors
+
+
+def _write(path: str, data: bytes, compressors: list) -> dict:
+    """Файл и его сжатые копии; размеры записанных вариантов."""
+    with open(path, "wb") as f:
+        f.write(data)
+    sizes = {"": len(data)}
+    for ext, compress in compressors:
+        packed = compress(data)
+        if len(packed) <= len(data) * (1 - MIN_SAVING):
+            with open(path + ext, "wb") as f:
+                f.write(packed)
+            sizes[ext] = len(packed)
+    return sizes
+
+
+def build(src_dir: str = FRONTEND_DIR, out_dir: str = DIST_DIR) -> dict:
+    """
+    Собирает статику в out_dir.
+    Returns:
+        dict: исходное имя -> хэшированное имя
+    """
+    assets_src = os.path.join(src_dir, "assets")
+    assets_out = os.path.join(out_dir, "assets")
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(assets_out)
+    compressors = _compressors()
+
+    names = sorted(n for n in os.listdir(assets_src) if os.path.isfile(os.path.join(assets_src, n)))
+    contents = {}
+    for name in names:
+        with open(os.path.join(assets_src, name), "rb") as f:
+            contents[name] = f.read()
+
+    # Сначала файлы без ссылок (картинки), затем текст — его хэш считается
+    # уже с переписанными ссылками
+    text = [n for n in names if os.path.splitext(n)[1] in TEXT_EXTENSIONS]
+    hashed = {n: _hashed_name(n, contents[n]) for n in names if n not in text}
+    for name in text:
+        contents[name] = _rewrite(contents[name].decode("utf-8"), hashed).encode("utf-8")
+        hashed[name] = _hashed_name(name, contents[name])
+
+    total = {"": 0, ".gz": 0, ".br": 0}
+    for name in names:
+        sizes = _write(os.path.join(assets_out, hashed[name]), contents[name], compressors)
+        for ext, size in sizes.items():
+            total[ext] += size
+        # Исходное имя — для старых ссылок (короткий кэш)
+        _write(os.path.join(assets_out, name), contents[name], compressors)
+
+    with open(os.path.join(src_dir, "index.html"), encoding="utf-8") as f:
+        index = _rewrite(f.read(), hashed)
+    _write(os.path.join(out_dir, "index.html"), index.encode("utf-8"), compressors)
+
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(hashed, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ Статика собрана: {out_dir} — {len(names)} файлов, {total[''] / 1024:.0f} КБ; "
+          f"сжатые копии: gzip {total['.gz'] / 1024:.0f} КБ, brotli {total['.br'] / 1024:.0f} КБ")
+    return hashed
+
+
+def load_manifest(out_dir: str = DIST_DIR) -> dict:
+    """Манифест сборки или {} (сборки нет)."""
+    try:
+        with open(os.path.join(out_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def is_stale(src_dir: str = FRONTEND_DIR, out_dir: str = DIST_DIR) -> bool:
+    """Исходники фронтенда новее сборки."""
+    built = os.stat(os.path.join(out_dir, MANIFEST)).st_mtime
+    sources = [os.path.join(src_dir, "index.html")] + [
+        e.path for e in os.scandir(os.path.join(src_dir, "assets")) if e.is_file()
+    ]
+    return any(os.stat(path).st_mtime > built for path in sources)
+
+
+# -------------------------
+# Отдача
+# -------------------------
+def accepted_encodings(header: str) -> set:
+    """Кодировки из Accept-Encoding с q > 0."""
+    result = set()
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if token:
+            result.add(token.strip().lower())
+    return result
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles, отдающий <файл>.br / <файл>.gz по Accept-Encoding.
+    immutable — имена файлов с хэшем содержимого (долгий кэш), остальным — no-cache.
+    """
+
+    def __init__(self, *args, immutable: set = frozenset(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.immutable = frozenset(immutable)
+
+    async def get_response(self, path: str, scope):
+        response = None
+        if scope["method"] in ("GET", "HEAD"):
+            accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+            for encoding, ext in ENCODINGS:
+                if encoding not in accepted and "*" not in accepted:
+                    continue
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + ext)
+                if stat_result and stat.S_ISREG(stat_result.st_mode):
+                    response = self.file_response(full_path, stat_result, scope)
+                    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                    if media_type.startswith("text/") or media_type.endswith("javascript"):
+                        media_type += "; charset=utf-8"
+                    response.headers["content-type"] = media_type
+                    response.headers["content-encoding"] = encoding
+                    break
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["vary"] = "Accept-Encoding"
+        if response.status_code in (200, 304):
+            name = os.path.basename(path)
+            response.headers["cache-control"] = IMMUTABLE if name in self.immutable else REVALIDATE
+        return response
+
+
+if __name__ == "__main__":
+    src = sys.argv[1] if len(sys.argv) > 1 else FRONTEND_DIR
+    build(src, os.path.join(src, "dist"))
@@ -0,0 +1,129 @@
+"""
+Кэш готовых ответов /recommend и /chat в памяти процесса (LRU + TTL).
+
+Ключ — канонизированные параметры помещения (опционально квантованные:
+площадь, высота, бюджет округляются до шага) плюс версия артефактов
+модели, препроцессора и каталога. При смене версии старые записи
+перестают совпадать и вытесняются по LRU/TTL. Значение — уже
+закодированное тело ответа (bytes): попадание отдаётся без повторной
+сериализации, объём ограничен числом записей и суммой длин тел.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from app.config import (
+    CACHE_ENABLED, CACHE_MAX_ENTRIES, CACHE_TTL_S, CACHE_MAX_BYTES,
+    CACHE_AREA_STEP, CACHE_HEIGHT_STEP, CACHE_BUDGET_STEP,
+)
+
+
+def _quantize(value, step):
+    if not step:
+        return value
+    return round(round(value / step) * step, 6)
+
+
+def canonical_room(data: dict) -> dict:
+    """
+    Каноническая форма параметров помещения: единое имя бюджета, float/int
+    без «шума» и округление до шагов CACHE_*_STEP. По этой форме и считается
+    ответ, чтобы закэшированный результат совпадал с пересчитанным.
+    """
+    room = dict(data)
+    if "budget_rub" in room:
+        room["бюджет_₽"] = room.pop("budget_rub")
+
+    room["тип_помещения"] = str(room["тип_помещения"]).strip().lower()
+    room["площадь_м2"] = _quantize(round(float(room["площадь_м2"]), 6), CACHE_AREA_STEP)
+    room["высота_м"] = _quantize(round(float(room["высота_м"]), 6), CACHE_HEIGHT_STEP)
+    room["бюджет_₽"] = int(_quantize(int(room["бюджет_₽"]), CACHE_BUDGET_STEP))
+    for col in ("целевой_люкс", "cri_min", "cct_предпочтение_k", "ip_min"):
+        room[col] = int(room[col])
+    return room
+
+
+class ResultCache:
+    """Потокобезопасный LRU-кэш с TTL, лимитом записей и байт и счётчиками."""
+
+    def __init__(self, max_entries: int, ttl_s: float, max_bytes: int, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._data = OrderedDict()  # key -> (expires_at, size, body)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    @staticmethod
+    def make_key(namespace: str, room: dict, version: str) -> tuple:
+        """Ключ: пространство имён, версия артефактов, параметры помещения и выдачи."""
+        return (namespace, version) + tuple(sorted(
+            (k, v) for k, v in room.items() if v is not None
+        ))
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, body: bytes) -> None:
+        """Запись готового тела ответа; размер — его длина в байтах."""
+        if not self.enabled:
+            return
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + self.ttl_s, size, body)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def _remove(self, key) -> None:
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+result_cache = ResultCache(CACHE_MAX_ENTRIES, CACHE_TTL_S, CACHE_MAX_BYTES, enabled=CACHE_ENABLED)
@@ -0,0 +1,75 @@
+"""
+Каталог светильников в памяти в виде непрерывных массивов NumPy.
+
+Числовые характеристики хранятся отдельными массивами, категориальные —
+целочисленными кодами со словарём интернированных строк. Для расчётов
+на запрос каждый поток получает свой набор заранее выделенных буферов.
+"""
+
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Непрерывные величины: float64, чтобы инженерные расчёты и округления
+# совпадали с прежним выводом до копейки
+FLOAT_COLUMNS = ["мощность_вт", "световой_поток_лм", "эффективность_лм_вт", "цена_₽"]
+INT_COLUMNS = ["угол_раскрытия_град", "cri", "cct_k", "ip", "срок_службы_ч"]
+CATEGORICAL_COLUMNS = ["id_продукта", "тип_светильника", "бренд", "серия"]
+
+
+class Workspace:
+    """Буферы на один поток: переиспользуются между запросами."""
+
+    def __init__(self, n_fixtures: int, n_features: int, dtype=np.float64):
+        self.X = np.empty((n_fixtures, n_features), dtype=dtype)
+        self.ratio = np.empty(n_fixtures, dtype=np.float64)
+        self.counts = np.empty(n_fixtures, dtype=np.int64)
+
+
+class FixtureCatalog:
+    """Массивы характеристик светильников с кодированными категориями."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.size = len(df)
+        self.columns = {}
+        self.codes = {}
+        self.vocab = {}
+
+        for col in FLOAT_COLUMNS:
+            self.columns[col] = np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+        for col in INT_COLUMNS:
+            self.columns[col] = np.ascontiguousarray(df[col].to_numpy(dtype=np.int32))
+        for col in CATEGORICAL_COLUMNS:
+            codes, uniques = pd.factorize(df[col].astype(str))
+            self.codes[col] = codes.astype(np.int32)
+            self.vocab[col] = np.array([sys.intern(v) for v in uniques], dtype=object)
+
+        self._local = threading.local()
+
+    @classmethod
+    def from_csv(cls, path: str) -> "FixtureCatalog":
+        return cls(pd.read_csv(path))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, col: str) -> np.ndarray:
+        return self.columns[col]
+
+    def labels(self, col: str, idx: np.ndarray) -> list:
+        """Строковые значения категориального столбца для строк idx."""
+        return self.vocab[col][self.codes[col][idx]].tolist()
+
+    def workspace(self, n_features: int, dtype=np.float64, n_rows: int = None) -> Workspace:
+        """
+        Буферы текущего потока (создаются при первом обращении).
+        n_rows — строк в буфере (по умолчанию весь каталог; при потоковом скоринге — одна часть).
+        """
+        n_rows = self.size if n_rows is None else n_rows
+        ws = getattr(self._local, "workspace", None)
+        if ws is None or ws.X.shape != (n_rows, n_features) or ws.X.dtype != dtype:
+            ws = Workspace(n_rows, n_features, dtype)
+            self._local.workspace = ws
+        return ws
@@ -0,0 +1,104 @@
+# ==============================================================
+# Витрина каталога: GET /catalog — фильтры, фасеты, постраничная выдача
+# Индекс (app.catalog_index) строится на версию артефактов из каталога
+# движка подбора — витрина и рекомендации читают одни и те же данные.
+# Ответ помечается ETag версии каталога; при совпадении If-None-Match — 304.
+# ==============================================================
+
+import threading
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from app import request_log
+from app.catalog_index import CatalogIndex
+from app.config import CATALOG_PAGE_SIZE, CATALOG_PAGE_MAX
+from app.metrics import stage
+from app.recommend import registry
+from app.responses import FastJSONResponse
+
+router = APIRouter()
+
+_lock = threading.Lock()
+_index = (None, None)  # (версия артефактов, CatalogIndex)
+
+
+def catalog_index() -> CatalogIndex:
+    """Индекс каталога текущей версии артефактов (строится при первом обращении)."""
+    global _index
+    bundle = registry.current()
+    version, index = _index
+    if version == bundle.version:
+        return index
+    with _lock:
+        version, index = _index
+        if version != bundle.version:
+            index = CatalogIndex(bundle.engine.catalog)
+            _index = (bundle.version, index)
+        return index
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def _cursor(value: Optional[str]) -> int:
+    if not value:
+        return -1
+    try:
+        return int(value, 16)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Некорректный курсор: {value!r}")
+
+
+@router.get("/catalog")
+def get_catalog(
+    request: Request,
+    type: Optional[List[str]] = Query(None, description="тип светильника (можно несколько)"),
+    brand: Optional[List[str]] = Query(None, description="бренд (можно несколько)"),
+    power_min: Optional[float] = None,
+    power_max: Optional[float] = None,
+    flux_min: Optional[float] = None,
+    flux_max: Optional[float] = None,
+    price_min: Optional[float] = None,
+    price_max: Optional[float] = None,
+    cri_min: Optional[int] = None,
+    cct_min: Optional[int] = None,
+    cct_max: Optional[int] = None,
+    ip_min: Optional[int] = None,
+    limit: int = Query(CATALOG_PAGE_SIZE, ge=0, le=CATALOG_PAGE_MAX),
+    cursor: Optional[str] = Query(None, description="next_cursor предыдущей страницы"),
+    facets: bool = True,
+):
+    """
+    Страница каталога по фильтрам, всего найдено, курсор следующей страницы
+    и фасеты (тип, бренд, IP) с учётом остальных фильтров.
+    """
+    index = catalog_index()
+    etag = f'"{index.version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        request_log.annotate(not_modified=True)
+        return Response(status_code=304, headers=headers)
+
+    filters = {
+        "type": type, "brand": brand,
+        "power_min": power_min, "power_max": power_max,
+        "flux_min": flux_min, "flux_max": flux_max,
+        "price_min": price_min, "price_max": price_max,
+        "cri_min": cri_min, "cct_min": cct_min, "cct_max": cct_max, "ip_min": ip_min,
+    }
+    with stage("catalog"):
+        masks = index.masks(filters)
+        rows, total, next_cursor = index.page(masks, limit, _cursor(cursor))
+        content = {
+            "items": index.items(rows),
+            "total": total,
+            "next_cursor": None if next_cursor is None else format(next_cursor, "x"),
+            "facets": index.facets(masks) if facets else None,
+            "catalog_version": index.version,
+        }
+    request_log.annotate(total=total, returned=int(rows.size))
+    return FastJSONResponse(content, headers=headers)
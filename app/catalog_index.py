@@ -0,0 +1,187 @@
+"""
+Индекс каталога для витрины (GET /catalog): фильтры, фасеты, курсор.
+
+Строится один раз на версию каталога поверх массивов FixtureCatalog.
+Множества строк — упакованные битовые карты (np.packbits, как в
+app.prefilter) в словах uint64: пересечение фильтров — побитовое AND
+по 1/8 байта на строку, мощность множества — popcount.
+    - тип, бренд и IP: карта на каждое значение; IP_min — карты «не ниже порога»;
+    - диапазоны мощности, потока, цены и пороги CRI / CCT — сравнение
+      непрерывных массивов, одна упаковка на все диапазоны запроса;
+    - фасеты по типу, бренду и IP — popcount пересечения карт значений
+      с отбором; для фасета не учитывается фильтр по нему самому, чтобы
+      в списке оставались и остальные значения;
+    - курсор — позиция последней выданной строки в порядке каталога;
+      распаковываются только байты карты, покрывающие страницу.
+Версия (ETag) — хэш содержимого массивов: не зависит от пути и времени
+изменения файла и совпадает у всех экземпляров сервиса с одним каталогом.
+"""
+
+import hashlib
+
+import numpy as np
+
+from app.catalog import FixtureCatalog, FLOAT_COLUMNS, INT_COLUMNS, CATEGORICAL_COLUMNS
+
+# Единиц в каждом байте: np.bitwise_count (NumPy 2) или таблица
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(bits: np.ndarray) -> np.ndarray:
+    """Единиц в каждом элементе (без NumPy 2 — в каждом байте; для сумм это одно и то же)."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits)
+    return _POPCOUNT[bits.view(np.uint8)]
+
+
+def pack(mask: np.ndarray) -> np.ndarray:
+    """Булева маска -> карта в словах uint64 (байты np.packbits, дополненные нулями до слова)."""
+    packed = np.packbits(mask)
+    padded = np.zeros(-(-packed.size // 8) * 8, dtype=np.uint8)
+    padded[:packed.size] = packed
+    return padded.view(np.uint64)
+
+
+# Фильтр по диапазону: параметр запроса -> (столбец, сравнение)
+RANGE_FILTERS = {
+    "power_min": ("мощность_вт", np.greater_equal),
+    "power_max": ("мощность_вт", np.less_equal),
+    "flux_min": ("световой_поток_лм", np.greater_equal),
+    "flux_max": ("световой_поток_лм", np.less_equal),
+    "price_min": ("цена_₽", np.greater_equal),
+    "price_max": ("цена_₽", np.less_equal),
+    "cri_min": ("cri", np.greater_equal),
+    "cct_min": ("cct_k", np.greater_equal),
+    "cct_max": ("cct_k", np.less_equal),
+}
+# Фильтр по значениям: параметр запроса -> категориальный столбец
+VALUE_FILTERS = {"type": "тип_светильника", "brand": "бренд"}
+FACETS = ("тип_светильника", "бренд", "ip")
+
+
+class CatalogIndex:
+    """Битовые карты значений, фасеты и страницы по каталогу FixtureCatalog."""
+
+    def __init__(self, catalog: FixtureCatalog):
+        self.catalog = catalog
+        self.size = len(catalog)
+
+        # Фасетные столбцы: подписи значений и карта строк на каждое значение
+        self._labels, self._bits = {}, {}
+        for col in VALUE_FILTERS.values():
+            codes = catalog.codes[col]
+            self._labels[col] = catalog.vocab[col]
+            self._bits[col] = self._value_bitmaps(codes, len(catalog.vocab[col]))
+        self._ip_values, ip_codes = np.unique(catalog["ip"], return_inverse=True)
+        self._labels["ip"] = [str(v) for v in self._ip_values.tolist()]
+        self._bits["ip"] = self._value_bitmaps(ip_codes, len(self._ip_values))
+        # «IP не ниже значения k» — объединение карт значений от k и выше
+        self._ip_at_least = np.bitwise_or.accumulate(self._bits["ip"][::-1], axis=0)[::-1]
+
+        self._codes = {col: {name: code for code, name in enumerate(self._labels[col])} for col in VALUE_FILTERS.values()}
+        self._full_facets = {col: self._counts(col, None) for col in FACETS}
+
+        h = hashlib.sha1()
+        for col in CATEGORICAL_COLUMNS:
+            h.update(catalog.codes[col].tobytes())
+            h.update("\x00".join(catalog.vocab[col]).encode())
+        for col in FLOAT_COLUMNS + INT_COLUMNS:
+            h.update(catalog[col].tobytes())
+        self.version = h.hexdigest()[:16]
+
+    @staticmethod
+    def _value_bitmaps(codes: np.ndarray, n_values: int) -> np.ndarray:
+        return np.stack([pack(codes == code) for code in range(n_values)])
+
+    # -------------------------
+    # Фильтры
+    # -------------------------
+    def _values_bits(self, col: str, values: list) -> np.ndarray:
+        codes = [self._codes[col][v] for v in values if v in self._codes[col]]
+        if not codes:
+            return np.zeros_like(self._bits[col][0])
+        if len(codes) == 1:
+            return self._bits[col][codes[0]]
+        return np.bitwise_or.reduce(self._bits[col][codes], axis=0)
+
+    def masks(self, filters: dict) -> dict:
+        """Карта на каждый заданный фильтр: тип, бренд, IP и «диапазоны» (остальные числовые вместе)."""
+        masks = {}
+        for param, col in VALUE_FILTERS.items():
+            if filters.get(param):
+                masks[col] = self._values_bits(col, filters[param])
+
+        if filters.get("ip_min") is not None:
+            k = np.searchsorted(self._ip_values, filters["ip_min"], side="left")
+            masks["ip"] = self._ip_at_least[k] if k < len(self._ip_values) else np.zeros_like(self._bits["ip"][0])
+
+        ranges = None
+        for param, (col, compare) in RANGE_FILTERS.items():
+            value = filters.get(param)
+            if value is None:
+                continue
+            hit = compare(self.catalog[col], value)
+            ranges = hit if ranges is None else np.logical_and(ranges, hit, out=ranges)
+        if ranges is not None:
+            masks["ranges"] = pack(ranges)
+        return masks
+
+    @staticmethod
+    def _combine(masks: dict, skip: str = None):
+        selected = [m for name, m in masks.items() if name != skip]
+        if not selected:
+            return None
+        if len(selected) == 1:
+            return selected[0]
+        return np.bitwise_and.reduce(selected)
+
+    # -------------------------
+    # Фасеты
+    # -------------------------
+    def _counts(self, col: str, bits) -> dict:
+        values = self._bits[col] if bits is None else self._bits[col] & bits
+        counts = popcount(values).sum(axis=1, dtype=np.uint32)
+        return {str(label): int(n) for label, n in zip(self._labels[col], counts) if n}
+
+    def facets(self, masks: dict) -> dict:
+        """Количество строк по значениям типа, бренда и IP с учётом остальных фильтров."""
+        result = {}
+        for col in FACETS:
+            bits = self._combine(masks, skip=col)
+            result[col] = self._full_facets[col] if bits is None else self._counts(col, bits)
+        return result
+
+    # -------------------------
+    # Страница
+    # -------------------------
+    def page(self, masks: dict, limit: int, cursor: int = -1) -> tuple:
+        """
+        Строки каталога после позиции cursor (не больше limit), всего отобрано
+        и курсор следующей страницы (None — страница последняя).
+        """
+        bits = self._combine(masks)
+        start = max(cursor + 1, 0)
+        if bits is None:
+            rows = np.arange(start, min(start + limit, self.size))
+            return rows, self.size, int(rows[-1]) if rows.size and start + limit < self.size else None
+
+        total = int(popcount(bits).sum(dtype=np.int64))
+        # Байты карты начиная с курсора; строки до курсора в первом байте обнулены
+        data = bits.view(np.uint8)[start // 8:].copy()
+        if data.size:
+            data[0] &= 0xFF >> (start % 8)
+        cumulative = np.cumsum(popcount(data), dtype=np.int64)
+        after = int(cumulative[-1]) if data.size else 0
+        # Распаковываются только байты до limit-й строки
+        end = int(np.searchsorted(cumulative, limit)) + 1
+        rows = np.flatnonzero(np.unpackbits(data[:end]))[:limit] + start // 8 * 8
+        return rows, total, int(rows[-1]) if rows.size and after > limit else None
+
+    def items(self, rows: np.ndarray) -> list:
+        """Записи витрины для строк rows."""
+        columns = {}
+        for col in CATEGORICAL_COLUMNS:
+            columns[col] = self.catalog.labels(col, rows)
+        for col in FLOAT_COLUMNS + INT_COLUMNS:
+            columns[col] = self.catalog[col][rows].tolist()
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
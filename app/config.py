@@ -2,7 +2,91 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 
-MODEL_PATH = os.getenv("MODEL_PATH", "ml/best_model.pkl")
+# Манифест экспорта модели (app.predictors); путь к .pkl — прежний формат
+MODEL_PATH = os.getenv("MODEL_PATH", "ml/best_model.json")
 PREPROCESSOR_PATH = os.getenv("PREPROCESSOR_PATH", "ml/preprocessor.pkl")
 FIXTURES_PATH = os.getenv("FIXTURES_PATH", "data/fixtures.csv")
 TOP_N = int(os.getenv("TOP_N", 3))
+
+# Пакетный подбор: помещений на один вызов transform/predict и максимум на запрос
+BATCH_CHUNK_ROOMS = int(os.getenv("BATCH_CHUNK_ROOMS", 100))
+BATCH_MAX_ROOMS = int(os.getenv("BATCH_MAX_ROOMS", 1000))
+
+# Размер выдачи: по умолчанию TOP_N, по запросу — не больше TOP_N_MAX
+TOP_N_MAX = int(os.getenv("TOP_N_MAX", 100))
+# Витрина каталога (GET /catalog): записей на страницу по умолчанию и максимум
+CATALOG_PAGE_SIZE = int(os.getenv("CATALOG_PAGE_SIZE", 24))
+CATALOG_PAGE_MAX = int(os.getenv("CATALOG_PAGE_MAX", 200))
+# Сколько последних помещений хранят оценки каталога (листание без пересчёта)
+SCORE_CACHE_SIZE = int(os.getenv("SCORE_CACHE_SIZE", 32))
+
+# Предфильтр каталога до скоринга: off | soft | strict (по умолчанию off — весь каталог, как раньше)
+PREFILTER_MODE = os.getenv("PREFILTER_MODE", "off")
+PREFILTER_CCT_TOLERANCE_K = int(os.getenv("PREFILTER_CCT_TOLERANCE_K", 1500))
+PREFILTER_BUDGET_FACTOR = float(os.getenv("PREFILTER_BUDGET_FACTOR", 3.0))
+# Мягкий режим ослабляет ограничения, пока кандидатов меньше этого числа
+PREFILTER_MIN_CANDIDATES = int(os.getenv("PREFILTER_MIN_CANDIDATES", 20))
+
+# Кэш ответов /recommend и /chat (LRU + TTL)
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") not in ("0", "false", "False")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 2048))
+CACHE_TTL_S = float(os.getenv("CACHE_TTL_S", 600))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", 32 * 1024 * 1024))
+# Шаги квантования ключа (0 — без квантования)
+CACHE_AREA_STEP = float(os.getenv("CACHE_AREA_STEP", 0))
+CACHE_HEIGHT_STEP = float(os.getenv("CACHE_HEIGHT_STEP", 0))
+CACHE_BUDGET_STEP = int(os.getenv("CACHE_BUDGET_STEP", 0))
+
+# Горячая замена артефактов: период опроса файлов, с (0 — только через /admin/reload)
+ARTIFACT_WATCH_INTERVAL_S = float(os.getenv("ARTIFACT_WATCH_INTERVAL_S", 0))
+# Токен для /admin/* (заголовок X-Admin-Token); пустой — админ-эндпоинты выключены
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+# Старт: артефакты и SpaCy грузятся в фоне, готовность — GET /ready.
+# 1 — не принимать запросы, пока загрузка и прогрев не завершены
+STARTUP_BLOCKING = os.getenv("STARTUP_BLOCKING", "0") in ("1", "true", "True")
+
+# Чат-парсер (SpaCy): модель, пачки nlp.pipe для parse_many, кэш лемм по форме слова
+SPACY_MODEL = os.getenv("SPACY_MODEL", "ru_core_news_sm")
+NLP_BATCH_SIZE = int(os.getenv("NLP_BATCH_SIZE", 64))
+NLP_PROCESSES = int(os.getenv("NLP_PROCESSES", 1))
+LEMMA_CACHE_SIZE = int(os.getenv("LEMMA_CACHE_SIZE", 20000))
+
+# Пулы выполнения (app.executor): потоки, глубина очереди (сверх неё — 503) и таймаут ответа (504)
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", 4))
+INFERENCE_QUEUE_DEPTH = int(os.getenv("INFERENCE_QUEUE_DEPTH", 32))
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", 2))
+PARSE_QUEUE_DEPTH = int(os.getenv("PARSE_QUEUE_DEPTH", 32))
+REQUEST_TIMEOUT_S = float(os.getenv("REQUEST_TIMEOUT_S", 10))
+
+# Многопроцессный скоринг (app.parallel): число процессов (0 — в текущем процессе),
+# от скольких строк каталога включается и способ запуска процессов
+SCORING_PROCESSES = int(os.getenv("SCORING_PROCESSES", 0))
+SCORING_PARALLEL_MIN_ROWS = int(os.getenv("SCORING_PARALLEL_MIN_ROWS", 50_000))
+SCORING_START_METHOD = os.getenv("SCORING_START_METHOD", "spawn")
+
+# Потоковый скоринг: кандидаты оцениваются частями по столько строк с текущим
+# top-N, буферы потока — на одну часть, а не на весь каталог (0 — одним куском)
+SCORING_CHUNK_ROWS = int(os.getenv("SCORING_CHUNK_ROWS", 65_536))
+
+# Двухэтапное ранжирование (app.shortlist): линейная модель (экспорт Ridge/Lasso)
+# по всем кандидатам, полная — только по SHORTLIST_K лучшим (0 — выключено)
+SHORTLIST_MODEL_PATH = os.getenv("SHORTLIST_MODEL_PATH", "ml/shortlist_model.json")
+SHORTLIST_K = int(os.getenv("SHORTLIST_K", 0))
+
+# Сжатие ответов API gzip (статика — заранее сжатыми копиями, python -m app.assets):
+# от скольки байт тела и уровень сжатия
+GZIP_ENABLED = os.getenv("GZIP_ENABLED", "1") not in ("0", "false", "False")
+GZIP_MIN_SIZE = int(os.getenv("GZIP_MIN_SIZE", 1024))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 6))
+# Кодировщик JSON-ответов (app.responses): auto | orjson | pydantic | json
+JSON_ENCODER = os.getenv("JSON_ENCODER", "auto")
+
+# Метрики этапов и запросов для GET /metrics (формат Prometheus)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") not in ("0", "false", "False")
+
+# Журнал запросов (app.request_log): уровень, доля успешных запросов в логе
+# (ошибки — всегда) и размер очереди записей до фонового потока
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", 1.0))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", 10_000))
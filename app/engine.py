@@ -0,0 +1,469 @@
+"""
+Движок подбора светильников поверх массивного каталога.
+
+Держит модель, каталог (FixtureCatalog), сборщик признаков (FeatureAssembler)
+и индекс ограничений (ConstraintIndex). На запрос: предфильтр сужает каталог
+до кандидатов, количество светильников и вход модели считаются в буферах
+потока, инженерные показатели и записи ответа — только для выбранных top-N строк.
+Большие наборы кандидатов оцениваются частями с текущим top-N (chunk_rows):
+память на запрос задаёт размер части, а не каталога.
+Двухэтапный режим (shortlist): дешёвая линейная модель отбирает
+shortlist_k кандидатов, полной моделью оцениваются только они.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from app.catalog import FixtureCatalog
+from app.features import FeatureAssembler, ROOM_COLUMNS
+from app.metrics import stage, observe_candidates, count_scored
+from app.prefilter import ConstraintIndex, RELAX_ORDER, STAGES
+
+# Коэффициент использования света
+η = 0.6
+
+LEVEL_LABELS = np.array(["норма", "пересвет", "недосвет"], dtype=object)
+
+# Порядок при равных оценках: по позиции в каталоге, дешевле, эффективнее
+TIE_BREAKS = ("index", "price", "efficiency")
+
+
+def fixture_counts(flux: np.ndarray, data: dict, rows: np.ndarray, out: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+    """ceil(E·S / (Φ·η)), не меньше 1 — индивидуально по потоку каждого светильника."""
+    np.take(flux, rows, out=ratio)
+    np.multiply(ratio, η, out=ratio)
+    np.divide(data["целевой_люкс"] * data["площадь_м2"], ratio, out=ratio)
+    np.ceil(ratio, out=ratio)
+    np.maximum(ratio, 1, out=ratio)
+    np.copyto(out, ratio, casting="unsafe")
+    return out
+
+
+def keep_top(rows: np.ndarray, scores: np.ndarray, counts: np.ndarray, need: int) -> tuple:
+    """
+    Строки с оценкой не ниже need-й лучшей; равные на границе сохраняются,
+    поэтому select с любым tie_break выбирает то же, что и по полному набору.
+    """
+    if scores.size <= need:
+        return rows, scores, counts
+    kth = np.partition(scores, scores.size - need)[scores.size - need]
+    mask = scores >= kth
+    return rows[mask], scores[mask], counts[mask]
+
+
+class RecommenderEngine:
+    """Скоринг каталога моделью и формирование записей рекомендаций."""
+
+    def __init__(
+        self,
+        model,
+        preprocessor,
+        fixtures_df: pd.DataFrame,
+        score_cache_size: int = 0,
+        room_to_fixtures: dict = None,
+        cct_tolerance_k: int = 1500,
+        budget_factor: float = 3.0,
+        min_candidates: int = 20,
+        processes: int = 0,
+        parallel_min_rows: int = 50_000,
+        start_method: str = "spawn",
+        chunk_rows: int = 0,
+        shortlist_model=None,
+        shortlist_k: int = 0,
+    ):
+        self.model = model
+        self.preprocessor = preprocessor
+        self.catalog = FixtureCatalog(fixtures_df)
+        # Predictor (app.predictors) задаёт тип входа; у обычной модели — float64
+        self.features = FeatureAssembler(preprocessor, fixtures_df, getattr(model, "dtype", np.float64))
+        self.all_rows = np.arange(len(self.catalog))
+
+        # Скоринг больших наборов строк — в пуле процессов над общей памятью (app.parallel)
+        self.scorer = None
+        self.parallel_min_rows = parallel_min_rows
+        if processes > 0:
+            from app.parallel import ProcessScorer
+            self.scorer = ProcessScorer(
+                model, self.features, self.catalog["световой_поток_лм"], processes, start_method
+            )
+
+        # Потоковый скоринг: строк в одной части (0 — весь набор кандидатов сразу)
+        self.chunk_rows = chunk_rows
+
+        # Первый этап ранжирования: линейная модель, полной — только shortlist_k лучших
+        self.shortlist = None
+        self.shortlist_k = shortlist_k
+        if shortlist_model is not None and shortlist_k > 0:
+            from app.shortlist import LinearShortlist
+            self.shortlist = LinearShortlist(shortlist_model, self.features)
+
+        # Предфильтр: индекс ограничений строится один раз на каталог
+        self.constraints = ConstraintIndex(self.catalog, room_to_fixtures or {})
+        self.cct_tolerance_k = cct_tolerance_k
+        self.budget_factor = budget_factor
+        self.min_candidates = min_candidates
+
+        # Оценки последних помещений: листание страниц не пересчитывает каталог
+        self.score_cache_size = score_cache_size
+        self._score_cache = OrderedDict()
+        self._score_lock = threading.Lock()
+
+    # -------------------------
+    # Количество светильников
+    # -------------------------
+    def _counts(self, data: dict, rows: np.ndarray, out: np.ndarray, ratio: np.ndarray) -> np.ndarray:
+        return fixture_counts(self.catalog["световой_поток_лм"], data, rows, out, ratio)
+
+    # -------------------------
+    # Предфильтр
+    # -------------------------
+    def _apply(self, data: dict, stages: tuple) -> np.ndarray:
+        rows = self.constraints.rows(self.constraints.bitmap(data, stages, self.cct_tolerance_k))
+        if "budget" in stages and rows.size:
+            counts = self._counts(data, rows, np.empty(rows.size, dtype=np.int64), np.empty(rows.size))
+            cost = self.catalog["цена_₽"][rows] * counts
+            rows = rows[cost <= data["бюджет_₽"] * self.budget_factor]
+        return rows
+
+    def candidates(self, data: dict, mode: str = "off", need: int = 1) -> tuple:
+        """
+        Строки каталога, допущенные к скорингу, и отчёт предфильтра.
+
+        strict — все ограничения; soft — при нехватке кандидатов (< need)
+        ограничения снимаются по RELAX_ORDER вплоть до полного каталога.
+        """
+        rows, report, _ = self._candidates(data, mode, need)
+        return rows, report
+
+    def _candidates(self, data: dict, mode: str, need: int) -> tuple:
+        """candidates и полуинтервал (lo, hi] значений need, при которых набор строк тот же."""
+        total = len(self.catalog)
+        stages, relaxed = STAGES, []
+        lo, hi = 0, np.inf
+
+        with stage("prefilter"):
+            if mode == "off":
+                rows = self.all_rows
+            else:
+                rows = self._apply(data, stages)
+                if mode == "soft":
+                    groups = list(RELAX_ORDER)
+                    while groups and rows.size < min(need, total):
+                        group = groups.pop(0)
+                        # Меньшему need хватило бы строк до этого ослабления
+                        lo = rows.size
+                        stages = tuple(s for s in stages if s not in group)
+                        relaxed.extend(group)
+                        rows = self._apply(data, stages) if stages else self.all_rows
+                    # Большему need понадобилось бы следующее ослабление
+                    if groups and rows.size < total:
+                        hi = rows.size
+        observe_candidates(mode, rows.size)
+
+        report = {
+            "mode": mode,
+            "candidates": int(rows.size),
+            "total": total,
+            "pruning_ratio": round(1 - rows.size / total, 4) if total else 0.0,
+            "relaxed": relaxed,
+        }
+        return rows, report, (lo, hi)
+
+    def shortlisted(self, data: dict, rows: np.ndarray, need: int = 1) -> np.ndarray:
+        """
+        Первый этап: не больше max(shortlist_k, need) строк из rows по оценке
+        линейной модели (в порядке каталога); без него — rows как есть.
+        """
+        k = max(self.shortlist_k, need)
+        if self.shortlist is None or rows.size <= k:
+            return rows
+        with stage("shortlist"):
+            counts = self._counts(data, rows, np.empty(rows.size, dtype=np.int64), np.empty(rows.size))
+            rows = self.shortlist.top(rows, counts, k)
+        observe_candidates("shortlist", rows.size)
+        return rows
+
+    # -------------------------
+    # Скоринг
+    # -------------------------
+    def _workspace(self):
+        """Буферы потока: на весь каталог или на одну часть при потоковом скоринге."""
+        n_rows = min(self.chunk_rows, len(self.catalog)) if self.chunk_rows > 0 else None
+        return self.catalog.workspace(self.features.n_features, self.features.dtype, n_rows)
+
+    def score(self, data: dict, rows: np.ndarray = None) -> tuple:
+        """Оценки модели и количества для строк rows одного помещения (буферы потока)."""
+        rows = self.all_rows if rows is None else rows
+        k = rows.size
+        full = rows is self.all_rows
+        if k and self._parallel(k):
+            counts = self._counts(data, rows, np.empty(k, dtype=np.int64), np.empty(k))
+            count_scored(k)
+            # Сборка входа в процессах пула — этап predict включает её
+            with stage("predict"):
+                return self.scorer.score(data, None if full else rows), counts
+
+        ws = self._workspace()
+        step = ws.X.shape[0]
+        if k > step:
+            # Строк больше, чем в буфере части: все оценки, но вход модели — по частям
+            scores, counts = np.empty(k), np.empty(k, dtype=np.int64)
+            for start in range(0, k, step):
+                part = slice(start, start + step)
+                scores[part], counts[part] = self.score(data, rows[part])
+            return scores, counts
+
+        with stage("features"):
+            counts = self._counts(data, rows, ws.counts[:k], ws.ratio[:k])
+            if k == 0:
+                return np.empty(0), counts
+            X = self.features.fill(ws.X[:k], data, counts, ws.ratio[:k], rows=None if full else rows)
+        count_scored(k)
+        with stage("predict"):
+            return self.model.predict(X), counts
+
+    def score_top(self, data: dict, rows: np.ndarray, need: int) -> tuple:
+        """
+        Потоковый скоринг одного помещения: кандидаты частями по chunk_rows,
+        после каждой части остаётся текущий top-need (keep_top).
+        Возвращает (строки, оценки, количества) оставшихся строк в порядке каталога.
+        """
+        step = self._workspace().X.shape[0]
+        kept_rows, kept_scores, kept_counts = rows[:0], np.empty(0), np.empty(0, dtype=np.int64)
+        for start in range(0, rows.size, step):
+            part = rows[start:start + step]
+            scores, counts = self.score(data, part)
+            with stage("select"):
+                kept_rows, kept_scores, kept_counts = keep_top(
+                    np.concatenate([kept_rows, part]),
+                    np.concatenate([kept_scores, scores]),
+                    np.concatenate([kept_counts, counts]),
+                    need,
+                )
+        return kept_rows, kept_scores, kept_counts
+
+    def _parallel(self, n_rows: int) -> bool:
+        return self.scorer is not None and n_rows >= self.parallel_min_rows
+
+    def _streaming(self, n_rows: int) -> bool:
+        # Пул процессов (если включён) берёт большие наборы целиком
+        return 0 < self.chunk_rows < n_rows and not self._parallel(n_rows)
+
+    def _shortlist_range(self, n_rows: int, need: int) -> tuple:
+        """Полуинтервал (lo, hi] значений need, при которых первый этап отбирает те же строки."""
+        k = max(self.shortlist_k, need)
+        if self.shortlist is None or n_rows <= self.shortlist_k:
+            return 0, np.inf
+        if n_rows <= k:
+            return n_rows - 1, np.inf  # без отбора — при любом need не меньше числа строк
+        return (0, k) if k == self.shortlist_k else (k - 1, k)
+
+    def scored(self, data: dict, mode: str = "off", need: int = 1) -> tuple:
+        """
+        Предфильтр, первый этап и скоринг с LRU-кэшем по параметрам помещения.
+        Возвращает (строки каталога, оценки, количества, отчёт предфильтра);
+        с первым этапом — только строки короткого списка, при потоковом
+        скоринге — только строки текущего top-need.
+
+        Запись кэша хранит полуинтервал (lo, hi] значений need, для которых
+        она совпадает с пересчётом: полный скоринг без усечения годится для
+        любого need, текущий top-need — для need не больше сохранённого,
+        мягкий предфильтр и первый этап — пока отбор строк тот же. Поэтому
+        листание страниц (растущий offset + top_n) каталог не пересчитывает.
+        """
+        key = (mode,) + tuple(data[col] for col in ROOM_COLUMNS)
+        if self.score_cache_size > 0:
+            with self._score_lock:
+                cached = self._score_cache.get(key)
+                if cached is not None and cached[0] < need <= cached[1]:
+                    self._score_cache.move_to_end(key)
+                    return cached[2]
+
+        rows, report, (lo, hi) = self._candidates(data, mode, need)
+        n_candidates = rows.size
+        rows = self.shortlisted(data, rows, need)
+        short_lo, short_hi = self._shortlist_range(n_candidates, need)
+        lo, hi = max(lo, short_lo), min(hi, short_hi)
+        if self._streaming(rows.size):
+            entry = self.score_top(data, rows, need) + (report,)
+            hi = min(hi, need)
+        else:
+            scores, counts = self.score(data, rows)
+            entry = (rows, scores, counts.copy(), report)
+
+        if self.score_cache_size > 0:
+            with self._score_lock:
+                self._score_cache[key] = (lo, hi, entry)
+                self._score_cache.move_to_end(key)
+                while len(self._score_cache) > self.score_cache_size:
+                    self._score_cache.popitem(last=False)
+        return entry
+
+    def score_many(self, rooms: list, rows_list: list = None) -> list:
+        """
+        Один predict на матрицу «помещения × кандидаты»; результат — по помещениям.
+        rows_list — строки каталога для каждого помещения (по умолчанию весь каталог).
+        """
+        full = rows_list is None
+        rows_list = rows_list or [self.all_rows] * len(rooms)
+        bounds = np.cumsum([0] + [rows.size for rows in rows_list])
+        counts = np.empty(bounds[-1], dtype=np.int64)
+        with stage("features"):
+            for i, (data, rows) in enumerate(zip(rooms, rows_list)):
+                self._counts(data, rows, counts[bounds[i]:bounds[i + 1]], np.empty(rows.size))
+
+        y_pred = np.empty(0)
+        count_scored(int(bounds[-1]))
+        if bounds[-1] and self._parallel(bounds[-1]):
+            with stage("predict"):
+                y_pred = self.scorer.score_many(rooms, None if full else rows_list)
+        elif bounds[-1]:
+            with stage("features"):
+                X = self.features.assemble(rooms, counts, rows_list)
+            with stage("predict"):
+                y_pred = self.model.predict(X)
+        return [
+            (y_pred[bounds[i]:bounds[i + 1]], counts[bounds[i]:bounds[i + 1]])
+            for i in range(len(rooms))
+        ]
+
+    def score_rooms(self, rooms: list, rows_list: list, needs: list) -> list:
+        """
+        (строки, оценки, количества) для пакета помещений.
+
+        Без потокового режима — один score_many на весь пакет. В потоковом
+        помещения собираются в группы не больше chunk_rows строк (один predict
+        на группу), а помещение с большим числом кандидатов оценивается
+        частями с текущим top-N (score_top). С первым этапом полной моделью
+        оцениваются только короткие списки (shortlisted).
+        """
+        rows_list = [self.shortlisted(data, rows, need) for data, rows, need in zip(rooms, rows_list, needs)]
+        if not self._streaming(sum(rows.size for rows in rows_list)):
+            scored = self.score_many(rooms, rows_list)
+            return [(rows, scores, counts) for rows, (scores, counts) in zip(rows_list, scored)]
+
+        results = [None] * len(rooms)
+        group, group_rows = [], 0
+
+        def flush():
+            scored = self.score_many([rooms[i] for i in group], [rows_list[i] for i in group])
+            for i, (scores, counts) in zip(group, scored):
+                results[i] = (rows_list[i], scores, counts)
+            group.clear()
+
+        for i, (data, rows, need) in enumerate(zip(rooms, rows_list, needs)):
+            if rows.size > self.chunk_rows:
+                results[i] = self.score_top(data, rows, need)
+                continue
+            if group_rows + rows.size > self.chunk_rows:
+                flush()
+                group_rows = 0
+            group.append(i)
+            group_rows += rows.size
+        if group:
+            flush()
+        return results
+
+    def close(self) -> None:
+        """Останавливает пул процессов скоринга (если есть) и освобождает общую память."""
+        if self.scorer is not None:
+            self.scorer.close()
+            self.scorer = None
+
+    # -------------------------
+    # Выбор top-N
+    # -------------------------
+    def _tie_keys(self, rows: np.ndarray, tie_break: str) -> tuple:
+        """Вторичные ключи np.lexsort (последний — самый значимый)."""
+        if tie_break == "price":
+            return (rows, self.catalog["цена_₽"][rows])
+        if tie_break == "efficiency":
+            return (rows, -self.catalog["эффективность_лм_вт"][rows])
+        return (rows,)
+
+    def select(
+        self, scores: np.ndarray, top_n: int, offset: int = 0,
+        tie_break: str = "index", rows: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Позиции в scores для мест [offset, offset + top_n) по убыванию оценки.
+
+        Частичный отбор (argpartition) за O(n): полностью сортируются только
+        offset + top_n лучших строк плюс строки с равной граничной оценкой,
+        чтобы порядок при равенстве определялся tie_break, а не argpartition.
+        rows — строки каталога, которым соответствуют scores (по умолчанию все).
+        """
+        n = scores.shape[0]
+        rows = self.all_rows[:n] if rows is None else rows
+        need = min(offset + top_n, n)
+        if need <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        if need < n:
+            part = np.argpartition(-scores, need - 1)[:need]
+            cand = np.flatnonzero(scores >= scores[part].min())
+        else:
+            cand = np.arange(n)
+
+        order = np.lexsort(self._tie_keys(rows[cand], tie_break) + (-scores[cand],))
+        return cand[order[offset:offset + top_n]]
+
+    # -------------------------
+    # Инженерные расчёты и записи ответа (только для top-N)
+    # -------------------------
+    def records(self, data: dict, idx: np.ndarray, scores: np.ndarray, counts: np.ndarray) -> list:
+        """Записи для строк каталога idx; scores и counts выровнены с idx."""
+        E = data["целевой_люкс"]
+        S = data["площадь_м2"]
+        бюджет = data["бюджет_₽"]
+        cat = self.catalog
+
+        count = counts
+        power = cat["мощность_вт"][idx]
+        flux = cat["световой_поток_лм"][idx]
+        price = cat["цена_₽"][idx]
+
+        total_power = np.round(power * count, 1)
+        cost = np.round(price * count, 2)
+        lux = np.round(flux * count * η / S, 1)
+        share = np.round(cost / бюджет * 100, 1)
+        level = np.where(lux > E * 1.2, 1, np.where(lux < E * 0.8, 2, 0))
+
+        columns = {
+            "тип_светильника": cat.labels("тип_светильника", idx),
+            "бренд": cat.labels("бренд", idx),
+            "серия": cat.labels("серия", idx),
+            "мощность_вт": power.tolist(),
+            "световой_поток_лм": flux.tolist(),
+            "цена_₽": price.tolist(),
+            "количество_светильников": count.tolist(),
+            "итоговая_мощность_вт": total_power.tolist(),
+            "итоговая_стоимость_₽": cost.tolist(),
+            "освещенность_лк": lux.tolist(),
+            "уровень_освещения": LEVEL_LABELS[level].tolist(),
+            "доля_бюджета_%": share.tolist(),
+            "предсказанная_оценка": scores.tolist(),
+        }
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def page(
+        self, data: dict, rows: np.ndarray, scores: np.ndarray, counts: np.ndarray,
+        top_n: int, offset: int = 0, tie_break: str = "index"
+    ) -> list:
+        """Выбор страницы и записи по уже посчитанным оценкам кандидатов."""
+        with stage("select"):
+            pos = self.select(scores, top_n, offset, tie_break, rows)
+        with stage("records"):
+            return self.records(data, rows[pos], scores[pos], counts[pos])
+
+    def recommend(
+        self, data: dict, top_n: int, offset: int = 0,
+        tie_break: str = "index", prefilter: str = "off"
+    ) -> tuple:
+        """Записи страницы и отчёт предфильтра для одного помещения."""
+        need = max(self.min_candidates, offset + top_n)
+        rows, scores, counts, report = self.scored(data, prefilter, need)
+        return self.page(data, rows, scores, counts, top_n, offset, tie_break), report
@@ -0,0 +1,99 @@
+"""
+Пулы выполнения для блокирующей работы (разбор текста, скоринг) вне цикла событий.
+
+Каждый пул — ThreadPoolExecutor с ограниченной очередью: одновременно
+в пуле не больше workers + queue_depth задач. Если мест нет, запрос сразу
+получает 503 (Overloaded), а не ждёт в бесконечной очереди. Ожидание
+результата ограничено таймаутом (InferenceTimeout → 504); задача при этом
+дорабатывает в потоке и освобождает место только по завершении, так что
+зависшие вызовы тоже учитываются в лимите.
+
+Потоки подходят: predict CatBoost и операции NumPy отпускают GIL, буферы
+движка — свои у каждого потока (FixtureCatalog.workspace), общие кэши
+защищены блокировками, версия артефактов берётся один раз на запрос.
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import (
+    INFERENCE_WORKERS, INFERENCE_QUEUE_DEPTH, PARSE_WORKERS, PARSE_QUEUE_DEPTH, REQUEST_TIMEOUT_S,
+)
+
+
+class ExecutorError(RuntimeError):
+    """Запрос не выполнен из-за ограничений пула."""
+
+
+class Overloaded(ExecutorError):
+    """Очередь пула заполнена."""
+
+
+class InferenceTimeout(ExecutorError):
+    """Результат не получен за отведённое время."""
+
+
+class BoundedExecutor:
+    """Пул потоков с ограниченной очередью, таймаутом и счётчиками."""
+
+    def __init__(self, name: str, workers: int, queue_depth: int, timeout_s: float):
+        self.name = name
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.timeout_s = timeout_s
+
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = self.rejected = self.timeouts = 0
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+        self._slots.release()
+
+    async def run(self, fn, *args, timeout_s: float = None):
+        """Выполняет fn(*args) в пуле и ждёт результат, не блокируя цикл событий."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise Overloaded(f"Сервис перегружен: очередь «{self.name}» заполнена, повторите позже.")
+
+        with self._lock:
+            self.in_flight += 1
+        # Контекст запроса (app.request_log) переходит в поток пула
+        future = self._pool.submit(contextvars.copy_context().run, fn, *args)
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout_s or self.timeout_s)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            raise InferenceTimeout(f"Превышено время ожидания ответа ({timeout_s or self.timeout_s} с).")
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self.queue_depth,
+                "timeout_s": self.timeout_s,
+                "in_flight": self.in_flight,
+                "queued": max(self.in_flight - self.workers, 0),
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+            }
+
+
+# Скоринг (/recommend, /recommend/batch, подбор в /chat) и разбор текста — раздельно:
+# медленный парсер не занимает потоки скоринга и наоборот
+score_pool = BoundedExecutor("inference", INFERENCE_WORKERS, INFERENCE_QUEUE_DEPTH, REQUEST_TIMEOUT_S)
+parse_pool = BoundedExecutor("parse", PARSE_WORKERS, PARSE_QUEUE_DEPTH, REQUEST_TIMEOUT_S)
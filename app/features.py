@@ -0,0 +1,168 @@
+"""
+Сборка признаков для модели без полного ColumnTransformer на каждый запрос.
+
+Признаки светильников (one-hot типа/бренда и масштабированные характеристики)
+не зависят от помещения, поэтому считаются один раз при загрузке каталога.
+На запрос кодируются только столбцы помещения и количество светильников,
+а матрица собирается из готовых частей. Результат побитно совпадает
+с preprocessor.transform.
+"""
+
+import copy
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+# Столбцы, которые задаёт помещение (RoomInput)
+ROOM_COLUMNS = [
+    "тип_помещения", "площадь_м2", "высота_м", "целевой_люкс",
+    "cri_min", "cct_предпочтение_k", "ip_min", "бюджет_₽"
+]
+# Столбец, зависящий и от помещения, и от светильника
+COUNT_COLUMN = "количество_светильников"
+
+
+class FeatureAssembler:
+    """Кэширует блок признаков каталога и собирает вход модели по запросу."""
+
+    def __init__(self, preprocessor, fixtures_df: pd.DataFrame, dtype=np.float64):
+        self.preprocessor = preprocessor
+        # Тип входа модели (Predictor.dtype): матрица собирается сразу в нём
+        self.dtype = np.dtype(dtype)
+        self.n_fixtures = len(fixtures_df)
+
+        # Категориальные столбцы помещения: (столбец, срез выхода, категории)
+        self._room_onehot = []
+        # Числовые столбцы помещения: индексы выхода, mean, scale
+        num_cols, num_idx, num_mean, num_scale = [], [], [], []
+        self._count_idx = None
+
+        for name, transformer, columns in preprocessor.transformers_:
+            if name == "remainder" or transformer == "drop":
+                continue
+            out = preprocessor.output_indices_[name]
+
+            if isinstance(transformer, OneHotEncoder):
+                if transformer.drop is not None:
+                    raise ValueError("OneHotEncoder с drop не поддерживается.")
+                offset = out.start
+                for col, cats in zip(columns, transformer.categories_):
+                    if col in ROOM_COLUMNS:
+                        self._room_onehot.append((col, slice(offset, offset + len(cats)), cats))
+                    offset += len(cats)
+
+            elif isinstance(transformer, StandardScaler):
+                mean = transformer.mean_ if transformer.with_mean else np.zeros(len(columns))
+                scale = transformer.scale_ if transformer.with_std else np.ones(len(columns))
+                for i, col in enumerate(columns):
+                    if col in ROOM_COLUMNS:
+                        num_cols.append(col)
+                        num_idx.append(out.start + i)
+                        num_mean.append(mean[i])
+                        num_scale.append(scale[i])
+                    elif col == COUNT_COLUMN:
+                        self._count_idx = out.start + i
+                        self._count_mean = mean[i]
+                        self._count_scale = scale[i]
+
+            else:
+                raise ValueError(f"Неподдерживаемый трансформер: {type(transformer).__name__}")
+
+        self._room_num_cols = num_cols
+        self._room_num_idx = np.array(num_idx, dtype=np.intp)
+        self._room_num_mean = np.array(num_mean, dtype=np.float64)
+        self._room_num_scale = np.array(num_scale, dtype=np.float64)
+
+        # Блок каталога: полный transform с фиктивными значениями помещения,
+        # столбцы помещения и количества перезаписываются на каждый запрос
+        placeholder = fixtures_df.copy()
+        for col in ROOM_COLUMNS:
+            placeholder[col] = 0
+        for col, _, cats in self._room_onehot:
+            placeholder[col] = cats[0]
+        placeholder[COUNT_COLUMN] = 1
+        self.fixture_block = np.ascontiguousarray(preprocessor.transform(placeholder), dtype=self.dtype)
+        self.n_features = self.fixture_block.shape[1]
+
+    def detached(self) -> "FeatureAssembler":
+        """
+        Копия без блока каталога и препроцессора — для передачи в процессы
+        скоринга (app.parallel), где блок подключается из общей памяти.
+        """
+        light = copy.copy(self)
+        light.preprocessor = None
+        light.fixture_block = None
+        return light
+
+    def linear_parts(self, coef: np.ndarray) -> tuple:
+        """
+        Линейная модель по блокам входа: оценка каждой строки каталога
+        (признаки помещения и количества — заглушки, одинаковые для всех строк)
+        и вес количества светильников в исходных единицах.
+        """
+        fixture_scores = (self.fixture_block @ coef.astype(self.dtype)).astype(np.float64)
+        count_weight = float(coef[self._count_idx]) / self._count_scale
+        return fixture_scores, count_weight
+
+    # -------------------------
+    # Кодирование помещения
+    # -------------------------
+    def _fill_room(self, X: np.ndarray, data: dict) -> None:
+        """Записывает признаки помещения во все строки X (как transform)."""
+        for col, out, cats in self._room_onehot:
+            X[:, out] = 0.0
+            hits = np.flatnonzero(cats == data[col])
+            if hits.size:
+                X[:, out.start + hits[0]] = 1.0
+
+        values = np.array([data[col] for col in self._room_num_cols], dtype=np.float64)
+        values -= self._room_num_mean
+        values /= self._room_num_scale
+        X[:, self._room_num_idx] = values
+
+    def _fill_counts(self, X: np.ndarray, counts: np.ndarray, scratch: np.ndarray = None) -> None:
+        scaled = np.subtract(counts, self._count_mean, out=scratch, dtype=np.float64)
+        scaled /= self._count_scale
+        X[:, self._count_idx] = scaled
+
+    # -------------------------
+    # Сборка входа модели
+    # -------------------------
+    def assemble(self, rooms: list, counts: np.ndarray, rows_list: list = None) -> np.ndarray:
+        """
+        Собирает матрицу «помещения × строки каталога»: блоки помещений подряд.
+
+        Args:
+            rooms (list): словари параметров помещений
+            counts (np.ndarray): количество светильников для всех строк всех блоков
+            rows_list (list): строки каталога для каждого помещения (по умолчанию — весь каталог)
+        Returns:
+            np.ndarray: матрица признаков (self.dtype), эквивалентная preprocessor.transform
+        """
+        if rows_list is None:
+            X = np.tile(self.fixture_block, (len(rooms), 1))
+            sizes = [self.n_fixtures] * len(rooms)
+        else:
+            X = np.concatenate([self.fixture_block[rows] for rows in rows_list])
+            sizes = [rows.size for rows in rows_list]
+
+        start = 0
+        for data, size in zip(rooms, sizes):
+            self._fill_room(X[start:start + size], data)
+            start += size
+        self._fill_counts(X, np.asarray(counts))
+        return X
+
+    def fill(
+        self, X: np.ndarray, data: dict, counts: np.ndarray,
+        scratch: np.ndarray = None, rows: np.ndarray = None
+    ) -> np.ndarray:
+        """Заполняет заранее выделенный буфер X признаками одного помещения (строки rows)."""
+        if rows is None:
+            np.copyto(X, self.fixture_block)
+        else:
+            np.take(self.fixture_block, rows, axis=0, out=X)
+        self._fill_room(X, data)
+        self._fill_counts(X, counts, scratch)
+        return X
@@ -3,31 +3,63 @@
 # AI Lighting Recommender + AI-Советник + Frontend
 # ==============================================================
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse, Response
 import os
 import logging
+import time
 
-from app.schemas import RoomInput
-from app.recommend import recommend_luminaires as recommend
+from app import request_log
+from app.schemas import RoomInput, RecommendResponse, BatchRecommendResponse
+from app.recommend import recommend_luminaires as recommend, recommend_batch, registry
+from app.cache import result_cache, canonical_room
+from app.config import BATCH_MAX_ROOMS, STARTUP_BLOCKING, GZIP_ENABLED, GZIP_MIN_SIZE, GZIP_LEVEL
+from app.responses import FastJSONResponse
+from app.assets import DIST_DIR, PrecompressedStaticFiles, load_manifest, is_stale
+from app.executor import Overloaded, InferenceTimeout, score_pool, parse_pool
+from app.metrics import metrics, stage, count_error, REQUESTS, REQUEST_SECONDS
+from app.registry import ArtifactsNotReady
+from app.startup import startup
 from app.advisor import generate_advice
 from app.advisor_chat import router as chat_router
+from app.admin import router as admin_router
+from app.catalog_api import router as catalog_router
 
 # --------------------------------------------------------------
-# Настройка логгера
+# Настройка логгера: запись через очередь в фоновом потоке (app.request_log)
 # --------------------------------------------------------------
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+request_log.setup_logging()
 logger = logging.getLogger(__name__)
 
+# --------------------------------------------------------------
+# Запуск: артефакты и SpaCy грузятся в фоне (app.startup)
+# --------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup.begin()
+    if STARTUP_BLOCKING:
+        await run_in_threadpool(startup.wait)
+    yield
+    registry.stop_watcher()
+    score_pool.shutdown()
+    parse_pool.shutdown()
+    registry.close()
+
 # --------------------------------------------------------------
 # Инициализация приложения
 # --------------------------------------------------------------
 app = FastAPI(
     title="AI Lighting Recommender",
     version="1.0",
-    description="Интеллектуальная система подбора светильников с объяснением выбора и веб-интерфейсом."
+    description="Интеллектуальная система подбора светильников с объяснением выбора и веб-интерфейсом.",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # --------------------------------------------------------------
@@ -45,6 +77,75 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# --------------------------------------------------------------
+# Сжатие ответов API (JSON) от GZIP_MIN_SIZE байт; статика сжата при сборке
+# --------------------------------------------------------------
+class ApiGZipMiddleware(GZipMiddleware):
+    """GZip для ответов API; /assets/ отдаётся готовыми сжатыми копиями (app.assets)."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/assets/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+if GZIP_ENABLED:
+    app.add_middleware(ApiGZipMiddleware, minimum_size=GZIP_MIN_SIZE, compresslevel=GZIP_LEVEL)
+
+# --------------------------------------------------------------
+# Версия артефактов в каждом ответе
+# --------------------------------------------------------------
+@app.middleware("http")
+async def artifact_version_header(request: Request, call_next):
+    response = await call_next(request)
+    if registry.version:
+        response.headers["X-Artifact-Version"] = registry.version
+    return response
+
+
+# --------------------------------------------------------------
+# Метрики запросов: длительность и статус по шаблону пути
+# --------------------------------------------------------------
+@app.middleware("http")
+async def request_metrics(request: Request, call_next):
+    """Метрики запроса и одна запись журнала на запрос (id — из X-Request-ID или новый)."""
+    started = time.perf_counter()
+    entry, token = request_log.begin(request.method, request.url.path, request.headers.get("x-request-id"))
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        response.headers["X-Request-ID"] = entry.request_id
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        if metrics.enabled:
+            REQUEST_SECONDS.observe(elapsed, request.method, path)
+            REQUESTS.inc(1, request.method, path, str(status))
+        request_log.finish(entry, token, status, elapsed, path)
+
+
+# Запрос до окончания загрузки — 503, балансировщик повторит позже
+@app.exception_handler(ArtifactsNotReady)
+async def not_ready_handler(request: Request, exc: ArtifactsNotReady):
+    request_log.expect("not_ready")
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "5"})
+
+
+# Очередь пула заполнена — быстрый отказ вместо ожидания
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request: Request, exc: Overloaded):
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
+
+@app.exception_handler(InferenceTimeout)
+async def timeout_handler(request: Request, exc: InferenceTimeout):
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
 # --------------------------------------------------------------
 # Подключаем роутер AI-советника (чат)
 # --------------------------------------------------------------
@@ -54,6 +155,12 @@ app.include_router(
     tags=["AI-советник"],
 )
 
+# Служебные эндпоинты: версии артефактов, перезагрузка, откат
+app.include_router(admin_router, tags=["Администрирование"])
+
+# Витрина каталога: фильтры, фасеты, курсор, ETag
+app.include_router(catalog_router, tags=["Каталог"])
+
 # --------------------------------------------------------------
 # Подключаем FRONTEND
 # --------------------------------------------------------------
@@ -65,14 +172,29 @@ FRONTEND_DIR = os.path.join(BASE_DIR, "../frontend")
 if not os.path.exists(FRONTEND_DIR):
     logger.warning("⚠️ Каталог frontend не найден. Проверь путь перед деплоем.")
 else:
-    # Подключаем все статические файлы (CSS, JS, изображения)
-    app.mount("/assets", StaticFiles(directory=os.path.join(FRONTEND_DIR, "assets")), name="assets")
+    # Собранная статика (python -m app.assets): хэшированные имена и сжатые копии
+    asset_manifest = load_manifest()
+    if asset_manifest:
+        if is_stale():
+            logger.warning("⚠️ Исходники frontend новее сборки frontend/dist — выполните python -m app.assets.")
+        INDEX_DIR = DIST_DIR
+        app.mount(
+            "/assets",
+            PrecompressedStaticFiles(
+                directory=os.path.join(DIST_DIR, "assets"), immutable=set(asset_manifest.values())
+            ),
+            name="assets",
+        )
+    else:
+        # Без сборки — исходные файлы как есть (CSS, JS, изображения)
+        INDEX_DIR = FRONTEND_DIR
+        app.mount("/assets", StaticFiles(directory=os.path.join(FRONTEND_DIR, "assets")), name="assets")
 
-    # Главная страница index.html
+    # Главная страница index.html (ссылки на статику меняются со сборкой — всегда перепроверять)
     @app.get("/", response_class=FileResponse)
     async def serve_index():
-        index_path = os.path.join(FRONTEND_DIR, "index.html")
-        return FileResponse(index_path)
+        index_path = os.path.join(INDEX_DIR, "index.html")
+        return FileResponse(index_path, headers={"Cache-Control": "no-cache"})
 
 # --------------------------------------------------------------
 # Проверка состояния сервиса
@@ -82,28 +204,106 @@ def health_check():
     """Проверка работоспособности сервиса"""
     return {"status": "ok"}
 
+
+@app.get("/ready")
+def readiness_check():
+    """Готовность к трафику: артефакты загружены и прогреты; длительности фаз запуска"""
+    status = startup.status()
+    if not startup.ready:
+        request_log.expect("not_ready")
+    return JSONResponse(status_code=200 if startup.ready else 503, content=status)
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    """Счётчики кэша ответов: попадания, промахи, вытеснения, объём"""
+    return result_cache.stats()
+
+
+@app.get("/executor/stats")
+def executor_stats():
+    """Загрузка пулов выполнения: задачи в работе и в очереди, отказы, таймауты"""
+    return {"inference": score_pool.stats(), "parse": parse_pool.stats()}
+
+
+def _collect_service_metrics() -> list:
+    """Счётчики кэша ответов, пулов выполнения и версия артефактов для /metrics."""
+    cache = result_cache.stats()
+    pools = {"inference": score_pool.stats(), "parse": parse_pool.stats()}
+    families = [
+        ("lighting_cache_requests_total", "counter", "Обращения к кэшу ответов",
+         [({"result": "hit"}, cache["hits"]), ({"result": "miss"}, cache["misses"])]),
+        ("lighting_cache_evictions_total", "counter", "Вытеснения из кэша ответов",
+         [({"reason": "lru"}, cache["evictions"]), ({"reason": "ttl"}, cache["expirations"])]),
+        ("lighting_cache_entries", "gauge", "Записей в кэше ответов", [({}, cache["entries"])]),
+        ("lighting_cache_bytes", "gauge", "Оценка объёма кэша ответов", [({}, cache["bytes"])]),
+        ("lighting_ready", "gauge", "Сервис загружен и прогрет", [({}, int(startup.ready))]),
+    ]
+    for name, kind, help_text, field in (
+        ("lighting_pool_in_flight", "gauge", "Задач в пуле (в работе и в очереди)", "in_flight"),
+        ("lighting_pool_queued", "gauge", "Задач в очереди пула", "queued"),
+        ("lighting_pool_rejected_total", "counter", "Отказов из-за заполненной очереди (503)", "rejected"),
+        ("lighting_pool_timeouts_total", "counter", "Превышений времени ожидания (504)", "timeouts"),
+    ):
+        families.append((name, kind, help_text, [({"pool": pool}, stats[field]) for pool, stats in pools.items()]))
+    if registry.version:
+        families.append(("lighting_artifact_info", "gauge", "Активная версия артефактов",
+                         [({"version": registry.version}, 1)]))
+    return families
+
+
+metrics.collector(_collect_service_metrics)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """Гистограммы этапов и запросов, счётчики — в текстовом формате Prometheus"""
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Метрики выключены (METRICS_ENABLED=0).")
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # --------------------------------------------------------------
 # Основной эндпоинт рекомендаций
 # --------------------------------------------------------------
-@app.post("/recommend")
-def get_recommendations(room: RoomInput):
+@app.post("/recommend", response_model=RecommendResponse)
+async def get_recommendations(room: RoomInput):
     """
     Принимает параметры помещения (RoomInput),
     вызывает модель рекомендаций и AI-советник для объяснения выбора.
+    Ответ (RecommendResponse) кодируется один раз, без повторной валидации.
     """
-    try:
-        # 🔹 Преобразуем входные данные
-        room_dict = room.model_dump()
-        logger.info(f"📥 Получен запрос: {room_dict}")
+    # 🔹 Версия артефактов фиксируется на весь запрос (горячая замена не мешает)
+    with registry.lease() as bundle:
+        # 🔹 Преобразуем входные данные (каноническая форма — и для ключа кэша, и для расчёта)
+        room_dict = canonical_room(room.model_dump())
+        request_log.annotate(input=room_dict)
+
+        # 🔹 Кэш: попадание (готовое тело) отдаётся сразу, без модели, генерации
+        # текста, очереди пула и повторной сериализации
+        cache_key = result_cache.make_key("recommend", room_dict, bundle.version)
+        cached = result_cache.get(cache_key)
+        request_log.annotate(cache="hit" if cached is not None else "miss")
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+        # 🔹 Модель и советник — в пуле инференса, цикл событий остаётся свободным
+        return await score_pool.run(bundle.call, _recommend_response, room_dict, cache_key, bundle)
 
+
+def _recommend_response(room_dict: dict, cache_key: tuple, bundle) -> FastJSONResponse:
+    """Подбор, объяснение, запись в кэш и сериализация (выполняется в пуле инференса)."""
+    try:
         # 🔹 Получаем рекомендации
-        results = recommend(room_dict)
+        results = recommend(room_dict, bundle=bundle)
         if not results:
             raise ValueError("Рекомендации не получены.")
 
         # 🔹 Обработка структуры
+        paging, prefilter = None, None
         if isinstance(results, dict):
             recommendations, summary = [], ""
+            paging = results.get("paging")
+            prefilter = results.get("prefilter")
             if "recommendations" in results:
                 if isinstance(results["recommendations"], list):
                     recommendations = results["recommendations"]
@@ -115,17 +315,75 @@ def get_recommendations(room: RoomInput):
             recommendations, summary = [], ""
 
         # 🔹 Генерация объяснения
-        advice = generate_advice(recommendations, room_dict)
+        with stage("advice"):
+            advice = generate_advice(recommendations, room_dict)
 
-        logger.info("✅ Рекомендации и совет успешно сформированы.")
-        return {
+        request_log.annotate(recommendations=len(recommendations))
+        response = {
             "recommendations": recommendations,
             "summary": summary,
-            "advice": advice
+            "advice": advice,
+            "paging": paging,
+            "prefilter": prefilter,
+            "artifact_version": bundle.version
         }
+        # Тело кодируется один раз: то же в ответ и в кэш
+        rendered = FastJSONResponse(response)
+        if "error" not in results:
+            result_cache.put(cache_key, rendered.body)
+        return rendered
+
+    except Exception as e:
+        count_error("recommend")
+        request_log.exception(logger, "❌ Ошибка во время инференса:")
+        raise HTTPException(status_code=500, detail=f"Ошибка во время инференса: {e}")
+
+
+# --------------------------------------------------------------
+# Пакетный подбор для списка помещений (импорт планировок)
+# --------------------------------------------------------------
+@app.post("/recommend/batch", response_model=BatchRecommendResponse)
+async def get_batch_recommendations(rooms: list[RoomInput]):
+    """
+    Принимает список помещений (RoomInput) и возвращает top-N
+    рекомендаций с советом для каждого — в порядке входа.
+    """
+    if len(rooms) > BATCH_MAX_ROOMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Слишком много помещений в запросе: {len(rooms)} (максимум {BATCH_MAX_ROOMS})."
+        )
+
+    with registry.lease() as bundle:
+        return await score_pool.run(bundle.call, _batch_response, rooms, bundle)
+
+
+def _batch_response(rooms: list, bundle) -> FastJSONResponse:
+    """Пакетный подбор, советы по помещениям и сериализация (выполняется в пуле инференса)."""
+    try:
+        room_dicts = [room.model_dump() for room in rooms]
+        request_log.annotate(rooms=len(room_dicts))
+
+        batch = recommend_batch(room_dicts, bundle=bundle)
+
+        results = []
+        for room_dict, result in zip(room_dicts, batch):
+            recommendations = result.get("recommendations", [])
+            with stage("advice"):
+                advice = generate_advice(recommendations, room_dict)
+            results.append({
+                "recommendations": recommendations,
+                "summary": result.get("summary", ""),
+                "advice": advice,
+                "paging": result.get("paging"),
+                "prefilter": result.get("prefilter")
+            })
+
+        return FastJSONResponse({"results": results, "artifact_version": bundle.version})
 
     except Exception as e:
-        logger.exception("❌ Ошибка во время инференса:")
+        count_error("batch")
+        request_log.exception(logger, "❌ Ошибка во время пакетного инференса:")
         raise HTTPException(status_code=500, detail=f"Ошибка во время инференса: {e}")
 
 
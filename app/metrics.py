@@ -0,0 +1,249 @@
+"""
+Метрики сервиса в текстовом формате Prometheus (GET /metrics).
+
+Гистограммы длительности этапов подбора (разбор текста, предфильтр,
+первый этап ранжирования, сборка входа модели, predict, выбор top-N,
+записи ответа, summary, совет, сериализация, витрина каталога),
+длительности HTTP-запросов, счётчики запросов и ошибок, число кандидатов
+после предфильтра и первого этапа. Кэш ответов и пулы выполнения отдают
+свои счётчики при чтении /metrics (collector).
+
+Накладные расходы — perf_counter, bisect по границам корзин и короткая
+блокировка на наблюдение (около микросекунды), поэтому метрики включены
+по умолчанию (METRICS_ENABLED).
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from app import request_log
+from app.config import METRICS_ENABLED
+
+# Границы корзин, с: от 50 мкс (этапы на маленьком каталоге) до 10 с (таймаут запроса)
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# Число кандидатов после предфильтра (и после первого этапа ранжирования)
+SIZE_BUCKETS = (10, 30, 100, 300, 1_000, 3_000, 10_000, 30_000, 100_000, 300_000, 1_000_000)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Монотонный счётчик с метками."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, *labels) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> list:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}" for key, value in items]
+
+
+class Histogram:
+    """Гистограмма с фиксированными корзинами (накопительные счётчики при выводе)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}  # метки -> [счётчики корзин (+Inf последней), сумма]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels) -> None:
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][i] += 1
+            series[1] += value
+
+    def time(self, *labels) -> "_Timer":
+        """Контекстный менеджер: длительность блока в гистограмму."""
+        return _Timer(self, labels)
+
+    def samples(self) -> list:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == "+Inf" else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+        return False
+
+
+class _NullTimer:
+    """Таймер при выключенных метриках."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    """Длительность этапа — в гистограмму и в запись текущего запроса."""
+
+    __slots__ = ("name", "entry", "started")
+
+    def __init__(self, name: str, entry):
+        self.name = name
+        self.entry = entry
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        if metrics.enabled:
+            STAGE_SECONDS.observe(elapsed, self.name)
+        if self.entry is not None:
+            self.entry.add_stage(self.name, elapsed)
+        return False
+
+
+class MetricsRegistry:
+    """Набор метрик и функций-сборщиков, вывод в формате Prometheus."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name: str, help_text: str, labelnames: tuple = ()) -> Counter:
+        metric = Counter(name, help_text, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help_text: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        metric = Histogram(name, help_text, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, fn) -> None:
+        """
+        fn() -> список (имя, тип, описание, [(метки dict, значение), ...]);
+        вызывается при каждом чтении /metrics.
+        """
+        self._collectors.append(fn)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        for fn in self._collectors:
+            for name, kind, help_text, samples in fn():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry(enabled=METRICS_ENABLED)
+
+STAGE_SECONDS = metrics.histogram(
+    "lighting_stage_duration_seconds", "Длительность этапа обработки запроса", ("stage",)
+)
+REQUEST_SECONDS = metrics.histogram(
+    "lighting_http_request_duration_seconds", "Длительность HTTP-запроса", ("method", "path")
+)
+REQUESTS = metrics.counter(
+    "lighting_http_requests_total", "HTTP-запросы по статусу ответа", ("method", "path", "status")
+)
+ERRORS = metrics.counter(
+    "lighting_errors_total", "Ошибки обработки по месту возникновения", ("stage",)
+)
+CANDIDATES = metrics.histogram(
+    "lighting_candidates", "Кандидатов каталога после предфильтра", ("mode",), buckets=SIZE_BUCKETS
+)
+SCORED_ROWS = metrics.counter(
+    "lighting_scored_rows_total", "Строк каталога, оценённых моделью"
+)
+
+
+# -------------------------
+# Короткие вызовы для кода подбора
+# -------------------------
+def stage(name: str):
+    """
+    with stage("predict"): ... — длительность этапа в lighting_stage_duration_seconds
+    и в stages_ms записи запроса (app.request_log).
+    """
+    entry = request_log.current()
+    if metrics.enabled or entry is not None:
+        return _StageTimer(name, entry)
+    return _NULL_TIMER
+
+
+def count_error(name: str) -> None:
+    if metrics.enabled:
+        ERRORS.inc(1, name)
+
+
+def observe_candidates(mode: str, n_rows: int) -> None:
+    if metrics.enabled:
+        CANDIDATES.observe(n_rows, mode)
+
+
+def count_scored(n_rows: int) -> None:
+    if metrics.enabled:
+        SCORED_ROWS.inc(n_rows)
@@ -1,10 +1,36 @@
-import joblib
-import pandas as pd
-from catboost import CatBoostRegressor
+import hashlib
+import os
 
 from app.config import MODEL_PATH, PREPROCESSOR_PATH
 
 def load_model_and_preprocessor():
-    model = joblib.load(MODEL_PATH)
+    # joblib (и catboost/sklearn при распаковке) — только по требованию
+    import joblib
+    from app.predictors import load_predictor
+    model = load_predictor(MODEL_PATH)
     preprocessor = joblib.load(PREPROCESSOR_PATH)
     return model, preprocessor
+
+
+def artifact_files(*paths) -> list:
+    """Файлы артефактов: за манифестом модели (.json) — и файл модели, на который он указывает."""
+    from app.predictors import read_manifest
+    files = []
+    for path in paths:
+        files.append(path)
+        if os.path.splitext(path)[1].lower() == ".json":
+            files.append(read_manifest(path)["file"])
+    return files
+
+
+def artifact_fingerprint(*paths) -> str:
+    """
+    Короткая версия набора артефактов по пути, размеру и времени изменения файлов.
+    Модель по манифесту учитывается вместе с файлом модели: переэкспорт .cbm/.npz/.txt/.onnx
+    под тем же манифестом тоже меняет версию.
+    """
+    h = hashlib.sha1()
+    for path in artifact_files(*paths):
+        st = os.stat(path)
+        h.update(f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns};".encode())
+    return h.hexdigest()[:12]
@@ -0,0 +1,161 @@
+"""
+Многопроцессный скоринг каталога поверх общей памяти.
+
+Блок признаков каталога (FeatureAssembler.fixture_block) и световой поток
+публикуются один раз в multiprocessing.shared_memory; родитель и процессы
+пула работают с одной копией, поэтому память почти не растёт с числом
+процессов (у каждого — только модель и буфер своей части строк).
+Одно помещение делится на непрерывные части каталога, пакет помещений —
+на группы помещений. Оценки частей склеиваются в родителе, top-N выбирает
+движок (select), как и при скоринге в одном процессе.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from app.engine import fixture_counts
+
+# -------------------------
+# Общая память
+# -------------------------
+def publish(array: np.ndarray) -> tuple:
+    """Копирует массив в новый сегмент общей памяти: (сегмент, представление, описание)."""
+    shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+    view[...] = array
+    return shm, view, (shm.name, array.shape, array.dtype.str)
+
+
+def attach(desc: tuple) -> tuple:
+    name, shape, dtype = desc
+    shm = SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+# -------------------------
+# Процесс пула
+# -------------------------
+_worker = {}
+
+
+def _init_worker(model, features, blocks: dict) -> None:
+    """Подключает общие массивы; модель и параметры кодирования приходят один раз."""
+    segments, arrays = {}, {}
+    for key, desc in blocks.items():
+        segments[key], arrays[key] = attach(desc)
+    features.fixture_block = arrays["fixture_block"]
+    _worker.update(
+        model=model, features=features, flux=arrays["flux"], segments=segments,
+        X=np.empty((0, features.n_features), dtype=features.dtype),
+    )
+
+
+def _buffer(k: int) -> np.ndarray:
+    """Буфер входа модели процесса: растёт до самой большой части и переиспользуется."""
+    if _worker["X"].shape[0] < k:
+        features = _worker["features"]
+        _worker["X"] = np.empty((k, features.n_features), dtype=features.dtype)
+    return _worker["X"][:k]
+
+
+def _score_rows(data: dict, rows) -> np.ndarray:
+    """Оценки одного помещения для строк rows (массив или диапазон (start, stop))."""
+    if isinstance(rows, tuple):
+        rows = np.arange(*rows)
+    k = rows.size
+    counts, ratio = np.empty(k, dtype=np.int64), np.empty(k)
+    fixture_counts(_worker["flux"], data, rows, counts, ratio)
+    X = _worker["features"].fill(_buffer(k), data, counts, ratio, rows=rows)
+    return _worker["model"].predict(X)
+
+
+def _score_rooms(rooms: list, rows_list: list = None) -> np.ndarray:
+    """Оценки группы помещений одним predict (блоки помещений подряд; None — весь каталог)."""
+    everything = np.arange(_worker["flux"].size)
+    counts = np.concatenate([
+        fixture_counts(_worker["flux"], data, rows, np.empty(rows.size, dtype=np.int64), np.empty(rows.size))
+        for data, rows in zip(rooms, rows_list or [everything] * len(rooms))
+    ])
+    return _worker["model"].predict(_worker["features"].assemble(rooms, counts, rows_list))
+
+
+def _ping(_) -> int:
+    return multiprocessing.current_process().pid
+
+
+# -------------------------
+# Пул скоринга
+# -------------------------
+class ProcessScorer:
+    """Пул процессов, оценивающих части каталога из общей памяти."""
+
+    def __init__(self, model, features, flux: np.ndarray, processes: int, start_method: str = "spawn"):
+        """
+        Args:
+            model: Predictor (в процессе загружается из своего файла) или обученная модель
+            features (FeatureAssembler): его fixture_block переносится в общую память
+            flux (np.ndarray): световой поток каталога (для количества светильников)
+            processes (int): число процессов
+            start_method (str): spawn | forkserver | fork
+        """
+        self.processes = processes
+        self.n_rows = features.fixture_block.shape[0]
+        self._features = features
+        self._segments = []
+
+        blocks = {}
+        for key, array in (("fixture_block", features.fixture_block), ("flux", flux)):
+            shm, view, blocks[key] = publish(array)
+            self._segments.append(shm)
+            if key == "fixture_block":
+                # Родитель тоже читает блок из общей памяти — своя копия освобождается
+                features.fixture_block = view
+
+        self._pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(model, features.detached(), blocks),
+        )
+        # Процессы поднимаются сразу, а не на первом запросе
+        try:
+            list(self._pool.map(_ping, range(processes)))
+        except Exception:
+            self.close()
+            raise
+
+    def score(self, data: dict, rows: np.ndarray = None) -> np.ndarray:
+        """Оценки одного помещения: каталог (или строки rows) делится на части по процессам."""
+        if rows is None:
+            bounds = np.linspace(0, self.n_rows, self.processes + 1).astype(int)
+            parts = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        else:
+            parts = [part for part in np.array_split(rows, self.processes) if part.size]
+        futures = [self._pool.submit(_score_rows, data, part) for part in parts]
+        return np.concatenate([future.result() for future in futures]) if futures else np.empty(0)
+
+    def score_many(self, rooms: list, rows_list: list = None) -> np.ndarray:
+        """Оценки пакета помещений: помещения делятся на группы по процессам (rows_list None — весь каталог)."""
+        groups = [g for g in np.array_split(np.arange(len(rooms)), self.processes) if g.size]
+        futures = [
+            self._pool.submit(
+                _score_rooms, [rooms[i] for i in g], None if rows_list is None else [rows_list[i] for i in g]
+            )
+            for g in groups
+        ]
+        return np.concatenate([future.result() for future in futures]) if futures else np.empty(0)
+
+    def close(self) -> None:
+        """
+        Останавливает процессы и освобождает сегменты общей памяти.
+        Блок каталога родителя тоже в сегменте, поэтому движок после close не используется.
+        """
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._features.fixture_block = None
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+        self._segments = []
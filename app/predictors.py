@@ -0,0 +1,162 @@
+"""
+Предикторы: модель в родном или экспортированном формате вместо pickle.
+
+Каждый бэкенд загружает одно семейство моделей в самом быстром виде
+и считает оценки по непрерывному массиву признаков без pandas:
+
+    catboost  — .cbm (CatBoostRegressor.load_model)
+    lightgbm  — текстовая модель LightGBM (lightgbm.Booster)
+    onnx      — .onnx через onnxruntime (RandomForest, MLP, XGBoost и др.)
+    linear    — .npz с коэффициентами, считается в NumPy
+    pickle    — прежний joblib-артефакт (совместимость, float64)
+
+Какой файл и какой бэкенд — описывает манифест ml/best_model.json,
+который пишет шаг экспорта при обучении (ml/export_model.py). Библиотеки
+бэкендов импортируются только при загрузке соответствующей модели.
+"""
+
+import json
+import os
+
+import numpy as np
+
+
+class Predictor:
+    """Общий интерфейс: predict(X) -> одномерный массив оценок."""
+
+    backend = None
+    # Тип входа, в котором движок собирает матрицу признаков (app.features)
+    dtype = np.float32
+
+    def __init__(self, path: str):
+        self.path = path
+        self._load(path)
+
+    def _load(self, path: str) -> None:
+        raise NotImplementedError
+
+    def _predict(self, X: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return np.asarray(self._predict(np.ascontiguousarray(X, dtype=self.dtype))).ravel()
+
+    def __reduce__(self):
+        # В процессы скоринга (app.parallel) передаётся путь, модель
+        # загружается там из файла, а не распаковывается из pickle
+        return self.__class__, (self.path,)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r})"
+
+
+class CatBoostPredictor(Predictor):
+    backend = "catboost"
+
+    def _load(self, path: str) -> None:
+        from catboost import CatBoostRegressor
+        self._model = CatBoostRegressor()
+        self._model.load_model(path, format="cbm")
+
+    def _predict(self, X: np.ndarray) -> np.ndarray:
+        return self._model.predict(X)
+
+
+class LightGBMPredictor(Predictor):
+    backend = "lightgbm"
+
+    def _load(self, path: str) -> None:
+        import lightgbm
+        self._booster = lightgbm.Booster(model_file=path)
+
+    def _predict(self, X: np.ndarray) -> np.ndarray:
+        return self._booster.predict(X)
+
+
+class OnnxPredictor(Predictor):
+    backend = "onnx"
+
+    def _load(self, path: str) -> None:
+        import onnxruntime
+        options = onnxruntime.SessionOptions()
+        # Параллелизм даёт пул потоков приложения, а не сессия
+        options.intra_op_num_threads = 1
+        options.log_severity_level = 3
+        self._session = onnxruntime.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self._input = self._session.get_inputs()[0].name
+
+    def _predict(self, X: np.ndarray) -> np.ndarray:
+        return self._session.run(None, {self._input: X})[0]
+
+
+class LinearPredictor(Predictor):
+    backend = "linear"
+
+    def _load(self, path: str) -> None:
+        with np.load(path) as data:
+            # Коэффициенты открыты: по ним строится первый этап ранжирования (app.shortlist)
+            self.coef = np.ascontiguousarray(data["coef"], dtype=self.dtype).ravel()
+            self.intercept = self.dtype(data["intercept"])
+
+    def _predict(self, X: np.ndarray) -> np.ndarray:
+        y = X @ self.coef
+        y += self.intercept
+        return y
+
+
+class PicklePredictor(Predictor):
+    """joblib-артефакт прежнего формата: любая модель с .predict, вход float64."""
+
+    backend = "pickle"
+    dtype = np.float64
+
+    def _load(self, path: str) -> None:
+        import joblib
+        self._model = joblib.load(path)
+
+    def _predict(self, X: np.ndarray) -> np.ndarray:
+        return self._model.predict(X)
+
+
+BACKENDS = {cls.backend: cls for cls in (
+    CatBoostPredictor, LightGBMPredictor, OnnxPredictor, LinearPredictor, PicklePredictor,
+)}
+
+# Бэкенд по расширению файла, если путь указан без манифеста
+EXTENSIONS = {
+    ".cbm": "catboost",
+    ".txt": "lightgbm",
+    ".onnx": "onnx",
+    ".npz": "linear",
+    ".pkl": "pickle",
+    ".joblib": "pickle",
+}
+
+
+def read_manifest(path: str) -> dict:
+    """Манифест экспорта; file — путь к файлу модели относительно манифеста."""
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest["file"] = os.path.join(os.path.dirname(path), manifest["file"])
+    return manifest
+
+
+def load_predictor(path: str, backend: str = None) -> Predictor:
+    """
+    Загружает модель по манифесту (.json) или по расширению файла.
+
+    Args:
+        path (str): манифест экспорта или файл модели
+        backend (str): явный бэкенд (иначе — из манифеста или расширения)
+    Returns:
+        Predictor
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        manifest = read_manifest(path)
+        return load_predictor(manifest["file"], backend or manifest["backend"])
+
+    backend = backend or EXTENSIONS.get(ext)
+    if backend not in BACKENDS:
+        raise ValueError(f"Неизвестный формат модели: {path}")
+    return BACKENDS[backend](path)
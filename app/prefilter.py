@@ -0,0 +1,100 @@
+"""
+Индекс ограничений каталога: отсечение заведомо неподходящих светильников
+до сборки признаков и predict.
+
+Строится один раз при загрузке каталога. Все множества хранятся как
+упакованные битовые карты (np.packbits), пересечение — побитовое AND:
+    - тип светильника и «тип помещения → допустимые типы» (ROOM_TO_FIXTURES);
+    - IP и CRI: отсортированные уникальные значения + карта «не ниже порога»;
+    - CCT: карты по корзинам шириной cct_bucket_k.
+Бюджетное ограничение (количество × цена) зависит от помещения
+и проверяется в движке уже на оставшихся строках.
+"""
+
+import numpy as np
+
+from app.catalog import FixtureCatalog
+
+PREFILTER_MODES = ("off", "soft", "strict")
+STAGES = ("type", "ip", "cri", "cct", "budget")
+
+# Порядок ослабления в мягком режиме, если кандидатов меньше, чем нужно выдать
+RELAX_ORDER = (("cct",), ("budget",), ("ip", "cri"), ("type",))
+
+
+class ConstraintIndex:
+    """Битовые карты ограничений по каталогу FixtureCatalog."""
+
+    def __init__(self, catalog: FixtureCatalog, room_to_fixtures: dict, cct_bucket_k: int = 500):
+        self.size = len(catalog)
+        self.cct_bucket_k = cct_bucket_k
+        self.all_bits = np.packbits(np.ones(self.size, dtype=bool))
+
+        # Тип светильника → карта; тип помещения → объединение допустимых типов
+        codes = catalog.codes["тип_светильника"]
+        self._type_bits = {
+            name: np.packbits(codes == code)
+            for code, name in enumerate(catalog.vocab["тип_светильника"])
+        }
+        empty = np.zeros_like(self.all_bits)
+        self._room_bits = {}
+        for room_type, allowed in room_to_fixtures.items():
+            bits = empty.copy()
+            for ftype in allowed:
+                if ftype in self._type_bits:
+                    np.bitwise_or(bits, self._type_bits[ftype], out=bits)
+            self._room_bits[room_type] = bits
+
+        # Пороговые характеристики: «значение ≥ порога»
+        self._ip_values, self._ip_bits = self._threshold_bitmaps(catalog["ip"])
+        self._cri_values, self._cri_bits = self._threshold_bitmaps(catalog["cri"])
+
+        # CCT по корзинам
+        buckets = catalog["cct_k"] // cct_bucket_k
+        self._cct_buckets = np.unique(buckets)
+        self._cct_bits = np.stack([np.packbits(buckets == b) for b in self._cct_buckets])
+
+    @staticmethod
+    def _threshold_bitmaps(values: np.ndarray) -> tuple:
+        """Для каждого уникального значения v — карта строк со значением ≥ v."""
+        distinct = np.unique(values)
+        order = np.argsort(values, kind="stable")
+        starts = np.searchsorted(values[order], distinct, side="left")
+        bitmaps = []
+        for start in starts:
+            mask = np.zeros(len(values), dtype=bool)
+            mask[order[start:]] = True
+            bitmaps.append(np.packbits(mask))
+        return distinct, np.stack(bitmaps)
+
+    def _at_least(self, values: np.ndarray, bits: np.ndarray, threshold) -> np.ndarray:
+        k = np.searchsorted(values, threshold, side="left")
+        return bits[k] if k < len(values) else np.zeros_like(self.all_bits)
+
+    def _cct_window(self, preference: int, tolerance_k: int) -> np.ndarray:
+        """Объединение корзин, пересекающихся с [pref − tol, pref + tol]."""
+        lo = np.searchsorted(self._cct_buckets, (preference - tolerance_k) // self.cct_bucket_k, side="left")
+        hi = np.searchsorted(self._cct_buckets, (preference + tolerance_k) // self.cct_bucket_k, side="right")
+        if lo >= hi:
+            return np.zeros_like(self.all_bits)
+        return np.bitwise_or.reduce(self._cct_bits[lo:hi], axis=0)
+
+    # -------------------------
+    # Пересечение ограничений
+    # -------------------------
+    def bitmap(self, data: dict, stages: tuple, cct_tolerance_k: int) -> np.ndarray:
+        """Карта строк, проходящих все статические ограничения из stages."""
+        bits = self.all_bits.copy()
+        if "type" in stages and data["тип_помещения"] in self._room_bits:
+            np.bitwise_and(bits, self._room_bits[data["тип_помещения"]], out=bits)
+        if "ip" in stages:
+            np.bitwise_and(bits, self._at_least(self._ip_values, self._ip_bits, data["ip_min"]), out=bits)
+        if "cri" in stages:
+            np.bitwise_and(bits, self._at_least(self._cri_values, self._cri_bits, data["cri_min"]), out=bits)
+        if "cct" in stages:
+            np.bitwise_and(bits, self._cct_window(data["cct_предпочтение_k"], cct_tolerance_k), out=bits)
+        return bits
+
+    def rows(self, bits: np.ndarray) -> np.ndarray:
+        """Индексы строк каталога по битовой карте (по возрастанию)."""
+        return np.flatnonzero(np.unpackbits(bits, count=self.size))
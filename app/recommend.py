@@ -1,21 +1,31 @@
 import os
 import logging
-import pandas as pd
-import numpy as np
-import joblib
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from app.schemas import RoomInput
-
-# -------------------------
-# Настройка логирования
-# -------------------------
-logging.basicConfig(level=logging.INFO)
+from app.config import (
+    BATCH_CHUNK_ROOMS, SCORE_CACHE_SIZE, PREFILTER_MODE, PREFILTER_CCT_TOLERANCE_K,
+    PREFILTER_BUDGET_FACTOR, PREFILTER_MIN_CANDIDATES,
+    SCORING_PROCESSES, SCORING_PARALLEL_MIN_ROWS, SCORING_START_METHOD, SCORING_CHUNK_ROWS,
+    SHORTLIST_MODEL_PATH, SHORTLIST_K,
+)
+from app.registry import ArtifactRegistry, timed
+from app.metrics import stage, count_error
+from app import request_log
+
+# pandas, joblib, sklearn и catboost импортируются только при загрузке
+# артефактов (в фоне при старте), а не при импорте приложения
+if TYPE_CHECKING:
+    from app.engine import RecommenderEngine
+
+# Логирование настраивает приложение (app.request_log.setup_logging)
 logger = logging.getLogger(__name__)
 
 # -------------------------
 # Пути из окружения (.env)
 # -------------------------
-MODEL_PATH = os.getenv("MODEL_PATH", "ml/best_model.pkl")
+MODEL_PATH = os.getenv("MODEL_PATH", "ml/best_model.json")
 PREPROCESSOR_PATH = os.getenv("PREPROCESSOR_PATH", "ml/preprocessor.pkl")
 FIXTURES_PATH = os.getenv("FIXTURES_PATH", "data/fixtures.csv")
 TOP_N = int(os.getenv("TOP_N", 3))
@@ -23,105 +33,108 @@ TOP_N = int(os.getenv("TOP_N", 3))
 # -------------------------
 # Загрузка артефактов
 # -------------------------
-try:
-    model = joblib.load(MODEL_PATH)
-    preprocessor = joblib.load(PREPROCESSOR_PATH)
-    fixtures_df = pd.read_csv(FIXTURES_PATH)
-    logger.info("✅ Модель, препроцессор и каталог успешно загружены.")
-except Exception as e:
-    logger.exception(f"Ошибка загрузки артефактов: {e}")
-    raise RuntimeError("Ошибка при инициализации модели.")
+def _load_joblib(path: str):
+    import joblib
+    return joblib.load(path)
+
+
+def _load_model(path: str):
+    # Родной формат модели по манифесту, без pickle (app.predictors)
+    from app.predictors import load_predictor
+    return load_predictor(path)
+
+
+def _load_csv(path: str):
+    import pandas as pd
+    return pd.read_csv(path)
+
+
+def load_engine(
+    model_path: str, preprocessor_path: str, fixtures_path: str, timings: dict = None,
+    shortlist_path: str = None,
+) -> "RecommenderEngine":
+    """
+    Загружает модель, препроцессор и каталог параллельно и строит движок подбора.
+    shortlist_path — линейная модель первого этапа (загружается при SHORTLIST_K > 0).
+    timings — словарь, куда пишутся длительности фаз (с).
+    """
+    timings = {} if timings is None else timings
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="artifact-load") as pool:
+        model = pool.submit(timed, timings, "model", _load_model, model_path)
+        preprocessor = pool.submit(timed, timings, "preprocessor", _load_joblib, preprocessor_path)
+        fixtures = pool.submit(timed, timings, "catalog", _load_csv, fixtures_path)
+        shortlist = None
+        if shortlist_path and SHORTLIST_K > 0:
+            shortlist = pool.submit(timed, timings, "shortlist", _load_model, shortlist_path)
+        model, preprocessor, fixtures = model.result(), preprocessor.result(), fixtures.result()
+        shortlist = shortlist and shortlist.result()
+
+    from app.engine import RecommenderEngine
+    from ml.generate_data import ROOM_TO_FIXTURES
+
+    # Каталог в массивах; признаки каталога считаются один раз при загрузке
+    return timed(
+        timings, "engine", RecommenderEngine,
+        model, preprocessor, fixtures,
+        score_cache_size=SCORE_CACHE_SIZE,
+        room_to_fixtures=ROOM_TO_FIXTURES,
+        cct_tolerance_k=PREFILTER_CCT_TOLERANCE_K,
+        budget_factor=PREFILTER_BUDGET_FACTOR,
+        min_candidates=PREFILTER_MIN_CANDIDATES,
+        processes=SCORING_PROCESSES,
+        parallel_min_rows=SCORING_PARALLEL_MIN_ROWS,
+        start_method=SCORING_START_METHOD,
+        chunk_rows=SCORING_CHUNK_ROWS,
+        shortlist_model=shortlist,
+        shortlist_k=SHORTLIST_K,
+    )
+
+
+# Версии артефактов: горячая замена без перезапуска (app.registry).
+# Первая версия загружается при старте приложения в фоне (app.startup)
+registry = ArtifactRegistry(load_engine, {
+    "model": MODEL_PATH,
+    "preprocessor": PREPROCESSOR_PATH,
+    "fixtures": FIXTURES_PATH,
+    # Модель первого этапа загружается и входит в версию, только когда она включена
+    **({"shortlist": SHORTLIST_MODEL_PATH} if SHORTLIST_K > 0 else {}),
+})
 
 
 # -------------------------
-# Основная функция рекомендаций
+# Вспомогательные функции
 # -------------------------
-def recommend_luminaires(input_data):
-    try:
-        # Универсальная обработка входа (Pydantic v1/v2/dict)
-        if hasattr(input_data, "model_dump"):
-            data = input_data.model_dump(by_alias=True)
-        elif hasattr(input_data, "dict"):
-            data = input_data.dict(by_alias=True)
-        else:
-            data = input_data
-
-        df_input = pd.DataFrame([data])
-
-        # Переименование при необходимости
-        if "budget_rub" in df_input.columns:
-            df_input["бюджет_₽"] = df_input.pop("budget_rub")
-
-        # Извлечение базовых параметров
-        E = df_input["целевой_люкс"].iloc[0]
-        S = df_input["площадь_м2"].iloc[0]
-        η = 0.6  # коэффициент использования света
-        бюджет = df_input["бюджет_₽"].iloc[0]
-
-        # ----------------------------------------
-        # Расчёт количества светильников индивидуально по потоку
-        # ----------------------------------------
-        fixtures_expanded = fixtures_df.copy()
-        for col in df_input.columns:
-            fixtures_expanded[col] = df_input.iloc[0][col]
-
-        # Количество приборов
-        fixtures_expanded["количество_светильников"] = np.ceil(
-            (E * S) / (fixtures_expanded["световой_поток_лм"] * η)
-        ).clip(lower=1).astype(int)
-
-        # ----------------------------------------
-        # Инференс модели
-        # ----------------------------------------
-        X_processed = preprocessor.transform(fixtures_expanded)
-        y_pred = model.predict(X_processed)
-        fixtures_expanded["предсказанная_оценка"] = y_pred
-
-        # ----------------------------------------
-        # Инженерные расчёты
-        # ----------------------------------------
-        fixtures_expanded["итоговая_мощность_вт"] = (
-            fixtures_expanded["мощность_вт"] * fixtures_expanded["количество_светильников"]
-        ).round(1)
-        fixtures_expanded["итоговая_стоимость_₽"] = (
-            fixtures_expanded["цена_₽"] * fixtures_expanded["количество_светильников"]
-        ).round(2)
-
-        # Фактическая освещённость (лк)
-        fixtures_expanded["освещенность_лк"] = (
-            (fixtures_expanded["световой_поток_лм"] *
-             fixtures_expanded["количество_светильников"] *
-             η) / S
-        ).round(1)
-
-        # Доля от бюджета
-        fixtures_expanded["доля_бюджета_%"] = (
-            fixtures_expanded["итоговая_стоимость_₽"] / бюджет * 100
-        ).round(1)
-
-        # Оценка пересвета/недосвета
-        fixtures_expanded["уровень_освещения"] = np.where(
-            fixtures_expanded["освещенность_лк"] > E * 1.2, "пересвет",
-            np.where(fixtures_expanded["освещенность_лк"] < E * 0.8, "недосвет", "норма")
-        )
+def _normalize_input(input_data) -> dict:
+    """Приводит вход (Pydantic v1/v2/dict) к словарю с русскими ключами."""
+    if hasattr(input_data, "model_dump"):
+        data = input_data.model_dump(by_alias=True)
+    elif hasattr(input_data, "dict"):
+        data = input_data.dict(by_alias=True)
+    else:
+        data = dict(input_data)
+
+    # Переименование при необходимости
+    if "budget_rub" in data:
+        data["бюджет_₽"] = data.pop("budget_rub")
+    return data
+
+
+def _paging(data: dict) -> dict:
+    """Параметры выдачи из запроса (top_n, offset, tie_break) со значениями по умолчанию."""
+    return {
+        "top_n": data.get("top_n") or TOP_N,
+        "offset": data.get("offset") or 0,
+        "tie_break": data.get("tie_break") or "index",
+    }
+
+
+def _prefilter_mode(data: dict) -> str:
+    return data.get("prefilter") or PREFILTER_MODE
 
-        # ----------------------------------------
-        # Выбор top-N
-        # ----------------------------------------
-        top_recs = fixtures_expanded.sort_values(by="предсказанная_оценка", ascending=False).head(TOP_N)
-
-        # Поля для вывода
-        results = top_recs[[
-            "тип_светильника", "бренд", "серия",
-            "мощность_вт", "световой_поток_лм", "цена_₽",
-            "количество_светильников", "итоговая_мощность_вт",
-            "итоговая_стоимость_₽", "освещенность_лк", "уровень_освещения",
-            "доля_бюджета_%", "предсказанная_оценка"
-        ]].to_dict(orient="records")
-
-        # ----------------------------------------
-        # Текстовый summary
-        # ----------------------------------------
+
+def _format_summary(results: list) -> str:
+    """Текстовый summary по списку рекомендаций."""
+    with stage("summary"):
         summary_lines = []
         for r in results:
             line = (
@@ -132,12 +145,76 @@ def recommend_luminaires(input_data):
                 f"({r['доля_бюджета_%']}% бюджета)."
             )
             summary_lines.append(line)
+        return "\n".join(summary_lines)
+
+
+def _score_rooms(engine: "RecommenderEngine", rooms: list) -> list:
+    """Один predict на матрицу «помещения × каталог» (или на группу помещений), top-N и summary по каждому."""
+    pagings = [_paging(data) for data in rooms]
+    needs = [max(PREFILTER_MIN_CANDIDATES, p["offset"] + p["top_n"]) for p in pagings]
+    prefiltered = [
+        engine.candidates(data, _prefilter_mode(data), need)
+        for data, need in zip(rooms, needs)
+    ]
+    rows_list = [rows for rows, _ in prefiltered]
+
+    results = []
+    scored = engine.score_rooms(rooms, rows_list, needs)
+    for data, paging, (_, report), (rows, scores, counts) in zip(rooms, pagings, prefiltered, scored):
+        recs = engine.page(data, rows, scores, counts, **paging)
+        results.append({
+            "recommendations": recs,
+            "summary": _format_summary(recs),
+            "paging": dict(paging, total=report["candidates"]),
+            "prefilter": report,
+        })
+    return results
 
-        summary = "\n".join(summary_lines)
 
-        logger.info(f"✅ Успешно сформировано {len(results)} рекомендаций.")
-        return {"recommendations": results, "summary": summary}
+# -------------------------
+# Основная функция рекомендаций
+# -------------------------
+def recommend_luminaires(input_data, bundle=None):
+    """
+    Top-N рекомендаций для одного помещения.
+    bundle — версия артефактов, взятая вызывающим (по умолчанию — текущая).
+    """
+    try:
+        bundle = bundle or registry.current()
+        data = _normalize_input(input_data)
+        paging = _paging(data)
+        results, report = bundle.engine.recommend(data, prefilter=_prefilter_mode(data), **paging)
+
+        request_log.annotate(
+            candidates=report["candidates"], total=report["total"], pruning_ratio=report["pruning_ratio"]
+        )
+        return {
+            "recommendations": results,
+            "summary": _format_summary(results),
+            "paging": dict(paging, total=report["candidates"]),
+            "prefilter": report,
+            "artifact_version": bundle.version,
+        }
 
     except Exception as e:
-        logger.exception(f"Ошибка во время инференса: {e}")
+        count_error("inference")
+        request_log.exception(logger, f"Ошибка во время инференса: {e}")
         return {"error": str(e)}
+
+
+# -------------------------
+# Пакетные рекомендации (планировки с сотнями помещений)
+# -------------------------
+def recommend_batch(inputs: list, bundle=None) -> list:
+    """
+    Подбор для списка помещений. Помещения обрабатываются порциями
+    по BATCH_CHUNK_ROOMS: на каждую порцию — один transform и один predict.
+    Все порции считаются на одной версии артефактов.
+    Возвращает список результатов в порядке входа.
+    """
+    engine = (bundle or registry.current()).engine
+    rooms = [_normalize_input(item) for item in inputs]
+    results = []
+    for start in range(0, len(rooms), BATCH_CHUNK_ROOMS):
+        results.extend(_score_rooms(engine, rooms[start:start + BATCH_CHUNK_ROOMS]))
+    return results
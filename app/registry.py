@@ -0,0 +1,340 @@
+"""
+Реестр версий артефактов (модель, препроцессор, каталог) с горячей заменой.
+
+Новая версия загружается в фоне, проверяется и прогревается пробным
+подбором, после чего атомарно становится текущей. Запросы берут
+ссылку на версию один раз (registry.lease()) и дорабатывают на ней,
+даже если замена произошла посреди запроса: версия, выпавшая из пары
+«текущая/предыдущая», закрывается только после того, как её отпустит
+последний запрос. Ошибка загрузки или проверки оставляет в работе
+прежнюю версию; предыдущую можно вернуть через rollback().
+Длительности фаз загрузки и прогрева сохраняются в версии (timings).
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from app.model_utils import artifact_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Пробное помещение для проверки и прогрева новой версии
+PROBE_ROOM = {
+    "тип_помещения": "офисное помещение",
+    "площадь_м2": 40.0,
+    "высота_м": 3.0,
+    "целевой_люкс": 400,
+    "cri_min": 80,
+    "cct_предпочтение_k": 4000,
+    "ip_min": 40,
+    "бюджет_₽": 100000,
+}
+
+
+class ArtifactsNotReady(RuntimeError):
+    """Запрос пришёл до окончания первой загрузки артефактов."""
+
+
+def timed(timings: dict, phase: str, fn, *args, **kwargs):
+    """Вызывает fn и записывает длительность в timings[phase] (с)."""
+    started = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        timings[phase] = round(time.perf_counter() - started, 4)
+
+
+class ArtifactBundle:
+    """Загруженная версия: движок и метаданные."""
+
+    def __init__(self, version: str, engine, paths: dict, load_seconds: float, timings: dict = None):
+        self.version = version
+        self.engine = engine
+        self.paths = paths
+        self.load_seconds = load_seconds
+        self.timings = timings or {}
+        self.loaded_at = time.time()
+
+        # Сколько запросов работает на версии; выведенная из работы закрывается,
+        # когда счётчик дойдёт до нуля
+        self._lock = threading.Lock()
+        self._users = 0
+        self._retired = False
+        self._closed = False
+
+    def info(self) -> dict:
+        return {
+            "version": self.version,
+            "paths": self.paths,
+            "catalog_size": len(self.engine.catalog),
+            "load_seconds": round(self.load_seconds, 3),
+            "timings": self.timings,
+            "loaded_at": self.loaded_at,
+        }
+
+    def acquire(self) -> "ArtifactBundle":
+        with self._lock:
+            if self._closed:
+                raise ArtifactsNotReady(f"Версия артефактов {self.version} уже закрыта.")
+            self._users += 1
+        return self
+
+    def release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            drained = self._retired and self._users == 0 and not self._closed
+        if drained:
+            self.close()
+
+    @contextmanager
+    def hold(self):
+        """with bundle.hold(): ... — версия не закрывается, пока блок выполняется."""
+        self.acquire()
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def call(self, fn, *args):
+        """
+        fn(*args) под hold() — для задач пула инференса: задача может
+        дорабатывать после таймаута запроса, и версия не закроется под ней.
+        """
+        with self.hold():
+            return fn(*args)
+
+    def retire(self) -> None:
+        """Выводит версию из работы: закрывается сразу или после последнего запроса."""
+        with self._lock:
+            self._retired = True
+            drained = self._users == 0 and not self._closed
+        if drained:
+            self.close()
+
+    def close(self) -> None:
+        """Освобождает ресурсы движка (пул процессов, общую память)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self.engine.close()
+
+
+class ArtifactRegistry:
+    """Текущая и предыдущая версии артефактов, перезагрузка и откат."""
+
+    def __init__(self, loader, paths: dict):
+        """
+        Args:
+            loader: функция (model_path, preprocessor_path, fixtures_path, timings,
+                shortlist_path=None) -> движок
+            paths (dict): пути артефактов по умолчанию; версия — отпечаток всех путей
+        """
+        self._loader = loader
+        self.paths = dict(paths)
+
+        self._current = None
+        self._previous = None
+        self._swap_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._watcher = None
+        self._stop = threading.Event()
+        self.last_error = None
+
+    # -------------------------
+    # Доступ к текущей версии
+    # -------------------------
+    def current(self) -> ArtifactBundle:
+        bundle = self._current
+        if bundle is None:
+            raise ArtifactsNotReady("Артефакты модели ещё не загружены.")
+        return bundle
+
+    @contextmanager
+    def lease(self):
+        """
+        with registry.lease() as bundle: ... — текущая версия на время запроса.
+        Взятая версия не закрывается до выхода из блока, даже если её заменили.
+        """
+        with self._swap_lock:
+            bundle = self.current().acquire()
+        try:
+            yield bundle
+        finally:
+            bundle.release()
+
+    @property
+    def version(self) -> str:
+        return self._current.version if self._current else None
+
+    # -------------------------
+    # Загрузка, проверка, замена
+    # -------------------------
+    def build(self, paths: dict = None) -> ArtifactBundle:
+        """Загружает, проверяет и прогревает версию, не делая её текущей."""
+        paths = dict(self.paths, **(paths or {}))
+        started = time.perf_counter()
+        timings = {}
+        version = artifact_fingerprint(*paths.values())
+        engine = self._loader(
+            paths["model"], paths["preprocessor"], paths["fixtures"], timings,
+            shortlist_path=paths.get("shortlist"),
+        )
+        try:
+            timed(timings, "warmup", self._warmup, engine)
+        except Exception:
+            engine.close()
+            raise
+        return ArtifactBundle(version, engine, paths, time.perf_counter() - started, timings)
+
+    @staticmethod
+    def _warmup(engine) -> None:
+        """
+        Проверка и прогрев: пробный подбор по всем путям запроса (весь каталог,
+        предфильтр, пакетный predict), чтобы первые запросы не платили
+        за первый вызов модели.
+        """
+        records, _ = engine.recommend(PROBE_ROOM, 1)
+        if not records or records[0]["предсказанная_оценка"] != records[0]["предсказанная_оценка"]:
+            raise ValueError("Пробный подбор новой версии вернул пустой или некорректный результат.")
+        engine.recommend(PROBE_ROOM, 1, prefilter="soft")
+        engine.score_many([PROBE_ROOM])
+
+    def activate(self, bundle: ArtifactBundle) -> ArtifactBundle:
+        """
+        Атомарная замена текущей версии (предыдущая сохраняется для отката).
+        Версия, выпавшая из пары «текущая/предыдущая», выводится из работы
+        и закрывается, когда её отпустят запросы. Если версия не изменилась,
+        в работе остаётся текущая, а новая копия закрывается.
+        Returns:
+            ArtifactBundle: активная версия
+        """
+        with self._swap_lock:
+            current = self._current
+            unchanged = current is not None and current.version == bundle.version
+            if unchanged:
+                dropped, bundle = bundle, current
+            else:
+                dropped, self._previous = self._previous, current
+                self._current = bundle
+        if dropped is not None and dropped is not bundle:
+            dropped.retire()
+        if unchanged:
+            logger.info(f"✅ Версия артефактов {bundle.version} уже активна, замена не нужна.")
+        else:
+            logger.info(f"🔄 Активна версия артефактов {bundle.version}.")
+        return bundle
+
+    def reload(self, paths: dict = None) -> ArtifactBundle:
+        """
+        Синхронная перезагрузка. При ошибке текущая версия остаётся в работе,
+        ошибка сохраняется в last_error и пробрасывается вызывающему.
+        Файлы не изменились (тот же отпечаток) — версия не загружается заново.
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            raise RuntimeError("Перезагрузка артефактов уже выполняется.")
+        try:
+            target = dict(self.paths, **(paths or {}))
+            current = self._current
+            if current is not None and current.paths == target and self._fingerprint(target) == current.version:
+                logger.info(f"✅ Артефакты не изменились, в работе остаётся {current.version}.")
+                self.last_error = None
+                return current
+            bundle = self.activate(self.build(paths))
+            self.last_error = None
+            if paths:
+                self.paths.update(paths)
+            return bundle
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            logger.exception(f"Ошибка загрузки новой версии, в работе остаётся {self.version}:")
+            raise
+        finally:
+            self._reload_lock.release()
+
+    def reload_in_background(self, paths: dict = None) -> bool:
+        """Запускает перезагрузку в фоновом потоке; False — если она уже идёт."""
+        if self._reload_lock.locked():
+            return False
+
+        def run():
+            try:
+                self.reload(paths)
+            except Exception:
+                pass  # ошибка уже записана в last_error
+
+        threading.Thread(target=run, name="artifact-reload", daemon=True).start()
+        return True
+
+    @property
+    def reloading(self) -> bool:
+        return self._reload_lock.locked()
+
+    def rollback(self) -> ArtifactBundle:
+        """Возврат к предыдущей версии (текущая становится предыдущей)."""
+        with self._swap_lock:
+            if self._previous is None:
+                raise RuntimeError("Нет предыдущей версии для отката.")
+            self._current, self._previous = self._previous, self._current
+            bundle = self._current
+        logger.info(f"↩️ Откат на версию артефактов {bundle.version}.")
+        return bundle
+
+    # -------------------------
+    # Отслеживание файлов
+    # -------------------------
+    def _fingerprint(self, paths: dict = None) -> str:
+        paths = paths or self.paths
+        try:
+            return artifact_fingerprint(*paths.values())
+        except (OSError, ValueError, KeyError):
+            # Файл ещё пишется или манифест недописан — версия не определена
+            return None
+
+    def start_watcher(self, interval_s: float) -> None:
+        """
+        Опрос файлов раз в interval_s. Перезагрузка запускается, когда отпечаток
+        отличается от активной версии и не менялся между двумя опросами
+        (файл дописан целиком).
+        """
+        if interval_s <= 0 or self._watcher is not None:
+            return
+
+        def watch():
+            pending, attempted = None, None
+            while not self._stop.wait(interval_s):
+                fingerprint = self._fingerprint()
+                if fingerprint is None or fingerprint in (self.version, attempted):
+                    pending = None
+                    continue
+                if fingerprint == pending and not self.reloading:
+                    logger.info(f"👀 Артефакты изменились на диске ({fingerprint}), перезагрузка.")
+                    self.reload_in_background()
+                    pending, attempted = None, fingerprint
+                else:
+                    pending = fingerprint
+
+        self._watcher = threading.Thread(target=watch, name="artifact-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        """Закрывает загруженные версии (при остановке приложения)."""
+        with self._swap_lock:
+            bundles = [b for b in (self._current, self._previous) if b is not None]
+            self._current = self._previous = None
+        for bundle in bundles:
+            bundle.close()
+
+    def status(self) -> dict:
+        return {
+            "current": self._current.info() if self._current else None,
+            "previous": self._previous.info() if self._previous else None,
+            "reloading": self.reloading,
+            "last_error": self.last_error,
+            "on_disk": self._fingerprint(),
+        }
@@ -0,0 +1,190 @@
+"""
+Журнал запросов: одна структурированная запись на запрос через очередь.
+
+Обработчики не пишут в лог по строке на каждый шаг: middleware заводит
+RequestLog (id запроса, метод, путь), код подбора добавляет в него поля
+(annotate — вход, разобранные параметры, число кандидатов) и длительности
+этапов (app.metrics.stage), а по завершении запроса в очередь уходит одна
+запись. Сборка JSON и вывод выполняются в фоновом потоке QueueListener —
+запрос не ждёт ни форматирования, ни записи в поток.
+
+Успешные запросы попадают в лог с вероятностью LOG_SAMPLE_RATE, ошибки
+(статус >= 400 или исключение) — всегда, с трассировкой. Ожидаемые отказы
+(expect — 503, пока артефакты загружаются) пишутся как успешные: INFO,
+по выборке, без записей для служебных эндпоинтов.
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import uuid
+
+from app.config import LOG_LEVEL, LOG_SAMPLE_RATE, LOG_QUEUE_SIZE
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+# Служебные эндпоинты: успешные ответы не логируются (опрос балансировщика, Prometheus)
+QUIET_PATHS = frozenset({"/health", "/ready", "/metrics"})
+
+logger = logging.getLogger("app.requests")
+
+_current = contextvars.ContextVar("request_log", default=None)
+_listener = None
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler без форматирования в вызывающем потоке: сообщение
+    собирается при записи в фоновом потоке. Записи с исключением
+    форматируются сразу (кадры стека не удерживаются до записи).
+    При заполненной очереди INFO и ниже отбрасываются, предупреждения
+    и ошибки ждут места.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info:
+            return super().prepare(record)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def setup_logging(level: str = LOG_LEVEL) -> None:
+    """
+    Корневой логгер пишет через очередь и фоновый поток.
+    Как logging.basicConfig: если логирование уже настроено — ничего не делает.
+    """
+    global _listener
+    root = logging.getLogger()
+    if _listener is not None or root.handlers:
+        return
+
+    output = logging.StreamHandler()
+    output.setFormatter(logging.Formatter(LOG_FORMAT))
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    root.addHandler(_LazyQueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+# -------------------------
+# Запись запроса
+# -------------------------
+class RequestLog:
+    """Поля и длительности этапов одного запроса."""
+
+    __slots__ = ("request_id", "method", "path", "fields", "stages", "error", "exc_info", "expected")
+
+    def __init__(self, method: str, path: str, request_id: str = None):
+        self.request_id = request_id or uuid.uuid4().hex[:16]
+        self.method = method
+        self.path = path
+        self.fields = {}
+        self.stages = {}
+        self.error = None
+        self.exc_info = None
+        self.expected = None
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+
+class _Entry:
+    """Снимок записи; JSON собирается только при выводе (в фоновом потоке)."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: dict):
+        self.data = data
+
+    def __str__(self) -> str:
+        return json.dumps(self.data, ensure_ascii=False, default=str)
+
+
+def begin(method: str, path: str, request_id: str = None) -> tuple:
+    """Заводит запись текущего запроса; (RequestLog, токен для finish)."""
+    entry = RequestLog(method, path, request_id)
+    return entry, _current.set(entry)
+
+
+def current() -> RequestLog:
+    return _current.get()
+
+
+def annotate(**fields) -> None:
+    """Добавляет поля в запись текущего запроса (вне запроса — ничего)."""
+    entry = _current.get()
+    if entry is not None:
+        entry.fields.update(fields)
+
+
+def exception(log: logging.Logger, message: str) -> None:
+    """
+    Ошибка внутри запроса — в его запись с трассировкой (запись выводится
+    всегда); вне запроса — сразу log.exception(message).
+    """
+    entry = _current.get()
+    if entry is None:
+        log.exception(message)
+        return
+    entry.error = message
+    entry.exc_info = sys.exc_info()
+
+
+def expect(reason: str) -> None:
+    """
+    Отказ текущего запроса ожидаем (например, 503 до загрузки артефактов):
+    статус >= 400 не считается ошибкой журнала.
+    """
+    entry = _current.get()
+    if entry is not None:
+        entry.expected = reason
+
+
+def finish(entry: RequestLog, token, status: int, seconds: float, route: str = None) -> None:
+    """Закрывает запись запроса и отправляет её в очередь (с учётом выборки)."""
+    _current.reset(token)
+    failed = (status >= 400 and entry.expected is None) or entry.error is not None
+    if not failed and ((route or entry.path) in QUIET_PATHS or random.random() >= LOG_SAMPLE_RATE):
+        return
+
+    if not failed:
+        level = logging.INFO
+    else:
+        level = logging.ERROR if status >= 500 or entry.error else logging.WARNING
+    if not logger.isEnabledFor(level):
+        return
+
+    data = {
+        "request_id": entry.request_id,
+        "method": entry.method,
+        "path": entry.path,
+        "status": status,
+        "duration_ms": round(seconds * 1000, 3),
+        "stages_ms": {name: round(s * 1000, 3) for name, s in list(entry.stages.items())},
+        **dict(entry.fields),
+    }
+    if entry.error:
+        data["error"] = entry.error
+    if entry.expected:
+        data["expected"] = entry.expected
+    logger.log(level, "🧾 %s", _Entry(data), exc_info=entry.exc_info)
@@ -0,0 +1,91 @@
+"""
+Быстрая JSON-сериализация ответов API.
+
+Ответы подбора — уже примитивы Python (engine.records собирает их через
+.tolist()), поэтому их достаточно один раз закодировать в UTF-8 JSON без
+jsonable_encoder и повторной валидации pydantic:
+    - orjson, если установлен (numpy-массивы и скаляры — напрямую);
+    - иначе pydantic_core.to_json — тот же Rust-кодировщик, что у pydantic
+      (зависимость FastAPI, есть всегда);
+    - json — стандартная библиотека, как у JSONResponse (для сравнения).
+Кодировщик выбирается JSON_ENCODER (auto — лучший доступный).
+NaN и ±inf кодируются как null (JSONResponse на них падает с ValueError).
+"""
+
+import json
+import math
+from typing import Callable
+
+import numpy as np
+import pydantic_core
+from starlette.responses import JSONResponse
+
+from app.config import JSON_ENCODER
+from app.metrics import stage
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value):
+    """Типы, которых нет в JSON: numpy — через tolist(), остальное — строкой."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return str(value)
+
+
+def _orjson(content) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+def _pydantic(content) -> bytes:
+    return pydantic_core.to_json(content, inf_nan_mode="null", fallback=_default)
+
+
+def _finite(value):
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _json(content) -> bytes:
+    try:
+        text = json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default)
+    except ValueError:
+        text = json.dumps(_finite(content), ensure_ascii=False, separators=(",", ":"), default=_default)
+    return text.encode("utf-8")
+
+
+ENCODERS = {"orjson": _orjson, "pydantic": _pydantic, "json": _json}
+if orjson is None:
+    del ENCODERS["orjson"]
+
+
+def get_encoder(name: str = "auto") -> Callable:
+    """Кодировщик по имени; auto — orjson, если установлен, иначе pydantic."""
+    if name == "auto":
+        name = "orjson" if orjson is not None else "pydantic"
+    if name not in ENCODERS:
+        raise ValueError(f"Неизвестный или неустановленный JSON_ENCODER: {name!r} (доступны: {', '.join(ENCODERS)})")
+    return ENCODERS[name]
+
+
+dumps = get_encoder(JSON_ENCODER)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON-ответ через dumps (orjson / pydantic_core): время сериализации —
+    этап serialize в /metrics. Тело кодируется при создании ответа, поэтому
+    ответ, собранный в пуле инференса, не нагружает цикл событий.
+    """
+
+    def render(self, content) -> bytes:
+        with stage("serialize"):
+            return dumps(content)
@@ -1,5 +1,9 @@
+from typing import List, Literal, Optional
+
 from pydantic import BaseModel, Field
 
+from app.config import TOP_N_MAX
+
 class RoomInput(BaseModel):
     тип_помещения: str
     площадь_м2: float
@@ -10,14 +14,69 @@ class RoomInput(BaseModel):
     ip_min: int
     budget_rub: int = Field(..., alias="бюджет_₽")
 
+    # Параметры выдачи: размер страницы, смещение и порядок при равных оценках
+    top_n: Optional[int] = Field(None, ge=1, le=TOP_N_MAX)
+    offset: int = Field(0, ge=0)
+    tie_break: Literal["index", "price", "efficiency"] = "index"
+    # Предфильтр каталога; по умолчанию — PREFILTER_MODE из окружения
+    prefilter: Optional[Literal["off", "soft", "strict"]] = None
+
     class Config:
         populate_by_name = True  # Позволяет использовать оба варианта названия
 
 
+# --------------------------------------------------------------
+# Ответы подбора. Описывают контракт (OpenAPI /docs); эндпоинты отдают
+# готовый FastJSONResponse, и FastAPI не валидирует и не обходит ответ
+# повторно — записи собирает engine.records в этом же формате; совпадение
+# проверяет tests/test_api_responses.py.
+# --------------------------------------------------------------
 class Recommendation(BaseModel):
-    бренд: str
     тип_светильника: str
+    бренд: str
     серия: str
-    оценка: float
+    мощность_вт: float
+    световой_поток_лм: float
+    price_rub: float = Field(..., alias="цена_₽")
     количество_светильников: int
-    ориентировочная_цена: float
\ No newline at end of file
+    итоговая_мощность_вт: float
+    total_cost_rub: float = Field(..., alias="итоговая_стоимость_₽")
+    освещенность_лк: float
+    уровень_освещения: str
+    budget_share_pct: float = Field(..., alias="доля_бюджета_%")
+    предсказанная_оценка: float
+
+    class Config:
+        populate_by_name = True
+
+
+class Paging(BaseModel):
+    top_n: int
+    offset: int
+    tie_break: Literal["index", "price", "efficiency"]
+    total: int
+
+
+class PrefilterReport(BaseModel):
+    mode: Literal["off", "soft", "strict"]
+    candidates: int
+    total: int
+    pruning_ratio: float
+    relaxed: List[str]
+
+
+class RoomRecommendations(BaseModel):
+    recommendations: List[Recommendation]
+    summary: str
+    advice: str
+    paging: Optional[Paging] = None
+    prefilter: Optional[PrefilterReport] = None
+
+
+class RecommendResponse(RoomRecommendations):
+    artifact_version: str
+
+
+class BatchRecommendResponse(BaseModel):
+    results: List[RoomRecommendations]
+    artifact_version: str
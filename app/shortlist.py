@@ -0,0 +1,45 @@
+"""
+Двухэтапное ранжирование: дешёвая линейная модель по всему набору
+кандидатов, полная модель — только по короткому списку из K лучших.
+
+Линейная модель (Ridge/Lasso из ml/train_models.py, экспорт .npz) на входе
+того же препроцессора раскладывается на блоки признаков: вклад строк
+каталога считается один раз при загрузке (произведение блока каталога
+на коэффициенты), вклад помещения одинаков для всех строк и на порядок
+не влияет, а количество светильников входит с одним весом. На запрос
+оценка первого этапа — выборка по индексам и одно сложение на строку,
+после чего top-K отбирается частичным разбором (argpartition).
+
+Насколько короткий список теряет выдачу полной модели (recall@N
+для разных K) — python -m benchmarks.shortlist.
+"""
+
+import numpy as np
+
+from app.features import FeatureAssembler
+
+
+class LinearShortlist:
+    """Первый этап ранжирования по коэффициентам линейной модели."""
+
+    def __init__(self, predictor, features: FeatureAssembler):
+        coef = getattr(predictor, "coef", None)
+        if coef is None:
+            raise ValueError(f"Первый этап требует линейную модель, а не {getattr(predictor, 'backend', predictor)!r}")
+        if coef.size != features.n_features:
+            raise ValueError(f"Признаков у модели первого этапа {coef.size}, у препроцессора {features.n_features}")
+        self.predictor = predictor
+        self.fixture_scores, self.count_weight = features.linear_parts(coef)
+
+    def scores(self, rows: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """Оценки первого этапа (с точностью до сдвига, общего для помещения)."""
+        scores = self.fixture_scores[rows]
+        scores += self.count_weight * counts
+        return scores
+
+    def top(self, rows: np.ndarray, counts: np.ndarray, k: int) -> np.ndarray:
+        """k строк с лучшей оценкой первого этапа, в порядке каталога."""
+        if rows.size <= k:
+            return rows
+        part = np.argpartition(-self.scores(rows, counts), k - 1)[:k]
+        return rows[np.sort(part)]
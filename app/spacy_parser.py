@@ -6,16 +6,46 @@
 # ==============================================================
 
 import re
-import spacy
+import threading
+
+from app.config import SPACY_MODEL, NLP_BATCH_SIZE, NLP_PROCESSES, LEMMA_CACHE_SIZE
 
 # -------------------------
-# Инициализация SpaCy
+# Инициализация SpaCy (отложенная)
 # -------------------------
-try:
-    nlp = spacy.load("ru_core_news_sm")
-except Exception as e:
-    nlp = None
-    print("⚠️ SpaCy model not loaded:", e)
+# Модель загружается при старте приложения в фоне (app.startup)
+# или при первом разборе — но не при импорте модуля
+nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+# Парсеру нужны только леммы: синтаксический разбор и сущности не грузятся.
+# Остаются tok2vec, morphologizer и attribute_ruler — лемматизатор
+# ru_core_news_sm (pymorphy3) выбирает разбор по части речи
+EXCLUDED_COMPONENTS = ["parser", "senter", "ner"]
+
+# Лемма по форме слова: повторяющиеся слова не гоняют конвейер заново
+_lemma_cache = {}
+# Кэш лемм — один на процесс; блокировка — только на его чтение и запись,
+# токенизатор и конвейер nlp из пула потоков работают без неё
+_lemma_lock = threading.Lock()
+
+
+def load_nlp():
+    """Загружает модель SpaCy один раз; при ошибке парсер работает без неё."""
+    global nlp, _nlp_loaded
+    if _nlp_loaded:
+        return nlp
+    with _nlp_lock:
+        if not _nlp_loaded:
+            try:
+                import spacy
+                nlp = spacy.load(SPACY_MODEL, exclude=EXCLUDED_COMPONENTS)
+            except Exception as e:
+                nlp = None
+                print("⚠️ SpaCy model not loaded:", e)
+            _nlp_loaded = True
+    return nlp
 
 
 # -------------------------
@@ -42,25 +72,98 @@ ROOM_TYPES = {
 }
 
 
+# -------------------------
+# Леммы с кэшем по форме слова
+# -------------------------
+def _clean(text: str) -> str:
+    return text.lower().replace(",", ".")
+
+
+def _words(nlp, text_clean: str) -> list:
+    """Слова сообщения — только токенизатор, без модели."""
+    return [token.text for token in nlp.tokenizer(text_clean) if token.is_alpha]
+
+
+def _cached_lemmas(words: list):
+    """Леммы слов из кэша или None, если есть незнакомая форма."""
+    lemmas = []
+    with _lemma_lock:
+        for word in words:
+            lemma = _lemma_cache.get(word)
+            if lemma is None:
+                return None
+            lemmas.append(lemma)
+    return lemmas
+
+
+def _remember(doc) -> list:
+    """Леммы слов разобранного документа; формы запоминаются в кэше."""
+    pairs = [(token.text, token.lemma_) for token in doc if token.is_alpha]
+    if LEMMA_CACHE_SIZE:
+        with _lemma_lock:
+            if len(_lemma_cache) >= LEMMA_CACHE_SIZE:
+                _lemma_cache.clear()
+            _lemma_cache.update(pairs)
+    return [lemma for _, lemma in pairs]
+
+
+def _room_type(lemmas: list) -> str:
+    for lemma in lemmas:
+        if lemma in ROOM_TYPES:
+            return ROOM_TYPES[lemma]
+    return "офисное помещение"
+
+
 # -------------------------
 # Основная функция парсера
 # -------------------------
 def parse_room_params_spacy(text: str):
-    text_clean = text.lower().replace(",", ".")
-    room_type = None
+    text_clean = _clean(text)
+    lemmas = []
 
     # --- 1. Определение типа помещения через SpaCy ---
+    nlp = load_nlp()
     if nlp:
-        doc = nlp(text_clean)
-        for token in doc:
-            lemma = token.lemma_
-            if lemma in ROOM_TYPES:
-                room_type = ROOM_TYPES[lemma]
-                break
+        lemmas = _cached_lemmas(_words(nlp, text_clean))
+        if lemmas is None:
+            lemmas = _remember(nlp(text_clean))
+
+    return _extract_params(text_clean, _room_type(lemmas))
+
 
-    if not room_type:
-        room_type = "офисное помещение"
+def parse_many(texts: list, batch_size: int = NLP_BATCH_SIZE, n_process: int = NLP_PROCESSES) -> list:
+    """
+    Разбор пачки сообщений (импорт истории чата). Сообщения со знакомыми
+    словами берут леммы из кэша, остальные идут через nlp.pipe пачками
+    по batch_size в n_process процессах. Кэш пополняется после каждой
+    порции, поэтому следующие порции чаще обходятся без конвейера.
+    Результаты — в порядке входа.
+    """
+    cleaned = [_clean(text) for text in texts]
+    lemmas = [[] for _ in cleaned]
 
+    nlp = load_nlp()
+    if nlp:
+        chunk = batch_size * max(n_process, 1)
+        for start in range(0, len(cleaned), chunk):
+            pending = []
+            for i in range(start, min(start + chunk, len(cleaned))):
+                cached = _cached_lemmas(_words(nlp, cleaned[i]))
+                if cached is None:
+                    pending.append(i)
+                else:
+                    lemmas[i] = cached
+            docs = nlp.pipe((cleaned[i] for i in pending), batch_size=batch_size, n_process=n_process)
+            for i, doc in zip(pending, docs):
+                lemmas[i] = _remember(doc)
+
+    return [_extract_params(text_clean, _room_type(words)) for text_clean, words in zip(cleaned, lemmas)]
+
+
+# -------------------------
+# Числовые параметры (регулярные выражения)
+# -------------------------
+def _extract_params(text_clean: str, room_type: str) -> dict:
     # --- 2. Площадь ---
     area = None
     area_patterns = [
@@ -0,0 +1,96 @@
+"""
+Запуск сервиса: фоновая загрузка артефактов и SpaCy, прогрев, готовность.
+
+Импорт приложения не трогает тяжёлые модули. При старте (lifespan FastAPI)
+в фоне параллельно загружаются модель, препроцессор, каталог и модель SpaCy,
+затем выполняются пробные подбор и разбор текста. /health отвечает сразу
+(процесс жив), /ready — только после прогрева; до этого запросы
+к подбору получают 503. Длительность каждой фазы попадает в /ready и в лог.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app import spacy_parser
+from app.config import ARTIFACT_WATCH_INTERVAL_S
+from app.recommend import registry
+from app.registry import timed
+
+logger = logging.getLogger(__name__)
+
+# Пробный запрос для прогрева парсера
+PROBE_MESSAGE = "Подбери освещение для офиса 45 м², высота 3.2, бюджет 20000"
+
+
+class Startup:
+    """Состояние запуска: фазы с длительностями, готовность, ошибка."""
+
+    def __init__(self):
+        self.phases = {}
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._thread = None
+        self._done = threading.Event()
+
+    def begin(self) -> None:
+        """Запускает загрузку и прогрев в фоновом потоке (повторный вызов игнорируется)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self.run, name="startup", daemon=True)
+        self._thread.start()
+
+    def run(self) -> None:
+        """Загрузка и прогрев в текущем потоке."""
+        self.started_at = time.perf_counter()
+        try:
+            # Артефакты и SpaCy независимы — грузятся одновременно
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup") as pool:
+                artifacts = pool.submit(registry.build)
+                parser = pool.submit(timed, self.phases, "nlp", spacy_parser.load_nlp)
+                bundle = artifacts.result()
+                parser.result()
+
+            registry.activate(bundle)
+            self.phases.update(bundle.timings)
+            timed(self.phases, "parser_warmup", spacy_parser.parse_room_params_spacy, PROBE_MESSAGE)
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+            logger.exception("❌ Ошибка при запуске сервиса:")
+        finally:
+            self.finished_at = time.perf_counter()
+            self.phases["total"] = round(self.finished_at - self.started_at, 4)
+            self._done.set()
+            # Наблюдатель стартует и после ошибки: исправленные файлы подхватятся сами
+            registry.start_watcher(ARTIFACT_WATCH_INTERVAL_S)
+
+        if self.ready:
+            breakdown = ", ".join(f"{name} {seconds:.2f}" for name, seconds in self.phases.items())
+            logger.info(f"🚀 Сервис готов (версия {registry.version}), фазы, с: {breakdown}")
+
+    def wait(self, timeout: float = None) -> bool:
+        """Ждёт окончания запуска; True — если сервис готов."""
+        self._done.wait(timeout)
+        return self.ready
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set() and registry.version is not None
+
+    def status(self) -> dict:
+        if not self._done.is_set():
+            state = "loading" if self.started_at is not None else "idle"
+        else:
+            state = "ready" if self.ready else "failed"
+        return {
+            "status": state,
+            "artifact_version": registry.version,
+            "nlp_loaded": spacy_parser.nlp is not None,
+            "phases": self.phases,
+            "error": self.error,
+        }
+
+
+startup = Startup()
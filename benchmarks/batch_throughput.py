@@ -0,0 +1,60 @@
+# ==============================================================
+# Бенчмарк: пакетный подбор против цикла по одному помещению
+# Запуск: python -m benchmarks.batch_throughput --rooms 200
+# ==============================================================
+
+import argparse
+import logging
+import time
+
+import pandas as pd
+
+from app.recommend import recommend_luminaires, recommend_batch
+from app.startup import startup
+
+ROOM_COLUMNS = [
+    "тип_помещения", "площадь_м2", "высота_м", "целевой_люкс",
+    "cri_min", "cct_предпочтение_k", "ip_min", "бюджет_₽"
+]
+
+
+def load_rooms(n_rooms: int, path: str = "data/rooms.csv") -> list:
+    """Сценарии помещений из датасета (с повтором, если нужно больше)."""
+    df = pd.read_csv(path)[ROOM_COLUMNS]
+    df = pd.concat([df] * (n_rooms // len(df) + 1), ignore_index=True).head(n_rooms)
+    return df.to_dict(orient="records")
+
+
+def run(n_rooms: int, repeats: int) -> None:
+    rooms = load_rooms(n_rooms)
+
+    # Прогрев (первый predict дороже последующих)
+    recommend_batch(rooms[:2])
+
+    loop_times, batch_times = [], []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        for room in rooms:
+            recommend_luminaires(room)
+        loop_times.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        recommend_batch(rooms)
+        batch_times.append(time.perf_counter() - t0)
+
+    loop_best, batch_best = min(loop_times), min(batch_times)
+    print(f"Помещений: {n_rooms}, повторов: {repeats}")
+    print(f"Цикл по одному: {loop_best:.3f} с  ({n_rooms / loop_best:.1f} помещений/с)")
+    print(f"Пакетный подбор: {batch_best:.3f} с  ({n_rooms / batch_best:.1f} помещений/с)")
+    print(f"Ускорение: ×{loop_best / batch_best:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Пакетный подбор против цикла по одному помещению")
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    startup.run()
+    run(args.rooms, args.repeats)
@@ -0,0 +1,86 @@
+# ==============================================================
+# Бенчмарк: массивный движок каталога против копирования DataFrame
+# Латентность и пиковое выделение памяти на запрос для каталога
+# из data/fixtures.csv и синтетического каталога (ml.generate_data)
+# Запуск: python -m benchmarks.catalog_engine --sizes 240 100000
+# ==============================================================
+
+import argparse
+import logging
+import random
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from app import recommend as rec
+from app.engine import RecommenderEngine
+from app.startup import startup
+from benchmarks.batch_throughput import load_rooms
+from benchmarks.feature_cache import expand_catalog
+
+
+def legacy_recommend(model, preprocessor, fixtures_df: pd.DataFrame, data: dict, top_n: int) -> list:
+    """Прежний путь: копия каталога, полный transform, sort_values и to_dict."""
+    expanded = expand_catalog(fixtures_df, data)
+    expanded["предсказанная_оценка"] = model.predict(preprocessor.transform(expanded))
+    expanded["итоговая_стоимость_₽"] = (expanded["цена_₽"] * expanded["количество_светильников"]).round(2)
+    top = expanded.sort_values(by="предсказанная_оценка", ascending=False).head(top_n)
+    return top.to_dict(orient="records")
+
+
+def load_catalog(size: int) -> pd.DataFrame:
+    base = pd.read_csv(rec.FIXTURES_PATH)
+    if size == len(base):
+        return base
+    from ml.generate_data import generate_products
+    random.seed(42)
+    np.random.seed(42)
+    return generate_products(n_records=size)
+
+
+def measure(fn, rooms: list) -> tuple:
+    """Медиана латентности (мс) и средний пик выделенной памяти (КБ) на запрос."""
+    fn(rooms[0])  # прогрев
+    times = []
+    for room in rooms:
+        t0 = time.perf_counter()
+        fn(room)
+        times.append(time.perf_counter() - t0)
+
+    # Память — отдельным проходом: tracemalloc искажает время
+    peaks = []
+    for room in rooms:
+        tracemalloc.start()
+        fn(room)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return np.median(times) * 1000, np.mean(peaks) / 1024
+
+
+def run(sizes: list, n_rooms: int) -> None:
+    rooms = [rec._normalize_input(r) for r in load_rooms(n_rooms)]
+    base = rec.registry.current().engine
+    print(f"{'каталог':>10} | {'путь':<10} | {'медиана, мс':>12} | {'пик памяти, КБ':>15}")
+    for size in sizes:
+        fixtures_df = load_catalog(size)
+        engine = RecommenderEngine(base.model, base.preprocessor, fixtures_df)
+        paths = {
+            "DataFrame": lambda d: legacy_recommend(base.model, base.preprocessor, fixtures_df, d, rec.TOP_N),
+            "движок": lambda d: engine.recommend(d, rec.TOP_N),
+        }
+        for name, fn in paths.items():
+            latency, peak = measure(fn, rooms)
+            print(f"{size:>10} | {name:<10} | {latency:>12.2f} | {peak:>15.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Массивный движок каталога против DataFrame")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[240, 100_000])
+    parser.add_argument("--rooms", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    startup.run()
+    run(args.sizes, args.rooms)
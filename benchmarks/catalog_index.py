@@ -0,0 +1,86 @@
+# ==============================================================
+# Бенчмарк: витрина каталога (app.catalog_index.CatalogIndex)
+# Латентность типичных запросов GET /catalog без HTTP: фильтры, фасеты,
+# страница по курсору и записи страницы; рядом — тот же отбор через
+# pandas. Построение индекса (один раз на версию каталога) — отдельно.
+# Запуск: python -m benchmarks.catalog_index --sizes 240 100000
+# ==============================================================
+
+import argparse
+import time
+
+import numpy as np
+
+from app.catalog import FixtureCatalog
+from app.catalog_index import CatalogIndex
+from benchmarks.catalog_engine import load_catalog
+
+QUERIES = {
+    "без фильтров": {},
+    "тип": {"type": ["потолочный панель"]},
+    "тип + бренд + цена": {"type": ["потолочный панель", "потолочный линейный"], "brand": ["Gauss"], "price_max": 8000},
+    "диапазоны": {"power_min": 20, "power_max": 60, "flux_min": 2000, "cri_min": 85, "cct_min": 3000, "cct_max": 5000},
+    "всё сразу": {
+        "type": ["потолочный даунлайт"], "brand": ["Gauss", "Feron"], "price_min": 1000, "price_max": 20000,
+        "cri_min": 80, "ip_min": 30,
+    },
+}
+
+
+def query(index: CatalogIndex, filters: dict, limit: int, cursor: int = -1) -> tuple:
+    masks = index.masks(filters)
+    rows, total, next_cursor = index.page(masks, limit, cursor)
+    return index.items(rows), total, next_cursor, index.facets(masks)
+
+
+def pandas_query(df, filters: dict, limit: int) -> tuple:
+    """Тот же отбор и фасеты через DataFrame — для сравнения."""
+    mask = np.ones(len(df), dtype=bool)
+    if filters.get("type"):
+        mask &= df["тип_светильника"].isin(filters["type"]).to_numpy()
+    if filters.get("brand"):
+        mask &= df["бренд"].isin(filters["brand"]).to_numpy()
+    for key, col, op in (
+        ("power_min", "мощность_вт", "ge"), ("power_max", "мощность_вт", "le"),
+        ("flux_min", "световой_поток_лм", "ge"), ("flux_max", "световой_поток_лм", "le"),
+        ("price_min", "цена_₽", "ge"), ("price_max", "цена_₽", "le"),
+        ("cri_min", "cri", "ge"), ("cct_min", "cct_k", "ge"), ("cct_max", "cct_k", "le"), ("ip_min", "ip", "ge"),
+    ):
+        if filters.get(key) is not None:
+            mask &= getattr(df[col], op)(filters[key]).to_numpy()
+    found = df[mask]
+    return found.head(limit).to_dict(orient="records"), len(found), found["тип_светильника"].value_counts().to_dict()
+
+
+def median_ms(fn, *args, repeats: int) -> float:
+    fn(*args)  # прогрев
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times)) * 1000
+
+
+def run(sizes: list, limit: int, repeats: int) -> None:
+    for size in sizes:
+        df = load_catalog(size)
+        t0 = time.perf_counter()
+        index = CatalogIndex(FixtureCatalog(df))
+        print(f"\nКаталог: {size} строк, индекс построен за {(time.perf_counter() - t0) * 1000:.1f} мс, "
+              f"страница {limit}")
+        print(f"{'запрос':<20} | {'найдено':>8} | {'индекс, мс':>10} | {'pandas, мс':>10}")
+        for name, filters in QUERIES.items():
+            total = query(index, filters, limit)[1]
+            ms = median_ms(query, index, filters, limit, repeats=repeats)
+            pd_ms = median_ms(pandas_query, df, filters, limit, repeats=max(1, repeats // 10))
+            print(f"{name:<20} | {total:>8} | {ms:>10.3f} | {pd_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Витрина каталога: латентность фильтров и фасетов")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[240, 100_000])
+    parser.add_argument("--limit", type=int, default=24)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+    run(args.sizes, args.limit, args.repeats)
@@ -0,0 +1,123 @@
+# ==============================================================
+# Бенчмарк: чат-парсер (app.spacy_parser)
+# Латентность разбора одного сообщения и сообщений/с:
+# полный конвейер без кэша (прежний вариант) против облегчённого
+# конвейера с кэшем лемм и пакетного parse_many (nlp.pipe)
+# Запуск: python -m benchmarks.chat_parser --messages 2000
+# ==============================================================
+
+import argparse
+import logging
+import random
+import time
+
+import numpy as np
+
+from app import spacy_parser
+from app.config import SPACY_MODEL
+
+# Формы слов, из которых собираются сообщения
+ROOM_FORMS = [
+    "офиса", "офис", "кухни", "кухню", "гостиной", "гостиную", "спальни", "спальню",
+    "торгового зала", "цеха", "ресторана", "кафе", "склада", "аудитории", "коридора",
+    "вестибюля", "санузла", "ванной", "прихожей", "лаборатории", "магазина",
+]
+TEMPLATES = [
+    "Подбери светильники для {room} площадью {area} м2, высота потолка {height} м, бюджет {budget} рублей",
+    "Хочу осветить {room} {area} квадратных метров с потолком {height} метра и бюджетом {budget}",
+    "Нужно освещение для {room}, площадь {area} м², высота {height} метра, бюджет {budget}",
+    "Светильники в {room}, квадратура {area}, потолки {height} метра",
+]
+
+
+def make_messages(n: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    return [
+        rng.choice(TEMPLATES).format(
+            room=rng.choice(ROOM_FORMS),
+            area=rng.randint(8, 300),
+            height=round(rng.uniform(2.4, 6.0), 1),
+            budget=rng.randrange(5_000, 500_000, 500),
+        )
+        for _ in range(n)
+    ]
+
+
+def load_pipeline(exclude: list):
+    """Модель SPACY_MODEL; без неё — blank('ru') с лемматизатором pymorphy3."""
+    import spacy
+    try:
+        return spacy.load(SPACY_MODEL, exclude=exclude), SPACY_MODEL
+    except OSError:
+        nlp = spacy.blank("ru")
+        nlp.add_pipe("lemmatizer", config={"mode": "pymorphy3"})
+        nlp.initialize()
+        return nlp, "blank('ru') + pymorphy3 (модель не установлена)"
+
+
+def use(nlp, cache_size: int) -> None:
+    spacy_parser.nlp, spacy_parser._nlp_loaded = nlp, True
+    spacy_parser.LEMMA_CACHE_SIZE = cache_size
+    spacy_parser._lemma_cache.clear()
+
+
+def per_message(messages: list) -> tuple:
+    times, results = [], []
+    for text in messages:
+        t0 = time.perf_counter()
+        results.append(spacy_parser.parse_room_params_spacy(text))
+        times.append(time.perf_counter() - t0)
+    return times, results
+
+
+def run(n_messages: int, batch_size: int, processes: int) -> None:
+    messages = make_messages(n_messages)
+    cache_size = spacy_parser.LEMMA_CACHE_SIZE
+
+    full, name = load_pipeline(exclude=[])
+    slim, _ = load_pipeline(exclude=spacy_parser.EXCLUDED_COMPONENTS)
+    print(f"Конвейер: {name}")
+    print(f"  полный:       {full.pipe_names}")
+    print(f"  облегчённый:  {slim.pipe_names}\n")
+
+    rows = []
+    use(full, 0)
+    times, reference = per_message(messages)
+    rows.append(("полный, без кэша", times))
+
+    use(slim, 0)
+    times, results = per_message(messages)
+    rows.append(("облегч., без кэша", times))
+    assert results == reference
+
+    use(slim, cache_size)
+    times, results = per_message(messages)
+    rows.append(("облегч. + кэш лемм", times))
+    assert results == reference
+
+    print(f"{'вариант':<22} | {'p50, мс':>8} | {'p95, мс':>8} | {'сообщ./с':>9}")
+    for label, times in rows:
+        print(
+            f"{label:<22} | {np.percentile(times, 50) * 1000:>8.3f} | "
+            f"{np.percentile(times, 95) * 1000:>8.3f} | {len(times) / sum(times):>9.0f}"
+        )
+
+    for n_process in sorted({1, processes}):
+        use(slim, cache_size)
+        t0 = time.perf_counter()
+        results = spacy_parser.parse_many(messages, batch_size=batch_size, n_process=n_process)
+        elapsed = time.perf_counter() - t0
+        assert [r["тип_помещения"] for r in results] == [r["тип_помещения"] for r in reference]
+        label = f"parse_many, {n_process} проц."
+        print(f"{label:<22} | {'':>8} | {'':>8} | {len(messages) / elapsed:>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Чат-парсер: латентность и пропускная способность")
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=spacy_parser.NLP_BATCH_SIZE)
+    parser.add_argument("--processes", type=int, default=spacy_parser.NLP_PROCESSES)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    run(args.messages, args.batch_size, args.processes)
@@ -0,0 +1,142 @@
+# ==============================================================
+# Бенчмарк: смешанная нагрузка /chat + /recommend на живом сервере
+# Для каждого дерева исходников (текущее, рабочая копия прежней версии)
+# поднимается uvicorn, параллельные клиенты шлют чат и подбор, отдельный
+# зонд опрашивает /health. Латентность по эндпоинтам, пропускная
+# способность, отказы 503/504 и задержка /health под нагрузкой.
+# Запуск: python -m benchmarks.concurrency --trees . /tmp/old --catalog-size 20000
+# ==============================================================
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import numpy as np
+
+from benchmarks.batch_throughput import load_rooms
+from benchmarks.catalog_engine import load_catalog
+from benchmarks.chat_parser import make_messages
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(tree: str, port: int, env: dict) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=tree, env=dict(os.environ, **env), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, room: dict, timeout_s: float = 120) -> None:
+    """Ждёт первого успешного подбора (у прежних версий нет /ready)."""
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            if (await client.post("/recommend", json=room)).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.5)
+    raise TimeoutError("Сервер не поднялся.")
+
+
+async def load(client: httpx.AsyncClient, rooms: list, messages: list, clients: int,
+               duration_s: float, chat_share: float) -> dict:
+    stats = {"chat": [], "recommend": [], "health": [], "rejected": 0, "errors": 0}
+    deadline = time.monotonic() + duration_s
+    rng = random.Random(0)
+
+    async def worker():
+        while time.monotonic() < deadline:
+            if rng.random() < chat_share:
+                name, call = "chat", client.post("/chat/", json={"message": rng.choice(messages)})
+            else:
+                name, call = "recommend", client.post("/recommend", json=rng.choice(rooms))
+            t0 = time.perf_counter()
+            response = await call
+            if response.status_code == 200:
+                stats[name].append(time.perf_counter() - t0)
+            elif response.status_code in (503, 504):
+                stats["rejected"] += 1
+            else:
+                stats["errors"] += 1
+
+    async def probe():
+        while time.monotonic() < deadline:
+            t0 = time.perf_counter()
+            await client.get("/health")
+            stats["health"].append(time.perf_counter() - t0)
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(probe(), *(worker() for _ in range(clients)))
+    return stats
+
+
+def report(tree: str, stats: dict, duration_s: float) -> None:
+    done = len(stats["chat"]) + len(stats["recommend"])
+    print(f"\n{tree}: {done / duration_s:.1f} запр./с, отказов 503/504: {stats['rejected']}, ошибок: {stats['errors']}")
+    print(f"  {'эндпоинт':<10} | {'n':>6} | {'p50, мс':>8} | {'p95, мс':>8} | {'p99, мс':>8}")
+    for name in ("chat", "recommend", "health"):
+        times = np.array(stats[name]) * 1000
+        if times.size:
+            print(
+                f"  {name:<10} | {times.size:>6} | {np.percentile(times, 50):>8.1f} | "
+                f"{np.percentile(times, 95):>8.1f} | {np.percentile(times, 99):>8.1f}"
+            )
+
+
+async def bench_tree(tree: str, env: dict, rooms: list, messages: list, args) -> None:
+    port = free_port()
+    server = start_server(tree, port, env)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60) as client:
+            await wait_ready(client, rooms[0])
+            stats = await load(client, rooms, messages, args.clients, args.duration, args.chat_share)
+        report(tree, stats, args.duration)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(args) -> None:
+    # Разные помещения и отключённый кэш ответов: каждый запрос доходит до модели
+    rooms = load_rooms(args.rooms)
+    for i, room in enumerate(rooms):
+        room["площадь_м2"] = round(room["площадь_м2"] + i * 0.01, 2)
+    messages = make_messages(args.rooms)
+    env = {"CACHE_ENABLED": "0", "SCORE_CACHE_SIZE": "0", "PREFILTER_MODE": args.prefilter}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.catalog_size:
+            path = os.path.join(tmp, "fixtures.csv")
+            load_catalog(args.catalog_size).to_csv(path, index=False)
+            env["FIXTURES_PATH"] = path
+        for tree in args.trees:
+            asyncio.run(bench_tree(os.path.abspath(tree), env, rooms, messages, args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Смешанная нагрузка /chat + /recommend")
+    parser.add_argument("--trees", nargs="+", default=["."], help="каталоги с исходниками для сравнения")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--chat-share", type=float, default=0.5)
+    parser.add_argument("--rooms", type=int, default=500)
+    parser.add_argument("--catalog-size", type=int, default=0, help="синтетический каталог вместо data/fixtures.csv")
+    parser.add_argument("--prefilter", default="off")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    main(args)
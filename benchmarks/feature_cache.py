@@ -0,0 +1,62 @@
+# ==============================================================
+# Бенчмарк: полный preprocessor.transform против сборки признаков
+# из кэшированного блока каталога (app.features.FeatureAssembler)
+# Запуск: python -m benchmarks.feature_cache --rooms 100
+# ==============================================================
+
+import argparse
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from app import recommend as rec
+from app.features import COUNT_COLUMN
+from app.startup import startup
+from benchmarks.batch_throughput import load_rooms
+
+
+def expand_catalog(fixtures_df: pd.DataFrame, data: dict) -> pd.DataFrame:
+    """Прежний путь: копия каталога со столбцами помещения и количеством."""
+    expanded = fixtures_df.copy()
+    for col, value in data.items():
+        expanded[col] = value
+    expanded[COUNT_COLUMN] = np.ceil(
+        (data["целевой_люкс"] * data["площадь_м2"]) / (expanded["световой_поток_лм"] * 0.6)
+    ).clip(lower=1).astype(int)
+    return expanded
+
+
+def run(n_rooms: int) -> None:
+    fixtures_df = pd.read_csv(rec.FIXTURES_PATH)
+    engine = rec.registry.current().engine
+    rooms = [rec._normalize_input(r) for r in load_rooms(n_rooms)]
+    expanded = [expand_catalog(fixtures_df, room) for room in rooms]
+
+    t0 = time.perf_counter()
+    full = [engine.preprocessor.transform(ex) for ex in expanded]
+    t_full = (time.perf_counter() - t0) / n_rooms
+
+    t0 = time.perf_counter()
+    cached = [
+        engine.features.assemble([room], ex[COUNT_COLUMN].to_numpy())
+        for room, ex in zip(rooms, expanded)
+    ]
+    t_cached = (time.perf_counter() - t0) / n_rooms
+
+    identical = all(np.array_equal(a, b) for a, b in zip(full, cached))
+    print(f"Каталог: {len(fixtures_df)} светильников, помещений: {n_rooms}")
+    print(f"preprocessor.transform: {t_full * 1000:.3f} мс/запрос")
+    print(f"FeatureAssembler:       {t_cached * 1000:.3f} мс/запрос")
+    print(f"Ускорение: ×{t_full / t_cached:.1f}, результат идентичен: {identical}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Кэш признаков каталога против полного transform")
+    parser.add_argument("--rooms", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    startup.run()
+    run(args.rooms)
@@ -0,0 +1,50 @@
+# ==============================================================
+# Бенчмарк: векторный generate_pairs против прежнего iterrows
+# Время прежней и новой версии и пары/с на наборах разного размера.
+# Прежняя реализация (reference_pairs) — эталон из
+# tests/generate_pairs_reference.py, им же сверяет tests/test_generate_pairs.py.
+# Запуск: python -m benchmarks.generate_pairs --rooms 400 5000 --products 240 2400
+# ==============================================================
+
+import argparse
+import time
+
+from ml.generate_data import generate_pairs
+from tests.generate_pairs_reference import make_inputs, reference_pairs
+
+
+def clock(fn, *args, **kwargs) -> tuple:
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+# -------------------------
+# Время
+# -------------------------
+def run(rooms: list, products: list, seed: int, reference_limit: int) -> None:
+    print(f"\n{'помещений':>9} | {'продуктов':>9} | {'пар':>10} | {'iterrows, с':>11} | {'вектор, с':>9} | {'пар/с':>12}")
+    for n_rooms in rooms:
+        for n_products in products:
+            df_rooms, df_products = make_inputs(n_rooms, n_products, seed)
+            df, seconds = clock(generate_pairs, df_rooms, df_products, seed=seed)
+            old = "—"
+            if len(df) <= reference_limit:
+                old = f"{clock(reference_pairs, df_rooms, df_products)[1]:.2f}"
+            print(
+                f"{n_rooms:>9} | {n_products:>9} | {len(df):>10} | {old:>11} | {seconds:>9.2f} | "
+                f"{len(df) / seconds:>12,.0f}"
+            )
+            del df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Скорость векторного generate_pairs")
+    parser.add_argument("--rooms", type=int, nargs="+", default=[400, 5_000])
+    parser.add_argument("--products", type=int, nargs="+", default=[240, 2_400])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reference-limit", type=int, default=200_000,
+                        help="прежняя версия замеряется, только если пар не больше")
+    args = parser.parse_args()
+
+    run(args.rooms, args.products, args.seed, args.reference_limit)
@@ -0,0 +1,88 @@
+# ==============================================================
+# Бенчмарк: многопроцессный скоринг над общей памятью (app.parallel)
+# Латентность одного помещения, пропускная способность пакета и память
+# (PSS родителя и процессов пула: общий блок каталога учитывается
+# долями, а не целиком в каждом процессе) при разном числе процессов
+# Запуск: python -m benchmarks.parallel_scoring --size 200000 --processes 0 1 2 4
+# ==============================================================
+
+import argparse
+import logging
+import os
+import time
+
+import numpy as np
+
+from app import recommend as rec
+from app.engine import RecommenderEngine
+from app.startup import startup
+from benchmarks.batch_throughput import load_rooms
+from benchmarks.catalog_engine import load_catalog
+from ml.generate_data import ROOM_TO_FIXTURES
+
+
+def pss_mb(pid: int) -> float:
+    """Proportional set size процесса, МБ (Linux)."""
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def tree_pss_mb(engine: RecommenderEngine) -> float:
+    pids = [os.getpid()]
+    if engine.scorer is not None:
+        pids += list(engine.scorer._pool._processes)
+    return sum(pss_mb(pid) for pid in pids)
+
+
+def run(size: int, processes: list, n_rooms: int, batch: int) -> None:
+    base = rec.registry.current().engine
+    fixtures = load_catalog(size)
+    rooms = [rec._normalize_input(r) for r in load_rooms(n_rooms)]
+    reference = None
+
+    print(f"Каталог: {size} строк, помещений: {n_rooms}, пакет: {batch}")
+    print(f"{'процессов':>9} | {'1 помещение, мс':>15} | {'пакет, помещ./с':>15} | {'PSS, МБ':>8} | {'top-N совпал':>12}")
+    for n in processes:
+        engine = RecommenderEngine(
+            base.model, base.preprocessor, fixtures, room_to_fixtures=ROOM_TO_FIXTURES,
+            processes=n, parallel_min_rows=1,
+        )
+        try:
+            engine.score(rooms[0])  # прогрев
+            times, tops = [], []
+            for room in rooms:
+                t0 = time.perf_counter()
+                scores, _ = engine.score(room)
+                tops.append(engine.select(scores, rec.TOP_N))
+                times.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            for start in range(0, n_rooms, batch):
+                engine.score_many(rooms[start:start + batch])
+            throughput = n_rooms / (time.perf_counter() - t0)
+
+            memory = tree_pss_mb(engine)
+            reference = reference or tops
+            same = all(np.array_equal(a, b) for a, b in zip(tops, reference))
+            print(
+                f"{n:>9} | {np.median(times) * 1000:>15.1f} | {throughput:>15.1f} | "
+                f"{memory:>8.0f} | {'да' if same else 'нет':>12}"
+            )
+        finally:
+            engine.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Многопроцессный скоринг над общей памятью")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    startup.run()
+    run(args.size, args.processes, args.rooms, args.batch)
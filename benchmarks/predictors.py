@@ -0,0 +1,125 @@
+# ==============================================================
+# Бенчмарк: бэкенды предиктора (app.predictors)
+# Для каждого семейства модели — прежний joblib-артефакт против родного
+# или экспортированного формата: время загрузки в новом процессе (с импортом
+# библиотеки), латентность predict на пакет строк и расхождение оценок.
+# CatBoost — модель из ml/best_model.pkl (.cbm и ONNX-экспорт CatBoost),
+# Ridge и LightGBM обучаются на data/train_test_ready.npz. Бэкенды, чьих
+# библиотек нет в окружении, пропускаются.
+# Запуск: python -m benchmarks.predictors --sizes 240 10000 100000
+# ==============================================================
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import joblib
+import numpy as np
+
+from app.predictors import load_predictor
+from ml.export_model import export_model
+
+LOAD = """
+import json, sys, time
+t0 = time.perf_counter()
+from app.predictors import load_predictor
+load_predictor(sys.argv[1])
+print(json.dumps(time.perf_counter() - t0))
+"""
+
+
+def load_seconds(path: str, repeats: int) -> float:
+    """Медиана времени импорта и загрузки модели в новом процессе."""
+    times = []
+    for _ in range(repeats):
+        out = subprocess.run(
+            [sys.executable, "-c", LOAD, path], capture_output=True, text=True, check=True,
+            env=dict(os.environ, PYTHONPATH=os.getcwd()),
+        )
+        times.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return float(np.median(times))
+
+
+def predict_ms(predictor, X: np.ndarray, repeats: int) -> float:
+    X = np.ascontiguousarray(X, dtype=predictor.dtype)  # движок собирает вход сразу в этом типе
+    predictor.predict(X[:16])
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        predictor.predict(X)
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times)) * 1000
+
+
+def artifacts(tmp: str, X_train: np.ndarray, y_train: np.ndarray) -> dict:
+    """{семейство: [(формат, путь), ...]}, первый формат — прежний joblib."""
+    families = {}
+
+    catboost = joblib.load("ml/best_model.pkl")
+    stem = os.path.join(tmp, "catboost")
+    joblib.dump(catboost, stem + ".pkl")
+    export_model(catboost, stem)
+    families["CatBoost"] = [("pickle", stem + ".pkl"), ("cbm", stem + ".json")]
+    try:
+        import onnxruntime  # noqa: F401
+        catboost.save_model(stem + ".onnx", format="onnx")
+        families["CatBoost"].append(("onnx", stem + ".onnx"))
+    except ImportError:
+        print("onnxruntime не установлен — ONNX пропущен")
+
+    from sklearn.linear_model import Ridge
+    ridge = Ridge(alpha=1.0).fit(X_train, y_train)
+    stem = os.path.join(tmp, "ridge")
+    joblib.dump(ridge, stem + ".pkl")
+    export_model(ridge, stem)
+    families["Ridge"] = [("pickle", stem + ".pkl"), ("npz", stem + ".json")]
+
+    try:
+        from lightgbm import LGBMRegressor
+        lgbm = LGBMRegressor(n_estimators=500, learning_rate=0.05, num_leaves=31, random_state=42, verbose=-1)
+        lgbm.fit(X_train, y_train)
+        stem = os.path.join(tmp, "lightgbm")
+        joblib.dump(lgbm, stem + ".pkl")
+        export_model(lgbm, stem)
+        families["LightGBM"] = [("pickle", stem + ".pkl"), ("text", stem + ".json")]
+    except ImportError:
+        print("lightgbm не установлен — LightGBM пропущен")
+    return families
+
+
+def run(sizes: list, load_repeats: int, predict_repeats: int) -> None:
+    data = np.load("data/train_test_ready.npz")
+    X_train, y_train, X_test = data["X_train"], data["y_train"], data["X_test"]
+    batches = {n: np.resize(X_test, (n, X_test.shape[1])) for n in sizes}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        families = artifacts(tmp, X_train, y_train)
+        header = " | ".join(f"{f'{n} строк, мс':>14}" for n in sizes)
+        print(f"\n{'модель':<9} | {'формат':<7} | {'файл, КБ':>8} | {'загрузка, с':>11} | {header} | {'макс. расхождение':>17}")
+        for family, formats in families.items():
+            reference = None
+            for fmt, path in formats:
+                predictor = load_predictor(path)
+                y = predictor.predict(batches[sizes[0]])
+                reference = y if reference is None else reference
+                size_kb = os.path.getsize(predictor.path) / 1024
+                latencies = " | ".join(
+                    f"{predict_ms(predictor, batches[n], predict_repeats):>14.2f}" for n in sizes
+                )
+                print(
+                    f"{family:<9} | {fmt:<7} | {size_kb:>8.0f} | {load_seconds(path, load_repeats):>11.2f} | "
+                    f"{latencies} | {np.abs(y - reference).max():>17.2e}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Загрузка и predict по бэкендам предиктора")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[240, 10_000, 100_000])
+    parser.add_argument("--load-repeats", type=int, default=3)
+    parser.add_argument("--predict-repeats", type=int, default=10)
+    args = parser.parse_args()
+    run(args.sizes, args.load_repeats, args.predict_repeats)
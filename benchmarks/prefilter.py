@@ -0,0 +1,54 @@
+# ==============================================================
+# Бенчмарк: предфильтр каталога (app.prefilter.ConstraintIndex)
+# Доля отсечённых строк, латентность и совпадение top-N с полным
+# скорингом для режимов off / soft / strict
+# Запуск: python -m benchmarks.prefilter --sizes 240 100000
+# ==============================================================
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from app import recommend as rec
+from app.engine import RecommenderEngine
+from app.startup import startup
+from benchmarks.batch_throughput import load_rooms
+from benchmarks.catalog_engine import load_catalog
+from ml.generate_data import ROOM_TO_FIXTURES
+
+
+def run(sizes: list, n_rooms: int) -> None:
+    rooms = [rec._normalize_input(r) for r in load_rooms(n_rooms)]
+    base = rec.registry.current().engine
+    print(f"{'каталог':>10} | {'режим':<7} | {'отсечено':>9} | {'медиана, мс':>12} | {'top-N = off':>11}")
+    for size in sizes:
+        engine = RecommenderEngine(
+            base.model, base.preprocessor, load_catalog(size), room_to_fixtures=ROOM_TO_FIXTURES
+        )
+        reference = [engine.recommend(room, rec.TOP_N)[0] for room in rooms]
+
+        for mode in ("off", "soft", "strict"):
+            times, ratios, same = [], [], 0
+            for room, ref in zip(rooms, reference):
+                t0 = time.perf_counter()
+                recs, report = engine.recommend(room, rec.TOP_N, prefilter=mode)
+                times.append(time.perf_counter() - t0)
+                ratios.append(report["pruning_ratio"])
+                same += recs == ref
+            print(
+                f"{size:>10} | {mode:<7} | {np.mean(ratios):>9.1%} | "
+                f"{np.median(times) * 1000:>12.2f} | {same / len(rooms):>11.0%}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Предфильтр каталога: отсечение и латентность")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[240, 100_000])
+    parser.add_argument("--rooms", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    startup.run()
+    run(args.sizes, args.rooms)
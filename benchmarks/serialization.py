@@ -0,0 +1,89 @@
+# ==============================================================
+# Бенчмарк: сериализация ответа /recommend (app.responses)
+# Время на один ответ для top-3 и top-100:
+#   - jsonable_encoder + json — прежний путь FastAPI для возвращённого dict;
+#   - response_model + json — валидация RecommendResponse и дамп pydantic
+#     перед json (так FastAPI обходит ответ с response_model);
+#   - кодировщики app.responses (json, pydantic_core, orjson — если установлен)
+#     по готовому dict, как FastJSONResponse.
+# Запуск: python -m benchmarks.serialization --top 3 100
+# ==============================================================
+
+import argparse
+import logging
+import time
+import warnings
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from starlette.responses import JSONResponse
+
+from app.advisor import generate_advice
+from app.recommend import recommend_luminaires
+from app.responses import ENCODERS
+from app.schemas import RecommendResponse
+from app.startup import startup
+
+ROOM = {
+    "тип_помещения": "офисное помещение", "площадь_м2": 40.0, "высота_м": 3.0, "целевой_люкс": 400,
+    "cri_min": 80, "cct_предпочтение_k": 4000, "ip_min": 40, "бюджет_₽": 100000,
+}
+
+
+def make_response(top_n: int) -> dict:
+    """Ответ /recommend в том виде, в каком его собирает app.main."""
+    room = dict(ROOM, top_n=top_n)
+    result = recommend_luminaires(room)
+    return {
+        "recommendations": result["recommendations"],
+        "summary": result["summary"],
+        "advice": generate_advice(result["recommendations"], room),
+        "paging": result["paging"],
+        "prefilter": result["prefilter"],
+        "artifact_version": result["artifact_version"],
+    }
+
+
+def median_us(fn, content, repeats: int) -> float:
+    fn(content)  # прогрев
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(content)
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times)) * 1e6
+
+
+def run(tops: list, repeats: int) -> None:
+    adapter = TypeAdapter(RecommendResponse)
+    render = JSONResponse(None).render
+    paths = {
+        "jsonable_encoder + json": lambda content: render(jsonable_encoder(content)),
+        "response_model + json": lambda content: render(
+            adapter.dump_python(adapter.validate_python(content), mode="json", by_alias=True)
+        ),
+    }
+    paths.update({f"{name} (app.responses)": encode for name, encode in ENCODERS.items()})
+
+    for top_n in tops:
+        content = make_response(top_n)
+        size = len(ENCODERS["json"](content))
+        timings = {name: median_us(fn, content, repeats) for name, fn in paths.items()}
+        baseline = timings["jsonable_encoder + json"]
+        print(f"\ntop-{top_n}: {len(content['recommendations'])} записей, {size / 1024:.1f} КБ")
+        print(f"{'путь':<28} | {'мкс/ответ':>10} | {'ускорение':>9}")
+        for name, us in timings.items():
+            print(f"{name:<28} | {us:>10.1f} | {baseline / us:>8.1f}×")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сериализация ответа /recommend: время на ответ")
+    parser.add_argument("--top", type=int, nargs="+", default=[3, 100])
+    parser.add_argument("--repeats", type=int, default=500)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    warnings.filterwarnings("ignore")
+    startup.run()
+    run(args.top, args.repeats)
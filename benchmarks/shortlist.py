@@ -0,0 +1,89 @@
+# ==============================================================
+# Бенчмарк: двухэтапное ранжирование (app.shortlist) против полного скоринга
+# На большом сгенерированном каталоге для каждого K: медианная латентность
+# подбора одного помещения и recall@N — доля top-N полной модели, которая
+# осталась в top-N после отбора K кандидатов линейной моделью. По этим
+# числам выбирается SHORTLIST_K.
+# Запуск: python -m benchmarks.shortlist --size 200000 --k 500 2000 10000 50000 --top 3 20
+# ==============================================================
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from app import recommend as rec
+from app.engine import RecommenderEngine
+from app.predictors import load_predictor
+from app.startup import startup
+from benchmarks.batch_throughput import load_rooms
+from benchmarks.suite import make_catalog
+from ml.generate_data import ROOM_TO_FIXTURES
+
+
+def top_rows(engine: RecommenderEngine, data: dict, top_n: int, prefilter: str) -> tuple:
+    """Строки каталога top_n лучших и длительность подбора, с."""
+    t0 = time.perf_counter()
+    rows, scores, _, _ = engine.scored(data, prefilter, max(engine.min_candidates, top_n))
+    pos = engine.select(scores, top_n, rows=rows)
+    return rows[pos], time.perf_counter() - t0
+
+
+def run(size: int, ks: list, tops: list, n_rooms: int, prefilter: str, seed: int) -> None:
+    base = rec.registry.current().engine
+    engine = RecommenderEngine(
+        base.model, base.preprocessor, make_catalog(size, seed),
+        room_to_fixtures=ROOM_TO_FIXTURES,
+        cct_tolerance_k=base.cct_tolerance_k,
+        budget_factor=base.budget_factor,
+        min_candidates=base.min_candidates,
+        shortlist_model=load_predictor(rec.SHORTLIST_MODEL_PATH),
+        shortlist_k=1,
+    )
+    shortlist = engine.shortlist
+    rooms = [rec._normalize_input(r) for r in load_rooms(n_rooms)]
+    top_n = max(tops)
+
+    # Полный скоринг — эталон
+    engine.shortlist = None
+    reference, full_times = [], []
+    for data in rooms:
+        rows, seconds = top_rows(engine, data, top_n, prefilter)
+        reference.append(rows)
+        full_times.append(seconds)
+    engine.shortlist = shortlist
+
+    print(f"Каталог: {size} строк, помещений: {n_rooms}, предфильтр: {prefilter}, "
+          f"первый этап: {shortlist.predictor!r}")
+    recall_head = " | ".join(f"{f'recall@{n}':>10}" for n in tops)
+    print(f"{'K':>9} | {'медиана, мс':>11} | {'ускорение':>9} | {recall_head}")
+    full_ms = np.median(full_times) * 1000
+    print(f"{'весь':>9} | {full_ms:>11.1f} | {1.0:>8.1f}× | " + " | ".join(f"{1.0:>10.3f}" for _ in tops))
+
+    for k in ks:
+        engine.shortlist_k = k
+        times, recall = [], {n: [] for n in tops}
+        for data, ref in zip(rooms, reference):
+            rows, seconds = top_rows(engine, data, top_n, prefilter)
+            times.append(seconds)
+            for n in tops:
+                recall[n].append(np.intersect1d(rows[:n], ref[:n]).size / max(1, min(n, ref.size)))
+        ms = np.median(times) * 1000
+        print(f"{k:>9} | {ms:>11.1f} | {full_ms / ms:>8.1f}× | "
+              + " | ".join(f"{np.mean(recall[n]):>10.3f}" for n in tops))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Двухэтапное ранжирование: латентность и recall@N")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--k", type=int, nargs="+", default=[500, 2_000, 10_000, 50_000])
+    parser.add_argument("--top", type=int, nargs="+", default=[3, 20])
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--prefilter", default="off")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    startup.run()
+    run(args.size, args.k, args.top, args.rooms, args.prefilter, args.seed)
@@ -0,0 +1,95 @@
+# ==============================================================
+# Бенчмарк: запуск сервиса (app.startup)
+# Время импорта app.main, время до готовности по фазам и латентность
+# первого запроса: прежний последовательный старт против фоновой
+# параллельной загрузки с прогревом. Каждый замер — в новом процессе.
+# Запуск: python -m benchmarks.startup --repeats 3
+# ==============================================================
+
+import argparse
+import json
+import subprocess
+import sys
+
+import numpy as np
+
+# Прежний порядок: всё при импорте, последовательно, без прогрева
+SEQUENTIAL = """
+import json, time
+t0 = time.perf_counter()
+import joblib, pandas as pd, spacy
+import app.main
+from app import recommend as rec, spacy_parser
+imported = time.perf_counter() - t0
+model = joblib.load("ml/best_model.pkl")
+preprocessor = joblib.load(rec.PREPROCESSOR_PATH)
+fixtures = pd.read_csv(rec.FIXTURES_PATH)
+from app.engine import RecommenderEngine
+engine = RecommenderEngine(model, preprocessor, fixtures)
+spacy_parser.load_nlp()
+ready = time.perf_counter() - t0
+t1 = time.perf_counter()
+engine.recommend(rec._normalize_input(ROOM), rec.TOP_N)
+spacy_parser.parse_room_params_spacy(MESSAGE)
+first = time.perf_counter() - t1
+print(json.dumps({"import": imported, "ready": ready, "first_request": first}))
+"""
+
+# Новый порядок: лёгкий импорт, фоновая параллельная загрузка и прогрев
+BACKGROUND = """
+import json, time
+t0 = time.perf_counter()
+import app.main
+from app import recommend as rec, spacy_parser
+from app.startup import startup
+imported = time.perf_counter() - t0
+startup.begin()
+startup.wait()
+ready = time.perf_counter() - t0
+t1 = time.perf_counter()
+rec.registry.current().engine.recommend(rec._normalize_input(ROOM), rec.TOP_N)
+spacy_parser.parse_room_params_spacy(MESSAGE)
+first = time.perf_counter() - t1
+print(json.dumps({"import": imported, "ready": ready, "first_request": first, "phases": startup.phases}))
+"""
+
+PRELUDE = """
+import logging, warnings
+logging.disable(logging.INFO)
+warnings.filterwarnings("ignore")
+ROOM = {"тип_помещения": "кухня", "площадь_м2": 18.0, "высота_м": 2.7, "целевой_люкс": 300,
+        "cri_min": 80, "cct_предпочтение_k": 3500, "ip_min": 44, "бюджет_₽": 50000}
+MESSAGE = "Хочу осветить кухню 25 квадратных метров с потолком 2.8 метра и бюджетом 15000"
+"""
+
+
+def measure(script: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", PRELUDE + script], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def run(repeats: int) -> None:
+    print(f"{'старт':<12} | {'импорт, с':>10} | {'готов, с':>9} | {'1-й запрос, мс':>15}")
+    phases = None
+    for name, script in (("последоват.", SEQUENTIAL), ("фоновый", BACKGROUND)):
+        results = [measure(script) for _ in range(repeats)]
+        print(
+            f"{name:<12} | {np.median([r['import'] for r in results]):>10.2f} | "
+            f"{np.median([r['ready'] for r in results]):>9.2f} | "
+            f"{np.median([r['first_request'] for r in results]) * 1000:>15.2f}"
+        )
+        phases = results[-1].get("phases", phases)
+
+    print("\nФазы фонового старта, с:")
+    for name, seconds in phases.items():
+        print(f"  {name:<15} {seconds:.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Запуск сервиса: импорт, готовность, первый запрос")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.repeats)
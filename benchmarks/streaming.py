@@ -0,0 +1,77 @@
+# ==============================================================
+# Бенчмарк: потоковый скоринг частями (RecommenderEngine.chunk_rows)
+# Пик выделенной памяти на запрос в новом потоке (буферы потока создаются
+# заново и попадают в замер) и медианная латентность для разных размеров
+# части на большом каталоге; выдача сверяется с подбором одним куском.
+# Запуск: python -m benchmarks.streaming --size 1000000 --chunks 0 16384 65536 262144
+# ==============================================================
+
+import argparse
+import logging
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+from app import recommend as rec
+from app.startup import startup
+from benchmarks.batch_throughput import load_rooms
+from benchmarks.suite import make_catalog, make_engine
+
+
+def in_new_thread(fn, *args):
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=fn(*args)))
+    thread.start()
+    thread.join()
+    return result["value"]
+
+
+def cold_peak_mb(engine, data: dict, prefilter: str) -> float:
+    """Пик выделенной памяти на первый запрос потока, МБ."""
+    def call():
+        tracemalloc.start()
+        engine.recommend(data, rec.TOP_N, prefilter=prefilter)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak / 2**20
+    return in_new_thread(call)
+
+
+def run(size: int, chunks: list, n_rooms: int, prefilter: str, seed: int) -> None:
+    fixtures = make_catalog(size, seed)
+    rooms = [rec._normalize_input(r) for r in load_rooms(n_rooms)]
+    reference = None
+
+    print(f"Каталог: {size} строк, помещений: {n_rooms}, предфильтр: {prefilter}")
+    print(f"{'часть, строк':>12} | {'медиана, мс':>11} | {'пик на запрос, МБ':>17} | {'выдача совпала':>14}")
+    for chunk in chunks:
+        engine = make_engine(fixtures, chunk)
+        peak = cold_peak_mb(engine, rooms[0], prefilter)
+
+        times, pages = [], []
+        for data in rooms:
+            t0 = time.perf_counter()
+            pages.append(engine.recommend(data, rec.TOP_N, prefilter=prefilter)[0])
+            times.append(time.perf_counter() - t0)
+        reference = reference or pages
+        print(
+            f"{chunk or 'весь набор':>12} | {np.median(times) * 1000:>11.1f} | {peak:>17.1f} | "
+            f"{'да' if pages == reference else 'нет':>14}"
+        )
+        del engine
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Потоковый скоринг частями")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[0, 16_384, 65_536, 262_144])
+    parser.add_argument("--rooms", type=int, default=10)
+    parser.add_argument("--prefilter", default="off")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    startup.run()
+    run(args.size, args.chunks, args.rooms, args.prefilter, args.seed)
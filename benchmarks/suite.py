@@ -0,0 +1,277 @@
+# ==============================================================
+# Набор бенчмарков: этапы подбора, разбор текста, совет и HTTP
+# на каталогах разного размера (ml.generate_data, фиксированный seed).
+#
+# Этапы на одно помещение (тот же путь, что RecommenderEngine.recommend):
+#   prefilter — предфильтр каталога до кандидатов
+#   features  — количество светильников и вход модели (бывшие DataFrame + transform);
+#               этапы features..records — весь набор кандидатов одним куском
+#   predict   — оценки модели
+#   select    — выбор top-N
+#   records   — инженерные показатели и записи ответа
+#   summary   — текстовый summary
+#   advice    — generate_advice
+#   parse     — parse_room_params_spacy
+#   recommend — recommend_luminaires целиком (с потоковым скорингом, --chunk-rows)
+# HTTP через TestClient (кэш ответов выключен): /recommend, /recommend/batch, /chat.
+#
+# Результат — JSON (--out); --compare сравнивает с сохранённым прогоном
+# и завершается с кодом 1, если какой-то этап медленнее порога.
+# Запуск:
+#   python -m benchmarks.suite --sizes 240 10000 100000 1000000 --out bench.json
+#   python -m benchmarks.suite --sizes 240 10000 --compare bench.json
+# ==============================================================
+
+import os
+
+# Кэши ответов и оценок искажают замеры — выключены до импорта приложения
+os.environ.setdefault("CACHE_ENABLED", "0")
+os.environ.setdefault("SCORE_CACHE_SIZE", "0")
+
+import argparse
+import json
+import logging
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from app import recommend as rec
+from app.advisor import generate_advice
+from app.catalog import Workspace
+from app.config import PREFILTER_MODE, SCORING_CHUNK_ROWS
+from app.engine import RecommenderEngine
+from app.registry import ArtifactBundle
+from app.spacy_parser import parse_room_params_spacy
+from app.startup import startup
+from benchmarks.batch_throughput import load_rooms
+from benchmarks.chat_parser import make_messages
+from ml.generate_data import ROOM_TO_FIXTURES
+
+STAGES = ["prefilter", "features", "predict", "select", "records", "summary", "advice", "parse", "recommend"]
+HTTP_STAGES = ["http_recommend", "http_batch", "http_chat"]
+
+
+# -------------------------
+# Каталоги
+# -------------------------
+def make_catalog(size: int, seed: int) -> pd.DataFrame:
+    """Каталог из data/fixtures.csv (если размер совпадает) или сгенерированный с seed."""
+    base = pd.read_csv(rec.FIXTURES_PATH)
+    if size == len(base):
+        return base
+    from ml.generate_data import generate_products
+    random.seed(seed)
+    np.random.seed(seed)
+    return generate_products(n_records=size)
+
+
+def make_engine(fixtures: pd.DataFrame, chunk_rows: int) -> RecommenderEngine:
+    base = rec.registry.current().engine
+    return RecommenderEngine(
+        base.model, base.preprocessor, fixtures,
+        room_to_fixtures=ROOM_TO_FIXTURES,
+        cct_tolerance_k=base.cct_tolerance_k,
+        budget_factor=base.budget_factor,
+        min_candidates=base.min_candidates,
+        chunk_rows=chunk_rows,
+    )
+
+
+# -------------------------
+# Замеры
+# -------------------------
+def clock(times: dict, stage: str, fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    times[stage].append(time.perf_counter() - t0)
+    return result
+
+
+def _features(engine: RecommenderEngine, ws: Workspace, data: dict, rows: np.ndarray) -> tuple:
+    k = rows.size
+    counts = engine._counts(data, rows, ws.counts[:k], ws.ratio[:k])
+    full = rows is engine.all_rows
+    X = engine.features.fill(ws.X[:k], data, counts, ws.ratio[:k], rows=None if full else rows)
+    return X, counts
+
+
+def measure_stages(engine: RecommenderEngine, bundle: ArtifactBundle, rooms: list, messages: list,
+                   repeats: int) -> tuple:
+    """Время каждого этапа по всем помещениям; второе значение — среднее число кандидатов."""
+    times, candidates = defaultdict(list), []
+    # Свои буферы на весь каталог: буферы потока движка могут быть на одну часть
+    ws = Workspace(len(engine.catalog), engine.features.n_features, engine.features.dtype)
+    for _ in range(repeats):
+        for data, message in zip(rooms, messages):
+            paging = rec._paging(data)
+            need = max(engine.min_candidates, paging["offset"] + paging["top_n"])
+            rows, report = clock(times, "prefilter", engine.candidates, data, rec._prefilter_mode(data), need)
+            X, counts = clock(times, "features", _features, engine, ws, data, rows)
+            scores = clock(times, "predict", engine.model.predict, X)
+            pos = clock(times, "select", engine.select, scores, paging["top_n"], paging["offset"],
+                        paging["tie_break"], rows)
+            recs = clock(times, "records", engine.records, data, rows[pos], scores[pos], counts[pos])
+            clock(times, "summary", rec._format_summary, recs)
+            clock(times, "advice", generate_advice, recs, data)
+            clock(times, "parse", parse_room_params_spacy, message)
+            clock(times, "recommend", rec.recommend_luminaires, data, bundle)
+            candidates.append(report["candidates"])
+    return times, float(np.mean(candidates))
+
+
+def measure_http(client, rooms: list, messages: list, repeats: int, batch: int) -> dict:
+    times = defaultdict(list)
+    for _ in range(repeats):
+        for i, (room, message) in enumerate(zip(rooms, messages)):
+            for stage, call in (
+                ("http_recommend", lambda: client.post("/recommend", json=room)),
+                ("http_batch", lambda: client.post("/recommend/batch", json=rooms[i:i + batch])),
+                ("http_chat", lambda: client.post("/chat/", json={"message": message})),
+            ):
+                response = clock(times, stage, call)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{stage}: HTTP {response.status_code} {response.text[:200]}")
+    return times
+
+
+def summarize(stage: str, size: int, samples: list, **extra) -> dict:
+    ms = np.array(samples) * 1000
+    return dict(
+        stage=stage, size=size, n=int(ms.size),
+        median_ms=round(float(np.median(ms)), 4),
+        p95_ms=round(float(np.percentile(ms, 95)), 4),
+        mean_ms=round(float(ms.mean()), 4),
+        **extra,
+    )
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "model_backend": getattr(rec.registry.current().engine.model, "backend", None),
+        "prefilter_mode": PREFILTER_MODE,
+    }
+
+
+def run(args) -> dict:
+    rooms = [rec._normalize_input(r) for r in load_rooms(args.rooms)]
+    messages = make_messages(args.rooms, seed=args.seed)
+    results = []
+
+    client = None
+    if not args.skip_http:
+        from fastapi.testclient import TestClient
+        from app.main import app
+        client = TestClient(app)
+
+    for size in args.sizes:
+        t0 = time.perf_counter()
+        engine = make_engine(make_catalog(size, args.seed), args.chunk_rows)
+        bundle = ArtifactBundle(f"bench-{size}", engine, {}, time.perf_counter() - t0)
+
+        # Прогрев: один непосчитанный проход (первый predict, буферы потока, кэш лемм)
+        measure_stages(engine, bundle, rooms, messages, 1)
+        times, candidates = measure_stages(engine, bundle, rooms, messages, args.repeats)
+        for stage in STAGES:
+            results.append(summarize(stage, size, times[stage], candidates=candidates))
+
+        if client is not None:
+            rec.registry.activate(bundle)
+            measure_http(client, rooms, messages, 1, args.batch)
+            times = measure_http(client, rooms, messages, args.repeats, args.batch)
+            for stage in HTTP_STAGES:
+                results.append(summarize(stage, size, times[stage], candidates=candidates))
+
+        print(f"каталог {size}: готово ({time.perf_counter() - t0:.1f} с)", flush=True)
+
+    return {
+        "environment": environment(),
+        "params": {"sizes": args.sizes, "rooms": args.rooms, "repeats": args.repeats,
+                   "batch": args.batch, "seed": args.seed, "chunk_rows": args.chunk_rows},
+        "results": results,
+    }
+
+
+# -------------------------
+# Вывод и сравнение
+# -------------------------
+def report(data: dict) -> None:
+    print(f"\n{'этап':<15} | {'каталог':>8} | {'кандидатов':>10} | {'медиана, мс':>11} | {'p95, мс':>9}")
+    for r in data["results"]:
+        print(
+            f"{r['stage']:<15} | {r['size']:>8} | {r['candidates']:>10.0f} | "
+            f"{r['median_ms']:>11.3f} | {r['p95_ms']:>9.3f}"
+        )
+
+
+def compare(data: dict, baseline: dict, threshold: float) -> bool:
+    """Сравнение медиан с базовым прогоном; True — если нет замедлений сверх порога."""
+    before = {(r["stage"], r["size"]): r for r in baseline["results"]}
+    print(f"\nБаза: {baseline['environment'].get('commit')} ({baseline['environment'].get('timestamp')}), "
+          f"порог {threshold:.0%}")
+    print(f"{'этап':<15} | {'каталог':>8} | {'было, мс':>10} | {'стало, мс':>10} | {'×':>6} |")
+    ok = True
+    for r in data["results"]:
+        old = before.get((r["stage"], r["size"]))
+        if old is None:
+            continue
+        ratio = r["median_ms"] / old["median_ms"] if old["median_ms"] else float("inf")
+        mark = ""
+        if ratio > 1 + threshold:
+            mark, ok = "▲ медленнее", False
+        elif ratio < 1 / (1 + threshold):
+            mark = "▼ быстрее"
+        print(
+            f"{r['stage']:<15} | {r['size']:>8} | {old['median_ms']:>10.3f} | "
+            f"{r['median_ms']:>10.3f} | {ratio:>6.2f} | {mark}"
+        )
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Этапы подбора, разбор, совет и HTTP по размерам каталога")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[240, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--rooms", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--batch", type=int, default=10, help="помещений в запросе /recommend/batch")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-rows", type=int, default=SCORING_CHUNK_ROWS, help="потоковый скоринг (0 — выкл.)")
+    parser.add_argument("--skip-http", action="store_true")
+    parser.add_argument("--out", help="файл для JSON с результатами")
+    parser.add_argument("--compare", help="JSON прежнего прогона для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.10, help="допустимое замедление медианы")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    startup.run()
+    data = run(args)
+    report(data)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"\nРезультаты: {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(data, baseline, args.threshold):
+            sys.exit(1)
@@ -4,11 +4,18 @@ document.addEventListener("DOMContentLoaded", () => {
   const categoryContainer = document.getElementById("categoryContainer");
   const subcategoryContainer = document.getElementById("subcategoryContainer");
   const fixtureContainer = document.getElementById("fixtureContainer");
+  const fixtureMore = document.getElementById("fixtureMore");
 
-  if (!window.fixturesData) {
-    console.error("❌ fixturesData не найден");
-    return;
-  }
+  // Каталог — с сервера постранично (GET /catalog), а не целиком в странице
+  const CATALOG_URL = "https://smart-lighting-catalog.onrender.com/catalog";
+  const PAGE_SIZE = 24;
+
+  // Тип в каталоге «потолочный панель» → категория «Потолочные», подкатегория «Панель»
+  const categoryByPrefix = {
+    "потолочный": "Потолочные",
+    "настенный": "Настенные",
+    "напольный": "Напольные"
+  };
 
   // Маппинг категорий → иконки
   const categoryIcons = {
@@ -17,11 +24,41 @@ document.addEventListener("DOMContentLoaded", () => {
     "Напольные": "./assets/floor-lamp.png"
   };
 
+  // категория → [{ type, label, count }]
+  let categories = {};
+
+  const capitalize = (s) => s.charAt(0).toUpperCase() + s.slice(1);
+
+  // Запрос страницы каталога; браузер сам перепроверяет кэш по ETag (304)
+  const fetchCatalog = async (params) => {
+    const query = new URLSearchParams();
+    Object.entries(params).forEach(([key, value]) => {
+      if (value !== undefined && value !== null) query.append(key, value);
+    });
+    const res = await fetch(`${CATALOG_URL}?${query}`);
+    if (!res.ok) throw new Error(`${res.status} ${res.statusText}`);
+    return res.json();
+  };
+
+  // Категории и подкатегории — из фасета типов (без записей)
+  const loadCategories = async () => {
+    const data = await fetchCatalog({ limit: 0 });
+    categories = {};
+    Object.entries(data.facets["тип_светильника"] || {}).forEach(([type, count]) => {
+      const [prefix, ...rest] = type.split(" ");
+      const category = categoryByPrefix[prefix];
+      if (!category) return;
+      (categories[category] = categories[category] || []).push({
+        type, label: capitalize(rest.join(" ") || type), count
+      });
+    });
+  };
+
   // Рендер категорий
   const renderCategories = () => {
     categoryContainer.innerHTML = "";
 
-    Object.keys(fixturesData).forEach(categoryName => {
+    Object.keys(categoryIcons).filter(name => categories[name]).forEach(categoryName => {
       const card = document.createElement("div");
       card.className =
         "relative bg-[#23282b]/90 rounded-3xl p-8 w-72 shadow-xl hover:shadow-2xl transition transform hover:scale-105 cursor-pointer overflow-hidden backdrop-blur-sm text-center category-btn";
@@ -76,33 +113,41 @@ document.addEventListener("DOMContentLoaded", () => {
   const renderSubcategories = (categoryName) => {
     subcategoryContainer.innerHTML = "";
     fixtureContainer.innerHTML = "";
+    fixtureMore.innerHTML = "";
 
-    const subcategories = Object.keys(fixturesData[categoryName] || {});
-    subcategories.forEach(sub => {
+    (categories[categoryName] || []).forEach(sub => {
       const btn = document.createElement("button");
       btn.className =
         "bg-[#3a3a3a] hover:bg-[#4a4a4a] text-white px-5 py-2 rounded-xl transition subcategory-btn";
 
-      btn.textContent = sub;
+      btn.textContent = `${sub.label} (${sub.count})`;
       btn.addEventListener("click", () => {
       // снять подсветку со всех подкатегорий
       document.querySelectorAll(".subcategory-btn").forEach(b => b.classList.remove("active-btn"));
       // подсветить выбранную
       btn.classList.add("active-btn");
       // показать светильники
-      renderFixtures(categoryName, sub);
+      fixtureContainer.innerHTML = "";
+      renderFixtures(sub.type);
     });
 
       subcategoryContainer.appendChild(btn);
     });
   };
 
-  // Рендер карточек светильников
-  const renderFixtures = (categoryName, subcategoryName) => {
-    fixtureContainer.innerHTML = "";
+  // Рендер карточек светильников: страница типа, «Показать ещё» — по курсору
+  const renderFixtures = async (type, cursor = null) => {
+    fixtureMore.innerHTML = "";
 
-    const fixtures = fixturesData[categoryName]?.[subcategoryName] || [];
-    fixtures.forEach(item => {
+    let data;
+    try {
+      data = await fetchCatalog({ type, limit: PAGE_SIZE, cursor, facets: false });
+    } catch (err) {
+      console.error("❌ Ошибка при запросе к /catalog:", err);
+      return;
+    }
+
+    data.items.forEach(item => {
       const card = document.createElement("div");
       card.className =
         "bg-[#2b2b2b] rounded-2xl p-6 shadow-md hover:shadow-lg transition";
@@ -120,10 +165,21 @@ document.addEventListener("DOMContentLoaded", () => {
       `;
       fixtureContainer.appendChild(card);
     });
+
+    if (data.next_cursor) {
+      const more = document.createElement("button");
+      more.className =
+        "bg-[#3a3a3a] hover:bg-[#4a4a4a] text-white px-5 py-2 rounded-xl transition";
+      more.textContent = `Показать ещё (${data.total - fixtureContainer.children.length})`;
+      more.addEventListener("click", () => renderFixtures(type, data.next_cursor));
+      fixtureMore.appendChild(more);
+    }
   };
 
   // Инициализация
-  renderCategories();
+  loadCategories()
+    .then(renderCategories)
+    .catch(err => console.error("❌ Каталог не загружен:", err));
 });
 
 /* ======================= AI-Advisor ======================= */
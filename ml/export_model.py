@@ -0,0 +1,82 @@
+# ==============================================================
+# ЭКСПОРТ МОДЕЛИ В РОДНОЙ ФОРМАТ
+# Лучшая модель сохраняется не pickle, а в формате своего семейства:
+# CatBoost → .cbm, LightGBM → текстовая модель, линейные → .npz,
+# остальные (RandomForest, KNN, MLP, XGBoost) → ONNX (skl2onnx/onnxmltools).
+# Рядом пишется манифест best_model.json, по которому приложение
+# выбирает бэкенд (app/predictors.py). Если конвертер ONNX не установлен —
+# остаётся joblib-артефакт.
+#
+# Конвертация уже сохранённой модели:
+#   python ml/export_model.py ml/best_model.pkl
+# ==============================================================
+import json
+import os
+import sys
+
+import joblib
+import numpy as np
+
+
+def _export_onnx(model, path: str, n_features: int) -> None:
+    if type(model).__module__.startswith("xgboost"):
+        from onnxmltools import convert_xgboost
+        from onnxmltools.convert.common.data_types import FloatTensorType
+        onx = convert_xgboost(model, initial_types=[("X", FloatTensorType([None, n_features]))])
+    else:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+        onx = convert_sklearn(model, initial_types=[("X", FloatTensorType([None, n_features]))])
+    with open(path, "wb") as f:
+        f.write(onx.SerializeToString())
+
+
+def export_model(model, stem: str, model_name: str = None, n_features: int = None) -> str:
+    """
+    Сохраняет модель в родном формате и пишет манифест <stem>.json.
+
+    Args:
+        model: обученная модель (sklearn-совместимая)
+        stem (str): путь без расширения, например "ml/best_model"
+        model_name (str): имя модели для манифеста
+        n_features (int): число признаков (по умолчанию model.n_features_in_)
+    Returns:
+        str: путь к манифесту
+    """
+    module = type(model).__module__
+    n_features = n_features or getattr(model, "n_features_in_", None) or len(getattr(model, "feature_names_", []))
+
+    if module.startswith("catboost"):
+        backend, path = "catboost", stem + ".cbm"
+        model.save_model(path, format="cbm")
+    elif module.startswith("lightgbm"):
+        backend, path = "lightgbm", stem + ".txt"
+        model.booster_.save_model(path)
+    elif module.startswith("sklearn.linear_model"):
+        backend, path = "linear", stem + ".npz"
+        np.savez(path, coef=np.ravel(model.coef_), intercept=np.ravel(model.intercept_)[0])
+    else:
+        backend, path = "onnx", stem + ".onnx"
+        try:
+            _export_onnx(model, path, n_features)
+        except ImportError as e:
+            print(f"⚠️ ONNX-конвертер недоступен ({e}), модель остаётся в joblib.")
+            backend, path = "pickle", stem + ".pkl"
+            joblib.dump(model, path)
+
+    manifest = {
+        "backend": backend,
+        "file": os.path.basename(path),
+        "model_name": model_name or type(model).__name__,
+        "n_features": int(n_features),
+    }
+    manifest_path = stem + ".json"
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"Модель экспортирована: {path} (бэкенд {backend}), манифест: {manifest_path}")
+    return manifest_path
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "ml/best_model.pkl"
+    export_model(joblib.load(source), os.path.splitext(source)[0])
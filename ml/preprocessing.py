@@ -1,6 +1,20 @@
 # ==============================================================
 # ЭТАП 2. ПРЕДОБРАБОТКА ДАННЫХ
+# --------------------------------------------------------------
+# Два режима:
+#   - в памяти (по умолчанию): весь CSV в pandas, матрицы в
+#     data/train_test_ready.npz (сжатый);
+#   - --streaming: CSV читается частями в два прохода, матрицы пишутся
+#     несжатыми .npy в data/train_test_ready/ (memmap, опционально
+#     float32) — объём выборки не ограничен памятью.
+#
+# Запуск:
+#   python ml/preprocessing.py
+#   python ml/preprocessing.py --streaming --float32 --chunk-rows 200000
 # ==============================================================
+import os
+import json
+import argparse
 import pandas as pd
 import numpy as np
 import joblib
@@ -22,12 +36,15 @@ def load_data(path: str = "data/training_dataset.csv") -> pd.DataFrame:
 # -------------------------
 # 2) Очистка и базовая проверка
 # -------------------------
+CLIP_COLS = ["цена_₽", "мощность_вт", "световой_поток_лм"]
+
+
 def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """Удаляет пропуски, проверяет дубликаты, выбросы"""
     df = df.drop_duplicates().reset_index(drop=True)
     df = df.fillna(0)
     # Выбросы по цене и мощности (срез 1%)
-    for col in ["цена_₽", "мощность_вт", "световой_поток_лм"]:
+    for col in CLIP_COLS:
         low, high = df[col].quantile([0.01, 0.99])
         df[col] = np.clip(df[col], low, high)
     return df
@@ -46,17 +63,21 @@ def split_features_target(df: pd.DataFrame):
 # -------------------------
 # 4) Формирование категориальных и числовых признаков
 # -------------------------
+CATEGORICAL_COLS = [
+    "тип_помещения", "тип_светильника", "бренд"
+]
+NUMERIC_COLS = [
+    "площадь_м2", "высота_м", "целевой_люкс", "бюджет_₽",
+    "cri_min", "cct_предпочтение_k", "ip_min", "угол_раскрытия_град",
+    "cri", "cct_k", "ip", "срок_службы_ч", "мощность_вт",
+    "световой_поток_лм", "эффективность_лм_вт", "цена_₽", "количество_светильников"
+]
+
+
 def create_preprocessor(X: pd.DataFrame):
     """Создаёт пайплайн предобработки"""
-    categorical_cols = [
-        "тип_помещения", "тип_светильника", "бренд"
-    ]
-    numeric_cols = [
-        "площадь_м2", "высота_м", "целевой_люкс", "бюджет_₽",
-        "cri_min", "cct_предпочтение_k", "ip_min", "угол_раскрытия_град",
-        "cri", "cct_k", "ip", "срок_службы_ч", "мощность_вт",
-        "световой_поток_лм", "эффективность_лм_вт", "цена_₽", "количество_светильников"
-    ]
+    categorical_cols = CATEGORICAL_COLS
+    numeric_cols = NUMERIC_COLS
 
     categorical_transformer = OneHotEncoder(handle_unknown="ignore", sparse_output=False)
     numeric_transformer = StandardScaler()
@@ -83,10 +104,10 @@ def split_train_test(X, y, test_size: float = 0.2, random_state: int = 42):
 
 
 # -------------------------
-# 6) Основная функция
+# 6) Основная функция (в памяти)
 # -------------------------
-def run_preprocessing():
-    df = load_data()
+def run_preprocessing(path: str = "data/training_dataset.csv"):
+    df = load_data(path)
     df = clean_data(df)
     X, y = split_features_target(df)
 
@@ -112,5 +133,158 @@ def run_preprocessing():
     return X_train_prep, X_test_prep, y_train, y_test
 
 
+# -------------------------
+# 7) Потоковая предобработка (выборки больше памяти)
+# -------------------------
+SPLITS = ("X_train", "X_test", "y_train", "y_test")
+TARGET = "оценка_пригодности"
+QUANTILE_SAMPLE = 1_000_000  # строк в выборке для квантилей отсечения выбросов
+
+
+def _read_chunks(path: str, chunk_rows: int):
+    """Части CSV после очистки (дубликаты — в пределах части)."""
+    for chunk in pd.read_csv(path, chunksize=chunk_rows):
+        yield chunk.drop_duplicates().reset_index(drop=True).fillna(0)
+
+
+def _scan(path: str, chunk_rows: int, test_size: float, random_state: int) -> tuple:
+    """
+    Первый проход: словари категорий, квантили отсечения выбросов
+    (по равномерной выборке до QUANTILE_SAMPLE строк) и размеры train/test.
+    """
+    vocab = {col: set() for col in CATEGORICAL_COLS}
+    split_rng = np.random.default_rng([random_state, 0])
+    key_rng = np.random.default_rng([random_state, 1])
+    keys, sample = np.empty(0), np.empty((0, len(CLIP_COLS)))
+    n_test = n_rows = 0
+
+    for chunk in _read_chunks(path, chunk_rows):
+        for col in CATEGORICAL_COLS:
+            vocab[col].update(chunk[col].unique())
+        n_test += int((split_rng.random(len(chunk)) < test_size).sum())
+        n_rows += len(chunk)
+
+        # Выборка без возвращения: строки с наименьшими случайными ключами
+        keys = np.concatenate([keys, key_rng.random(len(chunk))])
+        sample = np.concatenate([sample, chunk[CLIP_COLS].to_numpy(dtype=np.float64)])
+        if keys.size > QUANTILE_SAMPLE:
+            keep = np.argpartition(keys, QUANTILE_SAMPLE)[:QUANTILE_SAMPLE]
+            keys, sample = keys[keep], sample[keep]
+
+    low, high = np.quantile(sample, [0.01, 0.99], axis=0)
+    return {col: sorted(values) for col, values in vocab.items()}, low, high, n_rows - n_test, n_test
+
+
+def run_preprocessing_streaming(path: str = "data/training_dataset.csv", out_dir: str = "data/train_test_ready",
+                                chunk_rows: int = 200_000, dtype=np.float64, test_size: float = 0.2,
+                                random_state: int = 42):
+    """
+    Предобработка частями: память — на одну часть CSV, а не на всю выборку.
+
+    1-й проход — словари категорий, квантили выбросов, размеры выборок.
+    2-й проход — отсечение выбросов, one-hot, StandardScaler.partial_fit
+    по train, запись строк в .npy через memmap (числовые — пока без шкалы).
+    Затем числовые колонки нормируются на месте. Строка попадает в test
+    с вероятностью test_size (генератор с random_state). Препроцессор
+    (ColumnTransformer) сохраняется как в режиме в памяти.
+
+    Returns:
+        tuple: X_train, X_test, y_train, y_test (memmap, только чтение)
+    """
+    vocab, low, high, n_train, n_test = _scan(path, chunk_rows, test_size, random_state)
+    print(f"Первый проход: {n_train + n_test} строк, train {n_train}, test {n_test}")
+
+    categories = [vocab[col] for col in CATEGORICAL_COLS]
+    encoder = OneHotEncoder(categories=categories, handle_unknown="ignore", sparse_output=False)
+    encoder.fit(pd.DataFrame({col: cats[:1] for col, cats in zip(CATEGORICAL_COLS, categories)}))
+    scaler = StandardScaler()
+    n_cat = sum(len(cats) for cats in categories)
+    n_features = n_cat + len(NUMERIC_COLS)
+
+    os.makedirs(out_dir, exist_ok=True)
+    sizes = {"train": n_train, "test": n_test}
+    X = {part: np.lib.format.open_memmap(os.path.join(out_dir, f"X_{part}.npy"), mode="w+", dtype=dtype,
+                                         shape=(n, n_features)) for part, n in sizes.items()}
+    y = {part: np.lib.format.open_memmap(os.path.join(out_dir, f"y_{part}.npy"), mode="w+", dtype=np.float64,
+                                         shape=(n,)) for part, n in sizes.items()}
+    pos = {"train": 0, "test": 0}
+    split_rng = np.random.default_rng([random_state, 0])
+    structure = None
+
+    for chunk in _read_chunks(path, chunk_rows):
+        for col, lo, hi in zip(CLIP_COLS, low, high):
+            chunk[col] = np.clip(chunk[col], lo, hi)
+        is_test = split_rng.random(len(chunk)) < test_size
+        if structure is None:
+            structure = split_features_target(chunk.head(1))[0]
+        if (~is_test).any():
+            scaler.partial_fit(chunk.loc[~is_test, NUMERIC_COLS])
+
+        for part, rows in (("train", chunk[~is_test]), ("test", chunk[is_test])):
+            a, b = pos[part], pos[part] + len(rows)
+            X[part][a:b, :n_cat] = encoder.transform(rows[CATEGORICAL_COLS])
+            X[part][a:b, n_cat:] = rows[NUMERIC_COLS].to_numpy(dtype=np.float64)
+            y[part][a:b] = rows[TARGET].to_numpy(dtype=np.float64)
+            pos[part] = b
+
+    # Нормировка числовых колонок на месте (шкала известна только после прохода)
+    for part in X:
+        for a in range(0, sizes[part], chunk_rows):
+            block = X[part][a:a + chunk_rows, n_cat:].astype(np.float64)
+            X[part][a:a + chunk_rows, n_cat:] = (block - scaler.mean_) / scaler.scale_
+        X[part].flush()
+        y[part].flush()
+    del X, y
+
+    # Препроцессор того же вида, что в режиме в памяти: структура колонок —
+    # по одной строке, категории — из словарей, шкала — из partial_fit
+    preprocessor = create_preprocessor(structure)
+    preprocessor.set_params(cat__categories=categories)
+    preprocessor.fit(structure)
+    num = [name for name, _, _ in preprocessor.transformers_].index("num")
+    preprocessor.transformers_[num] = ("num", scaler, NUMERIC_COLS)
+    joblib.dump(preprocessor, "ml/preprocessor.pkl")
+    print("Препроцессор сохранён в ml/preprocessor.pkl")
+
+    with open(os.path.join(out_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "source": path,
+            "rows": sizes,
+            "n_features": n_features,
+            "dtype": np.dtype(dtype).name,
+            "chunk_rows": chunk_rows,
+            "test_size": test_size,
+            "random_state": random_state,
+            "clip": {col: [float(lo), float(hi)] for col, lo, hi in zip(CLIP_COLS, low, high)},
+            "feature_names": preprocessor.get_feature_names_out().tolist(),
+        }, f, ensure_ascii=False, indent=2)
+    print(f"Предобработка завершена. Данные сохранены в {out_dir}/ (.npy).")
+
+    return load_prepared(out_dir)
+
+
+def load_prepared(path: str = "data/train_test_ready.npz") -> tuple:
+    """
+    X_train, X_test, y_train, y_test. Каталог .npy (потоковый режим)
+    открывается через memmap без чтения в память, .npz — распаковывается.
+    """
+    if os.path.isdir(path):
+        return tuple(np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in SPLITS)
+    data = np.load(path)
+    return tuple(data[name] for name in SPLITS)
+
+
 if __name__ == "__main__":
-    run_preprocessing()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Предобработка обучающей выборки")
+    parser.add_argument("--input", default="data/training_dataset.csv")
+    parser.add_argument("--streaming", action="store_true", help="чтение частями, вывод — memmap .npy")
+    parser.add_argument("--out", default="data/train_test_ready", help="каталог .npy для --streaming")
+    parser.add_argument("--chunk-rows", type=int, default=200_000)
+    parser.add_argument("--float32", action="store_true", help="матрицы признаков в float32")
+    args = parser.parse_args()
+
+    if args.streaming:
+        run_preprocessing_streaming(args.input, args.out, chunk_rows=args.chunk_rows,
+                                    dtype=np.float32 if args.float32 else np.float64)
+    else:
+        run_preprocessing(args.input)
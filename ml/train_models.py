@@ -1,80 +1,454 @@
 # ==============================================================
 # ЭТАП 3. ОБУЧЕНИЕ И СРАВНЕНИЕ МОДЕЛЕЙ (MLflow)
+# --------------------------------------------------------------
+# Кандидаты обучаются параллельно в пуле процессов; каждому процессу —
+# своя доля ядер (n_jobs / thread_count и лимит BLAS/OpenMP), чтобы
+# бустинги не конкурировали за ядра. Обученные модели и метрики
+# кэшируются по хэшу данных, параметров и версии библиотеки: повторный
+# запуск обучает только изменившиеся модели.
+#
+# После обучения для каждого кандидата замеряется стоимость в сервисе — на
+# экспортированном артефакте через app.predictors, как при загрузке
+# приложением: задержка predict на пакет размером с каталог (p50/p99),
+# пропускная способность, размер файла модели и время загрузки. Замеры идут
+# в родительском процессе по одной модели, с одним и тем же числом потоков
+# (--profile-threads), когда пул уже остановлен: обучение соседей не делит
+# с ними ядра, и выбор воспроизводим. Выбирается самая точная модель
+# в пределах бюджета (--max-p99-ms, --max-size-mb). Результаты — в тот же
+# эксперимент MLflow, выбранная модель — ml/best_model.pkl + экспорт;
+# линейная модель первого этапа ранжирования — ml/shortlist_model (app.shortlist).
+# Запуск на подмножестве (--models) только сравнивает: рабочие артефакты
+# перезаписываются, лишь когда сравнивались все кандидаты, или с --export.
+#
+# Запуск:
+#   python ml/train_models.py
+#   python ml/train_models.py --models Ridge LightGBM CatBoost --workers 2
+#   python ml/train_models.py --models Ridge CatBoost --export
+#   python ml/train_models.py --data data/train_test_ready --no-cache
+#   python ml/train_models.py --max-p99-ms 20 --max-size-mb 50 --profile-threads 1
 # ==============================================================
-import numpy as np
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+import importlib
+import contextlib
+import multiprocessing
+from importlib import metadata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import joblib
-import mlflow
-import mlflow.sklearn
+import numpy as np
 from sklearn.metrics import root_mean_squared_error, mean_absolute_error, r2_score
+from threadpoolctl import threadpool_limits
+
+from export_model import export_model
+from preprocessing import load_prepared
 
-from sklearn.linear_model import LinearRegression, Ridge, Lasso
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.neighbors import KNeighborsRegressor
-from sklearn.neural_network import MLPRegressor
-from xgboost import XGBRegressor
-from lightgbm import LGBMRegressor
-from catboost import CatBoostRegressor
+# Корень репозитория — для app.predictors (замер тем же кодом загрузки, что в сервисе)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+# .npz (предобработка в памяти) или каталог .npy (--streaming) — открывается через memmap
+DATA_PATH = os.getenv("TRAIN_DATA_PATH", "data/train_test_ready.npz")
+FIXTURES_PATH = os.getenv("FIXTURES_PATH", "data/fixtures.csv")
+CACHE_DIR = "ml/cache"
+MLFLOW_URI = "file:./ml/mlruns"
+MLFLOW_EXPERIMENT = "lighting_recommender"
 
 # ==============================================================
-# 1) Загрузка данных
+# 1) Набор моделей
 # ==============================================================
-data = np.load("data/train_test_ready.npz")
-X_train, X_test = data["X_train"], data["X_test"]
-y_train, y_test = data["y_train"], data["y_test"]
+# имя -> (модуль, класс, параметры, параметр числа потоков, относительная стоимость обучения)
+MODELS = {
+    "LinearRegression": ("sklearn.linear_model", "LinearRegression", {}, None, 1),
+    "Ridge": ("sklearn.linear_model", "Ridge", {"alpha": 1.0}, None, 1),
+    "Lasso": ("sklearn.linear_model", "Lasso", {"alpha": 0.001}, None, 1),
+    "RandomForest": ("sklearn.ensemble", "RandomForestRegressor",
+                     {"n_estimators": 200, "random_state": 42}, "n_jobs", 50),
+    "KNN": ("sklearn.neighbors", "KNeighborsRegressor", {"n_neighbors": 5}, "n_jobs", 5),
+    "MLPRegressor": ("sklearn.neural_network", "MLPRegressor",
+                     {"hidden_layer_sizes": (128, 64), "max_iter": 300, "random_state": 42}, None, 30),
+    "XGBoost": ("xgboost", "XGBRegressor",
+                {"n_estimators": 500, "learning_rate": 0.05, "max_depth": 6, "random_state": 42}, "n_jobs", 20),
+    "LightGBM": ("lightgbm", "LGBMRegressor",
+                 {"n_estimators": 500, "learning_rate": 0.05, "num_leaves": 31, "random_state": 42}, "n_jobs", 10),
+    "CatBoost": ("catboost", "CatBoostRegressor",
+                 {"verbose": 0, "iterations": 500, "learning_rate": 0.05, "depth": 8, "random_state": 42},
+                 "thread_count", 40),
+}
+
+# Модуль -> дистрибутив для версии в ключе кэша
+DISTRIBUTIONS = {"sklearn": "scikit-learn"}
+
+
+def build_model(name: str, threads: int = None):
+    """Экземпляр модели-кандидата; threads — ограничение собственных потоков модели."""
+    module, cls, params, thread_param, _ = MODELS[name]
+    params = dict(params)
+    if thread_param and threads:
+        params[thread_param] = threads
+    return getattr(importlib.import_module(module), cls)(**params)
+
 
 # ==============================================================
-# 2) Настройка MLflow
+# 2) Кэш обученных моделей
 # ==============================================================
-mlflow.set_tracking_uri("file:./ml/mlruns")
-mlflow.set_experiment("lighting_recommender")
+def data_fingerprint(path: str) -> str:
+    """Хэш содержимого файлов выборки (.npz или каталог .npy)."""
+    files = [path] if os.path.isfile(path) else sorted(
+        os.path.join(path, f) for f in os.listdir(path) if f.endswith(".npy")
+    )
+    digest = hashlib.blake2b(digest_size=16)
+    for file in files:
+        with open(file, "rb") as f:
+            digest.update(hashlib.file_digest(f, "blake2b").digest())
+    return digest.hexdigest()
+
+
+def cache_key(name: str, data_key: str) -> str:
+    """Ключ: данные, класс, параметры и версия библиотеки модели."""
+    module, cls, params, _, _ = MODELS[name]
+    package = module.split(".")[0]
+    try:
+        version = metadata.version(DISTRIBUTIONS.get(package, package))
+    except metadata.PackageNotFoundError:
+        version = None
+    payload = json.dumps([data_key, module, cls, params, version], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
+
+
+def cache_paths(cache_dir: str, name: str, key: str) -> tuple:
+    stem = os.path.join(cache_dir, f"{name}-{key}")
+    return stem + ".joblib", stem + ".json"
+
+
+def read_cached(cache_dir: str, name: str, key: str) -> dict:
+    model_path, meta_path = cache_paths(cache_dir, name, key)
+    if not (os.path.exists(model_path) and os.path.exists(meta_path)):
+        return None
+    with open(meta_path, encoding="utf-8") as f:
+        return dict(json.load(f), model_path=model_path, cached=True)
+
 
 # ==============================================================
-# 3) Набор моделей
+# 3) Обучение одного кандидата (в процессе пула) и замер стоимости
 # ==============================================================
-models = {
-    "LinearRegression": LinearRegression(),
-    "Ridge": Ridge(alpha=1.0),
-    "Lasso": Lasso(alpha=0.001),
-    "RandomForest": RandomForestRegressor(n_estimators=200, random_state=42),
-    "KNN": KNeighborsRegressor(n_neighbors=5),
-    "MLPRegressor": MLPRegressor(hidden_layer_sizes=(128, 64), max_iter=300, random_state=42),
-    "XGBoost": XGBRegressor(n_estimators=500, learning_rate=0.05, max_depth=6, random_state=42),
-    "LightGBM": LGBMRegressor(n_estimators=500, learning_rate=0.05, num_leaves=31, random_state=42),
-    "CatBoost": CatBoostRegressor(verbose=0, iterations=500, learning_rate=0.05, depth=8, random_state=42)
+_worker_data = {}
+
+
+def _load_data(path: str) -> tuple:
+    # Выборка читается один раз на процесс (каталог .npy — memmap без копии)
+    if path not in _worker_data:
+        _worker_data.clear()
+        _worker_data[path] = load_prepared(path)
+    return _worker_data[path]
+
+
+def profile_serving(model, name: str, X: np.ndarray, profile: dict) -> dict:
+    """
+    Стоимость модели в сервисе: экспорт (export_model) и загрузка через
+    app.predictors, задержка predict на пакет profile["catalog_rows"] строк
+    (один запрос — весь каталог), пропускная способность на большом пакете,
+    размер файла модели и время загрузки. Собственные потоки модели и
+    BLAS/OpenMP ограничены profile["threads"].
+    """
+    from app.predictors import load_predictor
+
+    thread_param = MODELS[name][3]
+    if thread_param:
+        model.set_params(**{thread_param: profile["threads"]})
+    n_features = X.shape[1]
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            manifest = export_model(model, os.path.join(tmp, "model"), model_name=name, n_features=n_features)
+        size = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp) if not f.endswith(".json"))
+
+        load_times = []
+        for _ in range(3):
+            t0 = time.perf_counter()
+            predictor = load_predictor(manifest)
+            load_times.append(time.perf_counter() - t0)
+
+        batch = np.ascontiguousarray(np.resize(X, (profile["catalog_rows"], n_features)), dtype=predictor.dtype)
+        predictor.predict(batch)  # прогрев
+        times = []
+        for _ in range(profile["repeats"]):
+            t0 = time.perf_counter()
+            predictor.predict(batch)
+            times.append(time.perf_counter() - t0)
+
+        bulk = np.ascontiguousarray(np.resize(X, (profile["throughput_rows"], n_features)), dtype=predictor.dtype)
+        t0 = time.perf_counter()
+        predictor.predict(bulk)
+        bulk_seconds = time.perf_counter() - t0
+
+    times_ms = np.array(times) * 1000
+    return {
+        "backend": predictor.backend,
+        "catalog_rows": profile["catalog_rows"],
+        "threads": profile["threads"],
+        "predict_p50_ms": round(float(np.percentile(times_ms, 50)), 3),
+        "predict_p99_ms": round(float(np.percentile(times_ms, 99)), 3),
+        "throughput_rows_s": round(profile["throughput_rows"] / bulk_seconds),
+        "size_mb": round(size / 2**20, 3),
+        "load_ms": round(float(np.median(load_times)) * 1000, 2),
     }
 
-# ==============================================================
-# 4) Цикл обучения и логирования
-# ==============================================================
-results = []
 
-for name, model in models.items():
-    with mlflow.start_run(run_name=name):
+def fit_candidate(name: str, data_path: str, threads: int, cache_dir: str, key: str) -> dict:
+    """Обучает модель, считает метрики на test и сохраняет в кэш (стоимость в сервисе — позже, profile_all)."""
+    X_train, X_test, y_train, y_test = _load_data(data_path)
+    model = build_model(name, threads)
+
+    # Лимит потоков BLAS/OpenMP — для моделей без собственного параметра
+    with threadpool_limits(limits=threads):
+        t0 = time.perf_counter()
         model.fit(X_train, y_train)
+        fit_seconds = time.perf_counter() - t0
         y_pred = model.predict(X_test)
 
-        rmse = root_mean_squared_error(y_test, y_pred)
-        mae = mean_absolute_error(y_test, y_pred)
-        r2 = r2_score(y_test, y_pred)
+    result = {
+        "name": name,
+        "params": MODELS[name][2],
+        "rmse": float(root_mean_squared_error(y_test, y_pred)),
+        "mae": float(mean_absolute_error(y_test, y_pred)),
+        "r2": float(r2_score(y_test, y_pred)),
+        "fit_seconds": round(fit_seconds, 3),
+        "threads": threads,
+        "n_features": int(X_train.shape[1]),
+    }
+    if not cache_dir:
+        return dict(result, model=model, model_path=None, cached=False)
 
-        mlflow.log_param("model_name", name)
-        mlflow.log_metric("rmse", rmse)
-        mlflow.log_metric("mae", mae)
-        mlflow.log_metric("r2", r2)
+    model_path, meta_path = cache_paths(cache_dir, name, key)
+    os.makedirs(cache_dir, exist_ok=True)
+    joblib.dump(model, model_path)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+    return dict(result, model=None, model_path=model_path, cached=False)
 
-        mlflow.sklearn.log_model(model, artifact_path="model")
 
-        results.append((name, rmse, mae, r2))
-        print(f"{name}: RMSE={rmse:.3f}, MAE={mae:.3f}, R2={r2:.3f}")
+# ==============================================================
+# 4) Сравнение: кэш, пул процессов, MLflow
+# ==============================================================
+def train_all(names: list, data_path: str, workers: int, cache_dir: str = CACHE_DIR) -> dict:
+    """
+    Обучает выбранных кандидатов в пуле процессов (кэшированные пропускаются).
+    Returns:
+        dict: имя -> метрики, путь к модели в кэше (или сама модель без кэша)
+    """
+    data_key = data_fingerprint(data_path)
+    results, pending = {}, []
+    for name in names:
+        key = cache_key(name, data_key)
+        cached = read_cached(cache_dir, name, key) if cache_dir else None
+        if not cached:
+            pending.append((name, key))
+            continue
+        results[name] = cached
+        print(f"{name}: из кэша — RMSE={cached['rmse']:.3f}, MAE={cached['mae']:.3f}, R2={cached['r2']:.3f}")
+    if not pending:
+        return results
+
+    # Дорогие модели — первыми, чтобы короткие заполняли оставшиеся ядра
+    pending.sort(key=lambda item: MODELS[item[0]][4], reverse=True)
+    workers = max(1, min(workers, len(pending)))
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    print(f"Обучение {len(pending)} моделей: процессов {workers}, потоков на модель {threads}")
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(fit_candidate, name, data_path, threads, cache_dir, key)
+            for name, key in pending
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result["name"]] = result
+            print(f"{result['name']}: RMSE={result['rmse']:.3f}, MAE={result['mae']:.3f}, "
+                  f"R2={result['r2']:.3f} ({result['fit_seconds']:.1f} с)")
+    return results
+
+
+def profile_all(results: dict, data_path: str, profile: dict, reprofile: bool = False) -> dict:
+    """
+    Стоимость в сервисе для всех кандидатов — в этом процессе, по одной модели
+    и с profile["threads"] потоками, после обучения. Замер из кэша переиспользуется,
+    если совпадают размер каталога и число потоков (и не задан reprofile).
+    """
+    X_test = None
+    for name in sorted(results):
+        result = results[name]
+        serving = result.get("serving") or {}
+        if not reprofile and all(serving.get(k) == profile[k] for k in ("catalog_rows", "threads")):
+            continue
+        if X_test is None:
+            X_test = load_prepared(data_path)[1]
+        with threadpool_limits(limits=profile["threads"]):
+            result["serving"] = profile_serving(load_result_model(result), name, X_test, profile)
+        print(f"{name}: p99 {result['serving']['predict_p99_ms']:.2f} мс на {profile['catalog_rows']} строк")
+
+        if result.get("model_path"):
+            meta_path = os.path.splitext(result["model_path"])[0] + ".json"
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            meta["serving"] = result["serving"]
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2, default=str)
+    return results
+
+
+def load_result_model(result: dict):
+    return result["model"] if result.get("model") is not None else joblib.load(result["model_path"])
+
+
+# ==============================================================
+# 5) Выбор модели: точность в пределах бюджета задержки и памяти
+# ==============================================================
+def within_budget(result: dict, max_p99_ms: float = None, max_size_mb: float = None) -> bool:
+    serving = result["serving"]
+    return ((max_p99_ms is None or serving["predict_p99_ms"] <= max_p99_ms)
+            and (max_size_mb is None or serving["size_mb"] <= max_size_mb))
+
+
+def select_model(results: dict, max_p99_ms: float = None, max_size_mb: float = None) -> dict:
+    """
+    Самая точная (минимальный RMSE) модель среди укладывающихся в бюджет:
+    p99 задержки predict на каталог и размер модели. Если в бюджет не
+    уложился никто — самая точная из всех, с предупреждением.
+    """
+    fitting = [r for r in results.values() if within_budget(r, max_p99_ms, max_size_mb)]
+    if not fitting:
+        print(f"⚠️ Ни одна модель не укладывается в бюджет (p99 ≤ {max_p99_ms} мс, размер ≤ {max_size_mb} МБ) — "
+              f"выбрана самая точная.")
+        fitting = list(results.values())
+    return min(fitting, key=lambda r: r["rmse"])
+
+
+def report(results: dict, selected: str, max_p99_ms: float = None, max_size_mb: float = None) -> None:
+    print(f"\n{'модель':<16} | {'RMSE':>6} | {'бэкенд':<8} | {'p50, мс':>8} | {'p99, мс':>8} | "
+          f"{'строк/с':>10} | {'размер, МБ':>10} | {'загрузка, мс':>12} | бюджет")
+    for r in sorted(results.values(), key=lambda r: r["rmse"]):
+        s = r["serving"]
+        mark = "✓" if within_budget(r, max_p99_ms, max_size_mb) else "✗"
+        print(f"{r['name']:<16} | {r['rmse']:>6.3f} | {s['backend']:<8} | {s['predict_p50_ms']:>8.2f} | "
+              f"{s['predict_p99_ms']:>8.2f} | {s['throughput_rows_s']:>10,} | {s['size_mb']:>10.2f} | "
+              f"{s['load_ms']:>12.1f} | {mark}{'  ← выбрана' if r['name'] == selected else ''}")
+
+
+def log_to_mlflow(results: dict, selected: str, max_p99_ms: float = None, max_size_mb: float = None) -> None:
+    """Запуск MLflow на каждого кандидата; модель логируется только у обученных заново."""
+    import mlflow
+    import mlflow.sklearn
+
+    mlflow.set_tracking_uri(MLFLOW_URI)
+    mlflow.set_experiment(MLFLOW_EXPERIMENT)
+    for name, result in results.items():
+        with mlflow.start_run(run_name=name):
+            mlflow.log_param("model_name", name)
+            mlflow.log_params({k: str(v) for k, v in result["params"].items()})
+            mlflow.log_param("serving_backend", result["serving"]["backend"])
+            mlflow.log_param("catalog_rows", result["serving"]["catalog_rows"])
+            mlflow.log_metric("rmse", result["rmse"])
+            mlflow.log_metric("mae", result["mae"])
+            mlflow.log_metric("r2", result["r2"])
+            mlflow.log_metric("fit_seconds", result["fit_seconds"])
+            for metric in ("predict_p50_ms", "predict_p99_ms", "throughput_rows_s", "size_mb", "load_ms"):
+                mlflow.log_metric(metric, result["serving"][metric])
+            mlflow.set_tag("cached", str(result["cached"]).lower())
+            mlflow.set_tag("within_budget", str(within_budget(result, max_p99_ms, max_size_mb)).lower())
+            mlflow.set_tag("selected", str(name == selected).lower())
+            if not result["cached"]:
+                mlflow.sklearn.log_model(load_result_model(result), artifact_path="model")
+
+
+def save_best(best: dict) -> tuple:
+    """Выбранная модель — ml/best_model.pkl и экспорт в родной формат."""
+    print("\nЛучшая модель:")
+    print(f"{best['name']} — RMSE={best['rmse']:.3f}, R2={best['r2']:.3f}, "
+          f"p99 {best['serving']['predict_p99_ms']:.2f} мс на {best['serving']['catalog_rows']} строк")
+
+    # Сохранение финального артефакта
+    best_model = load_result_model(best)
+    joblib.dump(best_model, "ml/best_model.pkl")
+    print("Лучшая модель сохранена: ml/best_model.pkl")
+
+    # Родной формат модели + манифест для приложения (MODEL_PATH=ml/best_model.json)
+    export_model(best_model, "ml/best_model", model_name=best["name"], n_features=best["n_features"])
+    return best["name"], best_model
+
+
+def save_shortlist(results: dict, name: str) -> None:
+    """Линейная модель первого этапа ранжирования — ml/shortlist_model (app.shortlist, SHORTLIST_K)."""
+    if name not in results:
+        print(f"⚠️ {name} не обучалась в этом запуске — модель первого этапа не обновлена.")
+        return
+    model = load_result_model(results[name])
+    if not hasattr(model, "coef_"):
+        print(f"⚠️ {name} — не линейная модель, первым этапом быть не может.")
+        return
+    export_model(model, "ml/shortlist_model", model_name=name, n_features=results[name]["n_features"])
+
+
+def catalog_rows(path: str = FIXTURES_PATH) -> int:
+    """Строк в каталоге светильников — размер пакета одного запроса к модели."""
+    with open(path, encoding="utf-8") as f:
+        return max(1, sum(1 for _ in f) - 1)
+
 
 # ==============================================================
-# 5) Определение лучшей модели
+# 6) Запуск
 # ==============================================================
-best = sorted(results, key=lambda x: x[1])[0]  # по минимальному RMSE
-print("\nЛучшая модель:")
-print(f"{best[0]} — RMSE={best[1]:.3f}, R2={best[3]:.3f}")
-
-# Сохранение финального артефакта
-best_model = models[best[0]]
-joblib.dump(best_model, f"ml/best_model.pkl")
-print(f"Лучшая модель сохранена: ml/best_model.pkl")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Обучение и сравнение моделей")
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=list(MODELS),
+                        help="подмножество кандидатов (по умолчанию — все)")
+    parser.add_argument("--data", default=DATA_PATH, help=".npz или каталог .npy (preprocessing.py --streaming)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="процессов обучения")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--no-cache", action="store_true", help="обучить заново и не сохранять в кэш")
+    parser.add_argument("--no-mlflow", action="store_true", help="не логировать в MLflow")
+    parser.add_argument("--max-p99-ms", type=float, default=None, help="бюджет p99 predict на каталог, мс")
+    parser.add_argument("--max-size-mb", type=float, default=None, help="бюджет размера файла модели, МБ")
+    parser.add_argument("--catalog-rows", type=int, default=None,
+                        help="строк в пакете одного запроса (по умолчанию — размер FIXTURES_PATH)")
+    parser.add_argument("--latency-repeats", type=int, default=50)
+    parser.add_argument("--throughput-rows", type=int, default=100_000)
+    parser.add_argument("--profile-threads", type=int, default=1,
+                        help="потоков модели и BLAS/OpenMP при замере стоимости (одно значение для всех)")
+    parser.add_argument("--reprofile", action="store_true", help="заново замерить стоимость моделей из кэша")
+    parser.add_argument("--shortlist-model", default="Ridge",
+                        help="линейная модель первого этапа ранжирования (ml/shortlist_model)")
+    parser.add_argument("--export", action="store_true",
+                        help="сохранить выбранную модель и первый этап, даже если сравнивались не все кандидаты")
+    args = parser.parse_args()
+
+    profile = {
+        "catalog_rows": args.catalog_rows or catalog_rows(),
+        "repeats": args.latency_repeats,
+        "throughput_rows": args.throughput_rows,
+        "threads": args.profile_threads,
+    }
+    t0 = time.perf_counter()
+    results = train_all(args.models, args.data, args.workers, None if args.no_cache else args.cache_dir)
+    print(f"\nОбучение заняло {time.perf_counter() - t0:.1f} с")
+    t0 = time.perf_counter()
+    profile_all(results, args.data, profile, reprofile=args.reprofile)
+    print(f"Замер стоимости в сервисе занял {time.perf_counter() - t0:.1f} с")
+
+    best = select_model(results, args.max_p99_ms, args.max_size_mb)
+    report(results, best["name"], args.max_p99_ms, args.max_size_mb)
+    if not args.no_mlflow:
+        log_to_mlflow(results, best["name"], args.max_p99_ms, args.max_size_mb)
+    if args.export or set(args.models) == set(MODELS):
+        save_best(best)
+        save_shortlist(results, args.shortlist_model)
+    else:
+        print("\n⚠️ Сравнивались не все кандидаты (--models): ml/best_model.* и ml/shortlist_model "
+              "не обновлены. Сохранить выбор этого запуска — флаг --export.")
@@ -0,0 +1 @@
+"""Тесты сервиса подбора освещения и генерации данных (python -m pytest)."""
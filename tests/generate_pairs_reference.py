@@ -0,0 +1,78 @@
+"""
+Прежняя реализация generate_pairs (вложенные iterrows, шум из глобального
+np.random) — эталон для tests/test_generate_pairs.py и для замера времени
+в benchmarks/generate_pairs.py.
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from ml.generate_data import (
+    FIXTURE_SPECIFICATIONS, MF, ROOM_TO_FIXTURES, UF, generate_products, generate_rooms,
+)
+
+
+def reference_pairs(df_rooms: pd.DataFrame, df_products: pd.DataFrame, noise_sd: float = 2.0) -> pd.DataFrame:
+    """Прежняя реализация (вложенные iterrows, шум из глобального np.random)."""
+    pairs = []
+    products_by_type = {t: df_products[df_products["тип_светильника"] == t] for t in FIXTURE_SPECIFICATIONS.keys()}
+
+    for _, room in df_rooms.iterrows():
+        allowed = ROOM_TO_FIXTURES.get(room.тип_помещения, [])
+        candidates = [products_by_type[t] for t in allowed if t in products_by_type]
+        if not candidates:
+            continue
+
+        candidates_df = pd.concat(candidates, ignore_index=True)
+
+        for _, prod in candidates_df.iterrows():
+            score = 100.0
+            score -= abs(room.cct_предпочтение_k - prod.cct_k) / 100.0
+            score -= max(0, room.cri_min - prod.cri) * 0.6
+            score -= max(0, room.ip_min - prod.ip) * 0.4
+            cost_ratio = (prod["цена_₽"] * max(1.0, room["площадь_м2"] / 12.0)) / max(1.0, room["бюджет_₽"])
+            if cost_ratio > 1.0:
+                score -= (cost_ratio - 1.0) * 25.0
+            if room["ugr_предел"] <= 19 and prod["угол_раскрытия_град"] < 40:
+                score -= 2.0
+            score = float(np.clip(score + np.random.normal(0, noise_sd), 0, 100))
+
+            req_flux = room.целевой_люкс * room.площадь_м2
+            single_flux = max(1.0, prod.световой_поток_лм)
+            count_units = int(np.clip(req_flux / (single_flux * UF * MF), 1, 500))
+
+            pairs.append({
+                "id_сценария": room["id_сценария"],
+                "id_продукта": prod["id_продукта"],
+                "тип_помещения": room["тип_помещения"],
+                "тип_светильника": prod["тип_светильника"],
+                "площадь_м2": room["площадь_м2"],
+                "высота_м": room["высота_м"],
+                "целевой_люкс": room["целевой_люкс"],
+                "бюджет_₽": room["бюджет_₽"],
+                "количество_светильников": count_units,
+                "бренд": prod["бренд"],
+                "cri_min": room["cri_min"],
+                "cct_предпочтение_k": room["cct_предпочтение_k"],
+                "ip_min": room["ip_min"],
+                "угол_раскрытия_град": prod["угол_раскрытия_град"],
+                "cri": prod["cri"],
+                "cct_k": prod["cct_k"],
+                "ip": prod["ip"],
+                "срок_службы_ч": prod["срок_службы_ч"],
+                "мощность_вт": prod["мощность_вт"],
+                "световой_поток_лм": prod["световой_поток_лм"],
+                "эффективность_лм_вт": prod["эффективность_лм_вт"],
+                "цена_₽": prod["цена_₽"],
+                "оценка_пригодности": round(score, 2)
+            })
+
+    return pd.DataFrame(pairs)
+
+
+def make_inputs(n_rooms: int, n_products: int, seed: int) -> tuple:
+    random.seed(seed)
+    np.random.seed(seed)
+    return generate_rooms(n_records=n_rooms), generate_products(n_records=n_products)
@@ -0,0 +1,91 @@
+"""
+Ответы /recommend и /recommend/batch против схем RecommendResponse и
+BatchRecommendResponse (app.schemas). Эндпоинты отдают готовый
+FastJSONResponse без валидации FastAPI, поэтому расхождение схемы с
+engine.records ловится здесь: на расчёте, на попадании в кэш и в пакете.
+Попадание /chat собирается из закэшированного фрагмента и своего запроса.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.cache import result_cache
+from app.main import app
+from app.schemas import BatchRecommendResponse, Recommendation, RecommendResponse
+from app.startup import startup
+
+ROOM = {
+    "тип_помещения": "офисное помещение",
+    "площадь_м2": 40.0,
+    "высота_м": 3.0,
+    "целевой_люкс": 400,
+    "cri_min": 80,
+    "cct_предпочтение_k": 4000,
+    "ip_min": 40,
+    "бюджет_₽": 100000,
+}
+RECORD_KEYS = {field.alias or name for name, field in Recommendation.model_fields.items()}
+
+
+@pytest.fixture(scope="module")
+def client():
+    startup.run()
+    assert startup.ready, startup.error
+    result_cache.clear()
+    return TestClient(app)
+
+
+def check_recommendations(recommendations: list) -> None:
+    for record in recommendations:
+        assert set(record) == RECORD_KEYS
+
+
+@pytest.mark.parametrize("params, found", [
+    ({}, True),
+    ({"top_n": 100}, True),
+    ({"top_n": 5, "offset": 3, "tie_break": "price", "prefilter": "soft"}, True),
+    # strict без подходящих светильников — пустая выдача тоже по схеме
+    ({"prefilter": "strict", "ip_min": 65, "cri_min": 95}, False),
+])
+def test_recommend_matches_schema(client, params, found):
+    room = dict(ROOM, **params)
+    miss = client.post("/recommend", json=room)
+    hit = client.post("/recommend", json=room)
+    assert miss.status_code == hit.status_code == 200
+
+    for response in (miss, hit):
+        body = RecommendResponse.model_validate(response.json())
+        assert set(response.json()) == set(RecommendResponse.model_fields)
+        check_recommendations(response.json()["recommendations"])
+        assert bool(body.recommendations) == found
+        assert len(body.recommendations) <= room.get("top_n", 3)
+    assert hit.content == miss.content
+
+
+def test_batch_matches_schema(client):
+    rooms = [ROOM, dict(ROOM, площадь_м2=10.0, top_n=10, prefilter="soft")]
+    response = client.post("/recommend/batch", json=rooms)
+    assert response.status_code == 200
+
+    body = BatchRecommendResponse.model_validate(response.json())
+    assert len(body.results) == len(rooms)
+    for result in response.json()["results"]:
+        assert result["recommendations"]
+        check_recommendations(result["recommendations"])
+
+
+def test_chat_hit_keeps_own_query(client):
+    # Одно помещение в разной формулировке: второй ответ — из кэша,
+    # но с собственными user_query и parsed_params
+    hits = result_cache.stats()["hits"]
+    first = client.post("/chat/", json={"message": "офис 40 м2, высота 3 м, бюджет 100000"})
+    second = client.post("/chat/", json={"message": "Офис площадью 40 м2 высота 3 м бюджет 100000 руб"})
+    assert first.status_code == second.status_code == 200
+
+    miss, hit = first.json(), second.json()
+    assert list(hit) == ["user_query", "parsed_params", "summary", "advice", "artifact_version"]
+    assert hit["user_query"].startswith("Офис площадью")
+    assert hit["parsed_params"] == miss["parsed_params"]
+    assert {k: hit[k] for k in ("summary", "advice", "artifact_version")} == \
+        {k: miss[k] for k in ("summary", "advice", "artifact_version")}
+    assert result_cache.stats()["hits"] == hits + 1
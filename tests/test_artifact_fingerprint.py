@@ -0,0 +1,42 @@
+"""
+Версия артефактов (app.model_utils.artifact_fingerprint): модель по манифесту
+учитывается вместе с файлом модели, на который указывает манифест.
+"""
+
+import json
+
+from app.model_utils import artifact_files, artifact_fingerprint
+
+
+def write_model(tmp_path, name: str, payload: bytes) -> str:
+    (tmp_path / name).write_bytes(payload)
+    manifest = tmp_path / "best_model.json"
+    manifest.write_text(json.dumps({"backend": "catboost", "file": name}), encoding="utf-8")
+    return str(manifest)
+
+
+def test_manifest_resolves_model_file(tmp_path):
+    manifest = write_model(tmp_path, "best_model.cbm", b"v1")
+    assert artifact_files(manifest) == [manifest, str(tmp_path / "best_model.cbm")]
+
+
+def test_reexported_model_changes_version(tmp_path):
+    manifest = write_model(tmp_path, "best_model.cbm", b"v1")
+    before = artifact_fingerprint(manifest)
+    with open(manifest, "rb") as f:
+        text = f.read()
+
+    # Манифест тот же байт в байт, меняется только файл модели
+    (tmp_path / "best_model.cbm").write_bytes(b"v2 longer")
+    with open(manifest, "rb") as f:
+        assert f.read() == text
+    assert artifact_fingerprint(manifest) != before
+
+
+def test_shortlist_model_changes_version(tmp_path):
+    manifest = write_model(tmp_path, "best_model.cbm", b"v1")
+    shortlist = tmp_path / "shortlist_model.npz"
+    shortlist.write_bytes(b"s1")
+    before = artifact_fingerprint(manifest, str(shortlist))
+    shortlist.write_bytes(b"s2 longer")
+    assert artifact_fingerprint(manifest, str(shortlist)) != before
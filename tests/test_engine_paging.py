@@ -0,0 +1,75 @@
+"""
+Листание страниц (RecommenderEngine.scored): оценки помещения берутся из
+LRU-кэша, пока запись совпадает с пересчётом, — в том числе за пределами
+первых min_candidates строк и при потоковом скоринге. Страницы из кэша
+совпадают со страницами движка без кэша.
+"""
+
+import pandas as pd
+import pytest
+
+from app import recommend as rec
+from app.engine import RecommenderEngine
+from app.registry import PROBE_ROOM
+from app.startup import startup
+from ml.generate_data import ROOM_TO_FIXTURES
+
+OFFSETS = (0, 18, 21, 24, 27, 60)
+
+
+@pytest.fixture(scope="module")
+def base():
+    startup.run()
+    assert startup.ready, startup.error
+    return rec.registry.current().engine
+
+
+def make_engine(base, **kwargs) -> RecommenderEngine:
+    params = dict(
+        room_to_fixtures=ROOM_TO_FIXTURES,
+        cct_tolerance_k=base.cct_tolerance_k,
+        budget_factor=base.budget_factor,
+        min_candidates=20,
+        chunk_rows=65536,
+    )
+    params.update(kwargs)
+    return RecommenderEngine(base.model, base.preprocessor, pd.read_csv(rec.FIXTURES_PATH), **params)
+
+
+def count_scoring(engine: RecommenderEngine) -> list:
+    calls = []
+    score = engine.score
+
+    def counted(data, rows=None):
+        calls.append(None if rows is None else rows.size)
+        return score(data, rows)
+
+    engine.score = counted
+    return calls
+
+
+def pages(engine: RecommenderEngine, prefilter: str) -> list:
+    return [
+        engine.recommend(PROBE_ROOM, 3, offset=offset, prefilter=prefilter)[0]
+        for offset in OFFSETS
+    ]
+
+
+@pytest.mark.parametrize("prefilter", ["off", "strict"])
+def test_paging_scores_once(base, prefilter):
+    engine = make_engine(base, score_cache_size=8)
+    calls = count_scoring(engine)
+    cached = pages(engine, prefilter)
+    assert len(calls) == 1
+    assert cached == pages(make_engine(base), prefilter)
+
+
+def test_streaming_rescored_only_for_deeper_pages(base):
+    # Часть меньше каталога: в кэше — только текущий top-need
+    engine = make_engine(base, score_cache_size=8, chunk_rows=64)
+    calls = count_scoring(engine)
+    cached = pages(engine, "off")
+    assert cached == pages(make_engine(base, chunk_rows=64), "off")
+    first = len(calls)
+    pages(engine, "off")  # need не больше последнего сохранённого — без пересчёта
+    assert len(calls) == first
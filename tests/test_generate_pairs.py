@@ -0,0 +1,54 @@
+"""
+Векторный generate_pairs (ml.generate_data) против прежней реализации на
+iterrows (tests/generate_pairs_reference.py) на сценариях и
+продуктах с фиксированным seed:
+    - без шума (noise_sd=0) — те же пары в том же порядке, колонки
+      совпадают, оценка — с точностью округления;
+    - с шумом — распределение оценки (KS-тест) и разность оценок пары
+      (среднее ≈ 0, σ ≈ 2·√2 у не обрезанных по [0, 100]).
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import ks_2samp
+
+from ml.generate_data import generate_pairs
+from tests.generate_pairs_reference import make_inputs, reference_pairs
+
+SEED = 42
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    return make_inputs(400, 240, SEED)
+
+
+def test_exact_without_noise(inputs):
+    df_rooms, df_products = inputs
+    old = reference_pairs(df_rooms, df_products, noise_sd=0.0)
+    new = generate_pairs(df_rooms, df_products, noise_sd=0.0)
+
+    assert list(new.columns) == list(old.columns)
+    assert len(new) == len(old) > 0
+    for col in old.columns:
+        if col == "оценка_пригодности":
+            diff = np.abs(old[col].to_numpy() - new[col].to_numpy()).max()
+            assert diff <= 0.01 + 1e-9, f"{col}: макс. расхождение {diff:.3g}"
+        else:
+            assert (old[col].to_numpy() == new[col].to_numpy()).all(), f"колонка {col} не совпадает"
+
+
+def test_noise_distribution(inputs):
+    df_rooms, df_products = inputs
+    np.random.seed(SEED)
+    old = reference_pairs(df_rooms, df_products)["оценка_пригодности"].to_numpy()
+    new = generate_pairs(df_rooms, df_products, seed=SEED)["оценка_пригодности"].to_numpy()
+
+    assert ks_2samp(old, new).pvalue > 0.01
+
+    inside = (old > 0) & (old < 100) & (new > 0) & (new < 100)
+    residual = (new - old)[inside]
+    expected_sd = 2.0 * np.sqrt(2)
+    stderr = expected_sd / np.sqrt(residual.size)
+    assert abs(residual.mean()) < 4 * stderr
+    assert abs(residual.std() / expected_sd - 1) < 0.1